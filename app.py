@@ -1,21 +1,28 @@
 import streamlit as st
 import pandas as pd
-import pdfplumber
-import re
 import os
-from datetime import datetime
-from io import BytesIO
+import re
+from functools import partial
 import plotly.express as px
+from cache_parse import CacheParse, impressao_regras
+from configuracao import (PASTA_CONFIG, ARQUIVO_REGRAS, ARQUIVO_ITENS_FOLHA, ARQUIVO_HISTORICO, PASTA_RETENCAO, PASTA_CACHE, PASTA_EXPORTACAO,
+                          ler_regras, regras_padrao, filtrar_regras)
+from classificador_folha import FORMATOS, carregar_itens_folha
+from conciliacao import TOLERANCIA_PADRAO, conciliar_fontes, tabelas_exportacao, tipos_folha
+from consolidacao import ConsolidacaoIncremental
+from dashboard import DIMENSOES, FUNCIONARIOS, eventos_por, montar_cubos, top_n
+from diagnostico import RegistroEtapas, encerrar_perfil, iniciar_perfil, relatorio_json
+from historico import Historico, competencia_sugerida
+from exportacao import FORMATOS_EXPORTACAO, excede_limite_excel, exportar, tabelas_relatorio
+from paralelo import PROCESSOS_PADRAO
+from retencao import ArmazemRetencao
+from tarefas import CANCELADO, CONCLUIDO, FALHOU, FilaTrabalhos
 
 # --- CONFIGURAÇÃO DA PÁGINA ---
 st.set_page_config(page_title="Processador de RH Pro", layout="wide")
 st.title("📂 Sistema de Consolidação de Documentos de RH (Local + Retenção)")
 
 # --- 0. SETUP DE DIRETÓRIOS E CONFIGURAÇÕES ---
-PASTA_CONFIG = "config"
-ARQUIVO_REGRAS = os.path.join(PASTA_CONFIG, "regras_processamento.csv")
-PASTA_RETENCAO = "retencao"
-
 def setup_inicial():
     """Cria a estrutura de pastas necessária para rodar localmente"""
     if not os.path.exists(PASTA_CONFIG):
@@ -25,321 +32,150 @@ def setup_inicial():
 
 def carregar_regras():
     """Carrega regras do CSV local ou usa padrão se não existir"""
-    if os.path.exists(ARQUIVO_REGRAS):
-        try:
-            return pd.read_csv(ARQUIVO_REGRAS)
-        except:
-            st.error("Erro ao ler arquivo de configuração. Usando padrão.")
-    
-    # Dados Iniciais (Padrão)
-    return pd.DataFrame([
-        # EXTRAS
-        {"Texto Identificador": "82 - Hora Extras 100%", "Nome Evento": "Hora Extras 100%", "Categoria": "Extras"},
-        {"Texto Identificador": "106 - Adicional Noturno Horas 20%", "Nome Evento": "Adicional Noturno Horas 20%", "Categoria": "Extras"},
-        {"Texto Identificador": "17 - Horas Extras 50%", "Nome Evento": "Horas Extras 50%", "Categoria": "Extras"},
-        {"Texto Identificador": "5 - D.S.R. Sobre Horas Extras", "Nome Evento": "D.S.R. Sobre Horas Extras", "Categoria": "Extras"},
-        {"Texto Identificador": "1025 - PTS", "Nome Evento": "PTS", "Categoria": "Extras"},
-        {"Texto Identificador": "152 - DSR Adicional Noturno", "Nome Evento": "DSR Adicional Noturno", "Categoria": "Extras"},
-        {"Texto Identificador": "1394 - Bonificação Extraordinária", "Nome Evento": "Bonificação Extraordinária", "Categoria": "Extras"},
-        {"Texto Identificador": "1173 - Reembolso Vale Refeição", "Nome Evento": "Reembolso Vale Refeição", "Categoria": "Extras"},
-        {"Texto Identificador": "1098 - Reembolso Vale Transporte", "Nome Evento": "Reembolso Vale Transporte", "Categoria": "Extras"},
-        # FOLHA
-        {"Texto Identificador": "Folha de Pagamento - Adiantamento", "Nome Evento": "Adiantamento", "Categoria": "Folha"},
-        {"Texto Identificador": "Folha de Pagamento", "Nome Evento": "Folha Mensal", "Categoria": "Folha"}
-    ])
+    try:
+        return ler_regras(ARQUIVO_REGRAS)
+    except:
+        st.error("Erro ao ler arquivo de configuração. Usando padrão.")
+    return regras_padrao()
 
 def salvar_regras_localmente(df):
     """Persiste as regras no disco"""
     df.to_csv(ARQUIVO_REGRAS, index=False)
 
+@st.cache_resource
+def obter_armazem_retencao():
+    return ArmazemRetencao(PASTA_RETENCAO)
+
 def salvar_arquivos_retencao(arquivos, categoria):
-    """Salva cópia dos arquivos de upload na pasta de retenção local"""
+    """Retém cópia dos uploads em retencao/ (em segundo plano; uploads já retidos são ignorados)"""
     if not arquivos: return
-    
-    # Cria pasta do dia: retencao/2023-10-27/Folha/
-    hoje = datetime.now().strftime("%Y-%m-%d")
-    caminho_destino = os.path.join(PASTA_RETENCAO, hoje, categoria)
-    
-    if not os.path.exists(caminho_destino):
-        os.makedirs(caminho_destino)
-        
-    count = 0
-    for arquivo in arquivos:
-        try:
-            # Reseta o ponteiro do arquivo para ler desde o início
-            arquivo.seek(0)
-            with open(os.path.join(caminho_destino, arquivo.name), "wb") as f:
-                f.write(arquivo.getbuffer())
-            count += 1
-        except Exception as e:
-            st.error(f"Erro na retenção de {arquivo.name}: {e}")
-    
-    if count > 0:
-        st.toast(f"💾 {count} arquivos salvos em '{caminho_destino}'")
+    armazem = obter_armazem_retencao()
+    for erro in armazem.coletar_erros(): st.error(erro)
+    novos = armazem.reter(arquivos, categoria)
+    if novos > 0:
+        st.toast(f"💾 {novos} arquivo(s) enviados para retenção em '{PASTA_RETENCAO}'")
 
 # Executa setup ao carregar
 setup_inicial()
 if 'df_regras' not in st.session_state:
     st.session_state['df_regras'] = carregar_regras()
+if 'df_itens_folha' not in st.session_state:
+    st.session_state['df_itens_folha'] = carregar_itens_folha(ARQUIVO_ITENS_FOLHA)
 
 # --- FUNÇÕES AUXILIARES DE DADOS ---
-def limpar_valor(valor_str):
-    if pd.isna(valor_str) or valor_str == "": return 0.0
-    if isinstance(valor_str, float): return valor_str
-    return float(str(valor_str).replace('.', '').replace(',', '.'))
-
 def obter_regras_por_categoria(categoria):
-    df = st.session_state['df_regras']
-    return df[df['Categoria'] == categoria]
-
-# --- 1. FUNÇÃO: EXTRAIR LÍQUIDO ---
-def processar_liquidos(uploaded_files):
-    dados_extraidos = []
-    padrao_liquido = re.compile(r'^\s*(\d+)\s+(.+?)\s+(\d{3}\.\d{3}\.\d{3}-\d{2})\s+(\d{2}/\d{2}/\d{4})\s+([\d\.,]+)')
-    regex_cnpj_generico = re.compile(r'\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}')
-
-    for file in uploaded_files:
-        try:
-            with pdfplumber.open(file) as pdf:
-                for pagina in pdf.pages:
-                    texto = pagina.extract_text() or ""
-                    match_cnpj = regex_cnpj_generico.search(texto)
-                    cnpj_encontrado = match_cnpj.group(0) if match_cnpj else "Não Encontrado"
-                    for linha in texto.split('\n'):
-                        match = padrao_liquido.search(linha)
-                        if match:
-                            codigo, nome, cpf, data, valor = match.groups()
-                            dados_extraidos.append({
-                                "Empresa CNPJ": cnpj_encontrado, "Código": codigo, "Funcionário": nome.strip(),
-                                "CPF": cpf, "Data Pagto": data, "Valor Líquido": limpar_valor(valor), "Arquivo": file.name
-                            })
-        except Exception as e: st.error(f"Erro {file.name}: {e}")
-    return pd.DataFrame(dados_extraidos)
-
-# --- 2. FUNÇÃO: EXTRAIR ASSISTENCIAL ---
-def processar_assistencial(uploaded_files):
-    dados_assistencial = []
-    regex_linha_nome = re.compile(r'Código:\s*(\d+)\s+Nome\s*:\s*(.+?)\s+Função\s*:\s*(.*)')
-    regex_linha_valores = re.compile(r'Admissão\s*:\s*(\d{2}/\d{2}/\d{4})\s*Salário\s*:\s*([,.\d]+)\s*Valor\s*:\s*([,.\d]+)')
-    regex_cnpj_generico = re.compile(r'\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}')
-
-    for file in uploaded_files:
-        try:
-            with pdfplumber.open(file) as pdf:
-                for pagina in pdf.pages:
-                    texto = pagina.extract_text() or ""
-                    match_cnpj = regex_cnpj_generico.search(texto)
-                    cnpj_encontrado = match_cnpj.group(0) if match_cnpj else "Não Encontrado"
-                    linhas = texto.split('\n')
-                    for i, linha in enumerate(linhas):
-                        if regex_linha_nome.search(linha):
-                            match_nome = regex_linha_nome.search(linha)
-                            if i + 1 < len(linhas):
-                                match_valores = regex_linha_valores.search(linhas[i+1])
-                                if match_valores:
-                                    cod, nome, funcao = match_nome.groups()
-                                    admissao, salario, valor_desc = match_valores.groups()
-                                    dados_assistencial.append({
-                                        "Empresa CNPJ": cnpj_encontrado, "Código": cod, "Funcionário": nome.strip(),
-                                        "Função": funcao.strip(), "Admissão": admissao, "Salário Base": limpar_valor(salario),
-                                        "Valor Assistencial": limpar_valor(valor_desc), "Arquivo Original": file.name
-                                    })
-        except Exception as e: st.error(f"Erro {file.name}: {e}")
-    return pd.DataFrame(dados_assistencial)
-
-# --- 3. FUNÇÃO: EXTRAIR EXTRAS ---
-def processar_extras(uploaded_files):
-    dados_extras = []
-    regex_linha = re.compile(r'^\s*(\d+)\s+(.+?)\s+([\d\.,]+)\s+([\d\.,]+)$')
-    regex_linha_alt = re.compile(r'^\s*(\d+)\s+(.+?)\s+([\d\.,]+)$') 
-    regex_cnpj_generico = re.compile(r'\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}')
-    
-    df_regras = obter_regras_por_categoria("Extras")
-
-    for file in uploaded_files:
-        try:
-            with pdfplumber.open(file) as pdf:
-                texto_completo = "".join([p.extract_text() or "" for p in pdf.pages[:2]])
-                
-                tipo_evento = "Outros Extras - Não Identificado"
-                for _, row in df_regras.iterrows():
-                    if str(row['Texto Identificador']).strip() in texto_completo:
-                        tipo_evento = row['Nome Evento']
-                        break
-                
-                if tipo_evento == "Outros Extras - Não Identificado":
-                    st.warning(f"Extra não identificado em '{file.name}'. Verifique a aba Configurações.")
-
-                for pagina in pdf.pages:
-                    texto = pagina.extract_text() or ""
-                    match_cnpj = regex_cnpj_generico.search(texto)
-                    cnpj_encontrado = match_cnpj.group(0) if match_cnpj else "Não Encontrado"
-                    for linha in texto.split('\n'):
-                        match = regex_linha.search(linha)
-                        val_enc = None
-                        if match:
-                            cod, nome, _, val = match.groups()
-                            val_enc = val
-                        elif regex_linha_alt.search(linha):
-                            cod, nome, val = regex_linha_alt.search(linha).groups()
-                            val_enc = val
-                        
-                        if val_enc:
-                            dados_extras.append({
-                                "Empresa CNPJ": cnpj_encontrado, "Código": str(int(cod)), 
-                                "Funcionário": nome.strip(), "Tipo Evento": tipo_evento,
-                                "Valor": limpar_valor(val_enc)
-                            })
-        except Exception as e: st.error(f"Erro {file.name}: {e}")
-
-    if dados_extras:
-        df = pd.DataFrame(dados_extras)
-        df_pivot = df.pivot_table(index=['Empresa CNPJ', 'Código', 'Funcionário'], columns='Tipo Evento', values='Valor', aggfunc='sum', fill_value=0.0).reset_index()
-        for col in df_regras['Nome Evento'].unique():
-            if col not in df_pivot.columns: df_pivot[col] = 0.0
-        
-        cols_num = [c for c in df_pivot.columns if c not in ['Empresa CNPJ', 'Código', 'Funcionário']]
-        df_pivot['Total Extras'] = df_pivot[cols_num].sum(axis=1)
-        return df_pivot
-    return pd.DataFrame()
-
-# --- 4. FUNÇÃO: EXTRAIR FOLHA COMPLETA (ATUALIZADA) ---
-def processar_folha(uploaded_files):
-    dados_folha = []
-    
-    # Regex de Identificação do Funcionário (Mantido)
-    # O (?:Dep|$) no final ajuda a parar a captura antes da coluna de Departamento
-    regex_inicio = re.compile(r'Cód:\s*(\d+).*?Nome:\s*(.*?)\s+Função:(.*?)(?:Dep|Depto|$)') 
-    
-    # Regex de Contrato (Mantido)
-    regex_contrato = re.compile(r'Admissão:\s*(\d{2}/\d{2}/\d{4}).*?Salário:\s*([,.\d]+)')
-    
-    # Regex de Cabeçalho (CNPJ e Razão Social)
-    regex_razao_social = re.compile(r'(?:Apelido:.*?|\s*)Razão Social:\s*(.*?)(?:\s+CNPJ/CEI:|\s+Pág:|\n|$)', re.IGNORECASE)
-    regex_cnpj_cei = re.compile(r'CNPJ/CEI:([\d\./\-]+)', re.IGNORECASE)
-    
-    # Regex de Totais (Mantido)
-    regex_totais = re.compile(r'Proventos:\s*([\d\.,]+).*?Descontos:\s*([\d\.,]+).*?Liquido:\s*([\d\.,]+)')
-    
-    # --- MAPEAMENTO DE ITENS (ATUALIZADO PARA ACEITAR ESPAÇOS) ---
-    # Adicionamos \s* depois do \d+ para aceitar "1 Salário" ou "1Salário"
-    itens_map = {
-        # PROVENTOS
-        "Salário Provento": re.compile(r'\d+\s*Salário\s+[\d\.,]+\s+([\d\.,]+)'),
-        "Adiantamento Crédito": re.compile(r'\d+\s*Adiantamento Crédito\s+[\d\.,]+\s+([\d\.,]+)'), # Adicionado para ler o Adiantamento
-        "D.S.R. Sobre Horas Extras": re.compile(r'\d+\s*D\.S\.R\. Sobre Horas Extras\s+([\d\.,]+)'),
-        "Horas Extras 50%": re.compile(r'\d+\s*Horas Extras 50%\s+[\d\.,]+\s+([\d\.,]+)'),
-        "Horas Extras 100%": re.compile(r'\d+\s*Horas Extras 100%\s+[\d\.,]+\s+([\d\.,]+)'), # Caso exista
-        "Reembolso Vale Transporte": re.compile(r'\d+\s*Reembolso Vale Transporte\s+([\d\.,]+)'),
-        
-        # DESCONTOS
-        "INSS Sobre Salário": re.compile(r'\d+\s*INSS Sobre Salário\s+[\d\.,]+\s+([\d\.,]+)'),
-        "IRRF Sobre Salário": re.compile(r'\d+\s*IRRF Sobre Salário\s+[\d\.,]+\s+([\d\.,]+)'),
-        "Desc. Vale Transporte": re.compile(r'\d+\s*Desc\. Vale Transporte\s+[\d\.,]+\s+([\d\.,]+)'),
-        "Contribuição Assistencial": re.compile(r'\d+\s*Contribuição Assistencial\s+[\d\.,]+'),
-        "Faltas": re.compile(r'\d+\s*Faltas\s+[\d\.,]+\s+([\d\.,]+)'),
-        
-        # BASES (Rodapé do funcionário)
-        "Base INSS Empresa": re.compile(r'Base INSS Empresa:\s*([\d\.,]+)'),
-        "Base INSS Funcionário": re.compile(r'Base INSS Funcionário:\s*([\d\.,]+)'),
-        "Base F.G.T.S.": re.compile(r'Base F\.G\.T\.S\.:\s*([\d\.,]+)'),
-        "F.G.T.S.": re.compile(r'(?<!Base )F\.G\.T\.S\.:\s*([\d\.,]+)'), # Lookbehind para não pegar a Base
-        "Base I.R.R.F.": re.compile(r'Base I\.R\.R\.F\.:\s*([\d\.,]+)')
-    }
-
-    df_regras_folha = obter_regras_por_categoria("Folha")
-
-    for file in uploaded_files:
-        try:
-            with pdfplumber.open(file) as pdf:
-                empresa_nome, empresa_cnpj = "Não Encontrado", "Não Encontrado"
-                primeira_pag_texto = ""
-                
-                # Leitura do Cabeçalho Global do Arquivo
-                if len(pdf.pages) > 0:
-                    primeira_pag_texto = pdf.pages[0].extract_text() or ""
-                    match_rz = regex_razao_social.search(primeira_pag_texto)
-                    if match_rz: empresa_nome = match_rz.group(1).strip()
-                    match_cnpj = regex_cnpj_cei.search(primeira_pag_texto)
-                    if match_cnpj: empresa_cnpj = match_cnpj.group(1).strip()
-
-                # Identificação do Tipo de Folha
-                tipo_folha = "Folha Geral"
-                for _, row in df_regras_folha.iterrows():
-                    if str(row['Texto Identificador']).strip() in primeira_pag_texto:
-                        tipo_folha = row['Nome Evento']
-                        break
-                
-                # Processamento Página a Página
-                for pagina in pdf.pages:
-                    texto = pagina.extract_text() or ""
-                    # Atualiza CNPJ se mudar na página (comum em arquivos com múltiplas filiais)
-                    match_cnpj_pag = regex_cnpj_cei.search(texto)
-                    if match_cnpj_pag: empresa_cnpj = match_cnpj_pag.group(1).strip()
-                    
-                    func_atual = {}
-                    
-                    for linha in texto.split('\n'):
-                        # 1. Tenta identificar Início de Funcionário
-                        match_inicio = regex_inicio.search(linha)
-                        if match_inicio:
-                            # Se já tinha um funcionário aberto não fechado, salva (precaução)
-                            if func_atual and "Líquido a Receber" not in func_atual:
-                                # Opcional: Log de aviso que fechou forçado
-                                pass 
-                                
-                            cod, nome, funcao = match_inicio.groups()
-                            func_atual = {
-                                "Empresa": empresa_nome, "Empresa CNPJ": empresa_cnpj, "Código": cod, 
-                                "Funcionário": nome.strip(), "Função": funcao.strip(), "Arquivo": file.name, "Tipo Folha": tipo_folha,
-                                "Total Proventos": "0,00", "Total Descontos": "0,00", "Líquido a Receber": "0,00"
-                            }
-                            # Inicializa colunas do map com 0,00
-                            for k in itens_map.keys(): func_atual[k] = "0,00"
-                            continue
-
-                        # 2. Se estamos dentro de um bloco de funcionário, busca os dados
-                        if func_atual:
-                            # Dados Contratuais
-                            match_ct = regex_contrato.search(linha)
-                            if match_ct:
-                                func_atual["Admissão"] = match_ct.group(1)
-                                func_atual["Salário Base Contratual"] = match_ct.group(2)
-                            
-                            # Itens Financeiros (Varre todos os regex do mapa contra a linha atual)
-                            for k, rgx in itens_map.items():
-                                match_item = rgx.search(linha)
-                                if match_item:
-                                    if k == "Contribuição Assistencial": 
-                                        # Se a contribuição não tiver valor explícito na linha, assume fixo (regra de negócio sua)
-                                        # Caso tenha grupo de captura no regex, usa ele.
-                                        if rgx.groups: func_atual[k] = match_item.group(1)
-                                        else: func_atual[k] = "10,00"
-                                    else: 
-                                        func_atual[k] = match_item.group(1)
-                            
-                            # Totais / Fechamento
-                            match_tot = regex_totais.search(linha)
-                            if match_tot:
-                                func_atual["Total Proventos"], func_atual["Total Descontos"], func_atual["Líquido a Receber"] = match_tot.groups()
-                                dados_folha.append(func_atual)
-                                func_atual = {} # Limpa para o próximo
-                                
-        except Exception as e: st.error(f"Erro ao processar {file.name}: {e}")
-
-    if dados_folha:
-        df = pd.DataFrame(dados_folha)
-        cols_ignorar = ["Empresa", "Empresa CNPJ", "Código", "Funcionário", "Função", "Arquivo", "Admissão", "Tipo Folha"]
-        for c in df.columns:
-            if c not in cols_ignorar: df[c] = df[c].apply(limpar_valor)
-        return df
-        
-    return pd.DataFrame()
+    return filtrar_regras(st.session_state['df_regras'], categoria)
+
+# --- CACHE DE EXTRAÇÃO ---
+@st.cache_resource
+def obter_cache_parse():
+    """Instância única do cache em disco (compartilhada entre reruns e sessões)"""
+    return CacheParse(PASTA_CACHE)
+
+def obter_diagnostico():
+    """Medições das etapas desta sessão (aba Diagnóstico)"""
+    if 'diagnostico' not in st.session_state: st.session_state['diagnostico'] = RegistroEtapas()
+    return st.session_state['diagnostico']
+
+@st.cache_resource
+def obter_historico():
+    return Historico(ARQUIVO_HISTORICO)
+
+def conteudo_exportacao(tabelas, formato, diagnostico):
+    with diagnostico.medir("Exportação", formato) as info:
+        caminho, reaproveitado = exportar(tabelas, formato, PASTA_EXPORTACAO)
+        info.update({"Linhas": sum(len(df) for df in tabelas.values()), "Reaproveitado": reaproveitado})
+    with open(caminho, "rb") as f: return f.read()
+
+def mostrar_status_cache(tipo):
+    stats = st.session_state.get('cache_stats', {}).get(tipo)
+    if stats:
+        st.caption(f"⚡ Cache: {stats['hits']} arquivo(s) reaproveitado(s), {stats['misses']} processado(s)")
+    metricas = st.session_state.get('metricas_arquivos', {}).get(tipo)
+    if metricas:
+        with st.expander("📏 Tempos, páginas e pico de memória por arquivo"):
+            st.dataframe(pd.DataFrame(metricas), use_container_width=True)
+
+# --- PROCESSAMENTO EM SEGUNDO PLANO ---
+def obter_fila_trabalhos():
+    """Fila de trabalhos desta sessão (uploads processados sem travar a interface)"""
+    if 'fila_trabalhos' not in st.session_state: st.session_state['fila_trabalhos'] = FilaTrabalhos()
+    return st.session_state['fila_trabalhos']
+
+def enfileirar_categoria(categoria, uploaded_files):
+    """Enfileira o processamento quando os arquivos ou as regras mudaram desde o último trabalho da categoria"""
+    df_itens = st.session_state['df_itens_folha'] if categoria == "Folha" else None
+    assinatura = (tuple(getattr(f, "file_id", None) or f.name for f in uploaded_files),
+                  impressao_regras(obter_regras_por_categoria(categoria)), impressao_regras(df_itens))
+    fila = obter_fila_trabalhos()
+    if fila.ultima_assinatura(categoria) == assinatura: return
+    fila.enfileirar(categoria, [(f.name, f.getvalue()) for f in uploaded_files], assinatura,
+                    st.session_state['df_regras'], df_itens, obter_cache_parse(),
+                    st.session_state.get('n_processos', PROCESSOS_PADRAO), obter_diagnostico(),
+                    perfilar=perfil is not None)  # execução perfilada: o trabalho também é perfilado, na sua thread
+
+def entregar_resultados():
+    """Leva os resultados dos trabalhos terminados para st.session_state.dfs"""
+    for trabalho in obter_fila_trabalhos().prontos():
+        mensagens = st.session_state.setdefault('mensagens', {})
+        if trabalho.perfil: st.session_state.setdefault('perfis_trabalhos', {})[trabalho.categoria] = trabalho.perfil
+        if trabalho.status == CONCLUIDO:
+            r = trabalho.resultado
+            st.session_state.dfs[trabalho.categoria] = r["df"]
+            st.session_state.setdefault('impressoes', {})[trabalho.categoria] = r["impressao"]
+            st.session_state.setdefault('cache_stats', {})[trabalho.categoria] = {"hits": r["reaproveitados"], "misses": r["processados"]}
+            st.session_state.setdefault('metricas_arquivos', {})[trabalho.categoria] = r["metricas"]
+            mensagens[trabalho.categoria] = [("warning", m) for m in r["avisos"]] + [("error", m) for m in r["erros"]]
+        elif trabalho.status == FALHOU:
+            mensagens[trabalho.categoria] = [("error", trabalho.erro)]
+        elif trabalho.status == CANCELADO:
+            mensagens[trabalho.categoria] = [("info", "Processamento cancelado. Envie os arquivos novamente para reprocessar.")]
+        trabalho.liberar()  # o DataFrame fica só em dfs
+
+def finalizar_perfil():
+    """Para o perfil da execução (se ligado) e guarda o relatório na sessão. Chamado no fim do script e
+    antes de cada st.rerun(), que interrompe o script antes da aba Diagnóstico"""
+    perfil = st.session_state.pop('perfil_ativo', None)
+    if perfil: st.session_state['perfil_texto'] = encerrar_perfil(perfil)
+
+def painel_trabalhos():
+    """Progresso por arquivo (páginas lidas/total) e cancelamento dos trabalhos da sessão"""
+    fila = obter_fila_trabalhos()
+    if fila.ha_prontos():  # resultado pronto: atualiza o app inteiro
+        finalizar_perfil()
+        st.rerun()
+    trabalhos = fila.recentes()
+    if not trabalhos: return
+    with st.expander("⏳ Processamentos", expanded=bool(fila.ativos())):
+        for trabalho in trabalhos:
+            c1, c2 = st.columns([5, 1])
+            c1.progress(trabalho.fracao(), text=f"**{trabalho.categoria}** — {trabalho.status} ({trabalho.duracao():.0f}s)")
+            if trabalho.ativo:
+                if c2.button("Cancelar", key=f"cancelar_{trabalho.id}"): trabalho.cancelar()
+                for nome, feitas, total in trabalho.progresso():
+                    c1.caption(f"{nome}: {feitas}/{total} páginas" if total else f"{nome}: aguardando")
+
+def obter_consolidacao():
+    """Fontes preparadas e agregados desta sessão (reconsolidar só refaz o que mudou)"""
+    if 'consolidacao' not in st.session_state: st.session_state['consolidacao'] = ConsolidacaoIncremental()
+    return st.session_state['consolidacao']
+
+def mostrar_mensagens(categoria):
+    for tipo, mensagem in st.session_state.get('mensagens', {}).get(categoria, []):
+        getattr(st, tipo)(mensagem)
 
 # --- INTERFACE ---
-tab1, tab2, tab3, tab4, tab5, tab6, tab_config = st.tabs(["📄 Folha", "🚑 Assistencial", "💰 Líquido", "➕ Extras", "📊 Consolidação", "📈 Dashboard", "⚙️ Configurações"])
+area_trabalhos = st.container()
+tab1, tab2, tab3, tab4, tab5, tab6, tab_conc, tab_config, tab_diag = st.tabs(["📄 Folha", "🚑 Assistencial", "💰 Líquido", "➕ Extras", "📊 Consolidação", "📈 Dashboard", "🔎 Conciliação", "⚙️ Configurações", "🩺 Diagnóstico"])
+
+# Perfil (cProfile) de uma execução inteira do script, quando pedido na aba Diagnóstico. Fica na sessão:
+# um perfil deixado ligado por uma execução interrompida (exceção) é encerrado e guardado na seguinte
+finalizar_perfil()
+if st.session_state.pop('perfilar_proxima', False): st.session_state['perfil_ativo'] = iniciar_perfil()
+perfil = st.session_state.get('perfil_ativo')
 
 if 'dfs' not in st.session_state: st.session_state.dfs = {}
+entregar_resultados()
 
 with tab1:
     st.header("Upload da Folha")
@@ -347,10 +183,13 @@ with tab1:
     if up_folha:
         # AÇÃO DE RETENÇÃO
         salvar_arquivos_retencao(up_folha, "Folha")
-        # PROCESSAMENTO
-        df_folha = processar_folha(up_folha)
-        st.session_state.dfs['Folha'] = df_folha
+        # PROCESSAMENTO (em segundo plano; o resultado entra em dfs ao terminar)
+        enfileirar_categoria("Folha", up_folha)
+    mostrar_mensagens("Folha")
+    if 'Folha' in st.session_state.dfs:
+        df_folha = st.session_state.dfs['Folha']
         st.success(f"{len(df_folha)} registros.")
+        mostrar_status_cache("Folha")
         st.dataframe(df_folha.head())
 
 with tab2:
@@ -358,9 +197,12 @@ with tab2:
     up_assist = st.file_uploader("PDF Assistencial", type="pdf", accept_multiple_files=True, key="u_assist")
     if up_assist:
         salvar_arquivos_retencao(up_assist, "Assistencial")
-        df_assist = processar_assistencial(up_assist)
-        st.session_state.dfs['Assistencial'] = df_assist
+        enfileirar_categoria("Assistencial", up_assist)
+    mostrar_mensagens("Assistencial")
+    if 'Assistencial' in st.session_state.dfs:
+        df_assist = st.session_state.dfs['Assistencial']
         st.success(f"{len(df_assist)} registros.")
+        mostrar_status_cache("Assistencial")
         st.dataframe(df_assist.head())
 
 with tab3:
@@ -368,9 +210,12 @@ with tab3:
     up_liq = st.file_uploader("PDF Líquido", type="pdf", accept_multiple_files=True, key="u_liq")
     if up_liq:
         salvar_arquivos_retencao(up_liq, "Liquido")
-        df_liq = processar_liquidos(up_liq)
-        st.session_state.dfs['Liquido'] = df_liq
+        enfileirar_categoria("Liquido", up_liq)
+    mostrar_mensagens("Liquido")
+    if 'Liquido' in st.session_state.dfs:
+        df_liq = st.session_state.dfs['Liquido']
         st.success(f"{len(df_liq)} registros.")
+        mostrar_status_cache("Liquido")
         st.dataframe(df_liq.head())
 
 with tab4:
@@ -378,61 +223,32 @@ with tab4:
     up_extras = st.file_uploader("PDFs Extras", type="pdf", accept_multiple_files=True, key="u_extras")
     if up_extras:
         salvar_arquivos_retencao(up_extras, "Extras")
-        df_extras = processar_extras(up_extras)
-        st.session_state.dfs['Extras'] = df_extras
+        enfileirar_categoria("Extras", up_extras)
+    mostrar_mensagens("Extras")
+    if 'Extras' in st.session_state.dfs:
+        df_extras = st.session_state.dfs['Extras']
+        mostrar_status_cache("Extras")
         if not df_extras.empty:
             st.success(f"{len(df_extras)} registros.")
             st.dataframe(df_extras, use_container_width=True)
 
+# Enquanto houver trabalho em andamento, só o painel é reexecutado (a cada segundo)
+with area_trabalhos:
+    st.fragment(painel_trabalhos, run_every=1.0 if obter_fila_trabalhos().ativos() else None)()
+
 with tab5:
     st.header("Consolidação")
     if st.button("Processar Dados"):
-        dfs = st.session_state.dfs
-        lista = []
-        
-        def preparar(df_in, origem):
-            df = df_in.copy()
-            df['KEY_COD'] = pd.to_numeric(df['Código'], errors='coerce').fillna(0).astype(int)
-            df['KEY_CNPJ'] = df['Empresa CNPJ'].apply(lambda x: re.sub(r'\D', '', str(x)))
-            if origem == 'Folha':
-                if 'Tipo Folha' not in df.columns: df['Tipo Folha'] = 'Mensal'
-                df['KEY_TIPO'] = df['Tipo Folha'] + "_" + df['Arquivo']
-            else: df['KEY_TIPO'] = 'GERAL'
-            
-            if origem != 'Folha':
-                cols_renomear = {c: f"{c}_{origem}" for c in df.columns if c not in ['Empresa', 'Funcionário', 'KEY_COD', 'KEY_CNPJ', 'KEY_TIPO', 'Código', 'Empresa CNPJ']}
-                df = df.rename(columns=cols_renomear)
-                df = df.drop(columns=['Empresa', 'Funcionário', 'Função', 'Arquivo', 'Código', 'Empresa CNPJ', 'Tipo Folha'], errors='ignore')
-            return df
-
-        if 'Folha' in dfs and not dfs['Folha'].empty:
-            lista.append(preparar(dfs['Folha'], 'Folha'))
-        
-        for aba in ['Assistencial', 'Liquido', 'Extras']:
-            if aba in dfs and not dfs[aba].empty:
-                df_p = preparar(dfs[aba], aba)
-                df_p = df_p.drop(columns=['KEY_TIPO'], errors='ignore')
-                lista.append(df_p)
-
-        if not lista: st.warning("Sem dados.")
+        avisos_consolidacao = []
+        with obter_diagnostico().medir("Consolidação") as info:
+            consolidacao = obter_consolidacao()
+            df_cons = consolidacao.consolidar(st.session_state.dfs, st.session_state.get('impressoes'), avisos_consolidacao)
+            info["Linhas"] = 0 if df_cons is None else len(df_cons)
+        for aviso in avisos_consolidacao: st.warning(aviso)
+        if df_cons is None: st.warning("Sem dados.")
         else:
-            df_final = lista[0]
-            for df_t in lista[1:]: df_final = pd.merge(df_final, df_t, on=['KEY_COD', 'KEY_CNPJ'], how='left')
-
-            cols_num = df_final.select_dtypes(include=['number']).columns
-            df_final[cols_num] = df_final[cols_num].fillna(0.0)
-            df_final = df_final.fillna("-")
-
-            cols_gb = ['KEY_COD', 'KEY_CNPJ', 'KEY_TIPO']
-            for c in ['Funcionário', 'Empresa', 'Tipo Folha', 'Arquivo']:
-                if c in df_final.columns: cols_gb.append(c)
-            
-            agg = {c: 'sum' if c in cols_num else 'first' for c in df_final.columns if c not in cols_gb}
-            df_cons = df_final.groupby(cols_gb, as_index=False).agg(agg)
-            df_cons['Código'] = df_cons['KEY_COD']
-            df_cons.drop(columns=['KEY_COD', 'KEY_CNPJ', 'KEY_TIPO'], inplace=True, errors='ignore')
-
             st.session_state['df_consolidado'] = df_cons
+            st.session_state['chave_consolidado'] = consolidacao.chave
             st.success("Dados Consolidados com Sucesso!")
 
     if 'df_consolidado' in st.session_state:
@@ -440,32 +256,118 @@ with tab5:
         cols = st.multiselect("Colunas:", df_show.columns, default=list(df_show.columns)[:8])
         if cols:
             st.dataframe(df_show[cols].head(50))
-            
-            towrite = BytesIO()
-            with pd.ExcelWriter(towrite, engine='xlsxwriter') as writer:
-                # df_show[cols].to_excel(writer, sheet_name='Consolidado', index=False)
-                for key, df_orig in st.session_state.dfs.items():
-                    if not df_orig.empty:
-                        sheet_name = f"Orig_{key}"[:31]
-                        df_orig.to_excel(writer, sheet_name=sheet_name, index=False)
-            
-            st.download_button("Baixar Excel (Multi-Abas)", towrite, "Relatorio_RH_Completo.xlsx")
+
+            # O arquivo só é montado no clique do download (e reaproveitado se os dados não mudaram)
+            rotulo = st.radio("Formato:", list(FORMATOS_EXPORTACAO), horizontal=True)
+            formato = FORMATOS_EXPORTACAO[rotulo]
+            tabelas = tabelas_relatorio(df_show[cols], dict(st.session_state.dfs))
+            if formato == "xlsx" and excede_limite_excel(tabelas):
+                st.warning("Há tabelas acima do limite de linhas do Excel. Exporte em Parquet ou CSV.")
+            else:
+                st.download_button(f"Baixar Relatório ({rotulo})", partial(conteudo_exportacao, tabelas, formato, obter_diagnostico()),
+                                   f"Relatorio_RH_Completo.{'xlsx' if formato == 'xlsx' else 'zip'}", on_click="ignore")
+
+        st.divider()
+        st.subheader("💾 Histórico")
+        competencia = st.text_input("Competência (AAAA-MM):", value=competencia_sugerida(st.session_state.dfs))
+        if st.button("Gravar no Histórico"):
+            if not re.match(r'^\d{4}-(0[1-9]|1[0-2])$', competencia): st.error("Competência inválida. Use o formato AAAA-MM.")
+            else:
+                tabelas_hist = {**st.session_state.dfs, "Consolidado": df_show}
+                n = obter_historico().gravar(competencia, tabelas_hist)
+                st.success(f"Competência {competencia} gravada no histórico ({n} lançamentos).")
 
 with tab6:
     st.header("Dashboard")
     if 'df_consolidado' in st.session_state:
-        df_d = st.session_state['df_consolidado'].copy()
-        for c in ['Total Proventos', 'Líquido a Receber', 'Total Extras_Extras']:
-             if c not in df_d.columns: df_d[c] = 0.0
-        
+        # Cubos agrupados uma vez por consolidação (sem copiar o frame a cada rerun); os gráficos leem só os cubos
+        cubos = obter_consolidacao().agregado(st.session_state.get('chave_consolidado'), "cubos", montar_cubos,
+                                              st.session_state['df_consolidado'])
+        totais = cubos["totais"]
         c1, c2, c3 = st.columns(3)
-        c1.metric("Folha Total", f"R$ {df_d['Total Proventos'].sum():,.2f}")
-        c2.metric("Líquido Total", f"R$ {df_d['Líquido a Receber'].sum():,.2f}")
-        c3.metric("Registros", len(df_d))
+        c1.metric("Folha Total", f"R$ {totais['Total Proventos']:,.2f}")
+        c2.metric("Líquido Total", f"R$ {totais['Líquido a Receber']:,.2f}")
+        c3.metric("Registros", totais['Registros'])
+
+        dimensoes = [d for d in DIMENSOES if d in cubos]
+        if dimensoes and cubos["eventos"]:
+            st.subheader("Distribuição")
+            f1, f2, f3 = st.columns(3)
+            dimensao = f1.selectbox("Agrupar por:", dimensoes)
+            medida = f2.selectbox("Valor:", cubos["eventos"] + [FUNCIONARIOS])
+            n = f3.slider("Maiores:", 3, 50, 15)
+            df_top = top_n(cubos[dimensao], dimensao, medida, n)
+            st.plotly_chart(px.bar(df_top, x=medida, y=dimensao, orientation="h", hover_data=[FUNCIONARIOS])
+                            .update_yaxes(autorange="reversed", type="category"), use_container_width=True)
+
+            st.subheader("Eventos por Tipo Folha")
+            padrao = [e for e in cubos["eventos"] if e not in ('Total Proventos', 'Líquido a Receber')]
+            eventos = st.multiselect("Eventos:", cubos["eventos"], default=padrao)
+            if eventos and "Tipo Folha" in cubos:
+                st.plotly_chart(px.bar(eventos_por(cubos["Tipo Folha"], "Tipo Folha", eventos), x="Evento", y="Valor",
+                                       color="Tipo Folha", barmode="group"), use_container_width=True)
+
+    # Tendência lida do resumo pré-agregado do histórico (sem reprocessar PDFs)
+    st.subheader("Histórico por Competência")
+    historico = obter_historico()
+    cnpjs = historico.cnpjs()
+    if not cnpjs: st.info("Nenhuma competência gravada no histórico ainda (aba Consolidação).")
+    else:
+        f1, f2 = st.columns(2)
+        cnpj_hist = f1.selectbox("CNPJ:", ["Todos"] + cnpjs, format_func=lambda c: c or "Não Encontrado")
+        meses = f2.slider("Meses:", 1, 60, 24)
+        cols_tendencia = ['Total Proventos', 'Líquido a Receber', 'Total Extras_Extras']
+        df_hist = historico.tendencia(cols_tendencia, cnpj=None if cnpj_hist == "Todos" else cnpj_hist, meses=meses)
+        st.plotly_chart(px.line(df_hist, x="competencia", y=cols_tendencia, markers=True), use_container_width=True)
+        st.dataframe(df_hist, use_container_width=True)
+
+with tab_conc:
+    st.header("Conciliação entre Fontes")
+    st.caption("Folha x Líquido (Líquido a Receber x Valor Líquido) e Folha x Assistencial (Contribuição Assistencial x Valor Assistencial), "
+               "por CNPJ + código do funcionário.")
+    if 'Folha' not in st.session_state.dfs: st.info("Envie a Folha e o Líquido e/ou o Assistencial para conciliar.")
+    else:
+        f1, f2 = st.columns(2)
+        # Líquido/Assistencial trazem um valor por funcionário: com mais de um tipo de folha, concilia um tipo por vez
+        tipos = tipos_folha(st.session_state.dfs['Folha'])
+        if len(tipos) > 1:
+            padrao = tipos.index("Folha Mensal") if "Folha Mensal" in tipos else 0
+            tipo_conc = f1.selectbox("Tipo Folha:", tipos, index=padrao, help="Há mais de um tipo de folha carregado: a conciliação é feita por tipo.")
+        else:
+            tipo_conc = None
+            f1.text_input("Tipo Folha:", value=tipos[0] if tipos else "-", disabled=True)
+        tolerancia = f2.number_input("Tolerância (R$):", min_value=0.0, value=TOLERANCIA_PADRAO, step=0.01, format="%.2f")
+        if st.button("Conciliar"):
+            with obter_diagnostico().medir("Conciliação") as info:
+                resultado = conciliar_fontes(st.session_state.dfs, tolerancia, tipo_conc)
+                info["Conferências"] = len(resultado)
+            st.session_state['resultado_conciliacao'] = resultado
+            st.session_state['tipo_conciliacao'] = tipo_conc or (tipos[0] if tipos else None)
+            if not resultado: st.warning("Nada a conciliar: carregue o Líquido ou o Assistencial (e confira se a Folha tem as colunas).")
+
+    resultado = st.session_state.get('resultado_conciliacao')
+    if resultado:
+        for rotulo, tabelas in resultado.items():
+            tipo_resultado = st.session_state.get('tipo_conciliacao')
+            st.subheader(f"Folha{f' ({tipo_resultado})' if tipo_resultado else ''} x {rotulo}")
+            st.dataframe(tabelas["Resumo"], use_container_width=True, hide_index=True)
+            for nome, df_c in tabelas.items():
+                if nome == "Resumo" or df_c.empty: continue
+                with st.expander(f"{nome} ({len(df_c)})"):
+                    st.dataframe(df_c.head(1000), use_container_width=True, hide_index=True)
+
+        rotulo_fmt = st.radio("Formato:", list(FORMATOS_EXPORTACAO), horizontal=True, key="formato_conciliacao")
+        formato_conc = FORMATOS_EXPORTACAO[rotulo_fmt]
+        tabelas_conc = tabelas_exportacao(resultado)
+        if formato_conc == "xlsx" and excede_limite_excel(tabelas_conc):
+            st.warning("Há tabelas acima do limite de linhas do Excel. Exporte em Parquet ou CSV.")
+        else:
+            st.download_button(f"Baixar Conciliação ({rotulo_fmt})", partial(conteudo_exportacao, tabelas_conc, formato_conc, obter_diagnostico()),
+                               f"Conciliacao_RH.{'xlsx' if formato_conc == 'xlsx' else 'zip'}", on_click="ignore")
 
 with tab_config:
     st.header("⚙️ Configurações e Regras")
-    st.info(f"📁 Pasta de Configurações: {ARQUIVO_REGRAS} | 📁 Pasta de Retenção: {PASTA_RETENCAO}")
+    st.info(f"📁 Pasta de Configurações: {ARQUIVO_REGRAS} | 📁 Pasta de Retenção: {PASTA_RETENCAO} | 📁 Cache: {PASTA_CACHE}")
     
     df_editado = st.data_editor(
         st.session_state['df_regras'],
@@ -479,20 +381,86 @@ with tab_config:
         key="editor_regras"
     )
     
+    st.number_input("⚙️ Processos paralelos na leitura de PDFs (1 = sem paralelismo)", min_value=1, max_value=64,
+                    value=PROCESSOS_PADRAO, step=1, key="n_processos")
+
     # SALVAMENTO AUTOMÁTICO DAS REGRAS NO DISCO
     if not df_editado.equals(st.session_state['df_regras']):
         st.session_state['df_regras'] = df_editado
         salvar_regras_localmente(df_editado)
         st.toast("✅ Regras salvas no disco com sucesso!")
 
+    with st.expander("📋 Itens da Folha (eventos lidos dentro de cada funcionário)"):
+        df_itens_editado = st.data_editor(
+            st.session_state['df_itens_folha'],
+            num_rows="dynamic",
+            use_container_width=True,
+            column_config={
+                "Item": st.column_config.TextColumn("Item (coluna)", required=True),
+                "Texto": st.column_config.TextColumn("Texto na Linha", required=True),
+                "Formato": st.column_config.SelectboxColumn("Formato", options=list(FORMATOS), required=True),
+                "Valor Fixo": st.column_config.TextColumn("Valor Fixo")
+            },
+            key="editor_itens_folha"
+        )
+        if not df_itens_editado.equals(st.session_state['df_itens_folha']):
+            st.session_state['df_itens_folha'] = df_itens_editado
+            df_itens_editado.to_csv(ARQUIVO_ITENS_FOLHA, index=False)
+            st.toast("✅ Itens da folha salvos no disco!")
+
     st.divider()
     col_d1, col_d2 = st.columns([1, 4])
     with col_d1:
         if st.button("🔄 Resetar Padrões"):
-            if os.path.exists(ARQUIVO_REGRAS):
-                os.remove(ARQUIVO_REGRAS)
+            for arquivo in [ARQUIVO_REGRAS, ARQUIVO_ITENS_FOLHA]:
+                if os.path.exists(arquivo): os.remove(arquivo)
             del st.session_state['df_regras']
+            del st.session_state['df_itens_folha']
+            finalizar_perfil()
             st.rerun()
+        if st.button("🧹 Limpar Cache"):
+            obter_cache_parse().limpar()
+            st.toast("Cache de extração limpo.")
     with col_d2:
         csv_backup = df_editado.to_csv(index=False).encode('utf-8')
-        st.download_button("💾 Baixar Backup", csv_backup, "backup_regras.csv", "text/csv")
\ No newline at end of file
+        st.download_button("💾 Baixar Backup", csv_backup, "backup_regras.csv", "text/csv")
+        cache = obter_cache_parse()
+        st.caption(f"⚡ Cache de extração: {cache.tamanho_total() / 1024 / 1024:.1f} MB em disco | {cache.hits} hits / {cache.misses} misses desde o início do servidor")
+
+# Aba preenchida por último: o perfil cobre toda a execução do script
+with tab_diag:
+    st.header("🩺 Diagnóstico")
+    finalizar_perfil()
+
+    etapas = obter_diagnostico().tabela()
+    arquivos = st.session_state.get('metricas_arquivos', {})
+    st.subheader("Etapas (última execução de cada uma)")
+    if etapas: st.dataframe(pd.DataFrame(etapas), use_container_width=True)
+    else: st.info("Nenhuma etapa medida ainda. Envie arquivos ou processe a consolidação.")
+
+    st.subheader("Arquivos")
+    linhas_arquivos = [{"Categoria": tipo, **m} for tipo, lista in arquivos.items() for m in lista]
+    if linhas_arquivos: st.dataframe(pd.DataFrame(linhas_arquivos), use_container_width=True)
+
+    st.subheader("Perfil (cProfile)")
+    st.caption("Captura a próxima execução inteira do script (ex.: o próximo upload ou 'Processar Dados'). "
+               "Uploads feitos nela têm a extração perfilada à parte, na thread do trabalho, e o perfil aparece ao terminar. "
+               "Com mais de um processo as páginas são lidas no pool e ficam fora do perfil: use 1 processo para incluí-las.")
+    if st.button("🔬 Perfilar próxima execução"):
+        st.session_state['perfilar_proxima'] = True
+        st.info("A próxima interação será perfilada.")
+    perfis = {"Script": st.session_state.get('perfil_texto'),
+              **{f"Extração {cat}": texto for cat, texto in st.session_state.get('perfis_trabalhos', {}).items()}}
+    perfis = {nome: texto for nome, texto in perfis.items() if texto}
+    for nome, texto in perfis.items():
+        with st.expander(nome): st.code(texto, language=None)
+
+    c1, c2 = st.columns(2)
+    texto_perfis = "\n\n".join(f"--- {nome} ---\n{texto}" for nome, texto in perfis.items()) or None
+    c1.download_button("📥 Exportar Diagnóstico (JSON)", relatorio_json(etapas, arquivos, texto_perfis),
+                       "diagnostico_rh.json", mime="application/json")
+    if c2.button("Limpar Diagnóstico"):
+        obter_diagnostico().limpar()
+        st.session_state.pop('perfil_texto', None)
+        st.session_state.pop('perfis_trabalhos', None)
+        st.rerun()
@@ -0,0 +1,90 @@
+"""Benchmark: custo por linha do classificador de itens da folha vs. o laço antigo (18 regex por linha).
+
+Uso:  python benchmarks/bench_classificador_folha.py [n_funcionarios]
+"""
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from classificador_folha import ITEM_CONTRATO, ITEM_TOTAIS, REGEX_CONTRATO, REGEX_TOTAIS, ClassificadorLinhas
+
+# Laço original do processar_folha (referência)
+ITENS_MAP_LEGADO = {
+    "Salário Provento": re.compile(r'\d+\s*Salário\s+[\d\.,]+\s+([\d\.,]+)'),
+    "Adiantamento Crédito": re.compile(r'\d+\s*Adiantamento Crédito\s+[\d\.,]+\s+([\d\.,]+)'),
+    "D.S.R. Sobre Horas Extras": re.compile(r'\d+\s*D\.S\.R\. Sobre Horas Extras\s+([\d\.,]+)'),
+    "Horas Extras 50%": re.compile(r'\d+\s*Horas Extras 50%\s+[\d\.,]+\s+([\d\.,]+)'),
+    "Horas Extras 100%": re.compile(r'\d+\s*Horas Extras 100%\s+[\d\.,]+\s+([\d\.,]+)'),
+    "Reembolso Vale Transporte": re.compile(r'\d+\s*Reembolso Vale Transporte\s+([\d\.,]+)'),
+    "INSS Sobre Salário": re.compile(r'\d+\s*INSS Sobre Salário\s+[\d\.,]+\s+([\d\.,]+)'),
+    "IRRF Sobre Salário": re.compile(r'\d+\s*IRRF Sobre Salário\s+[\d\.,]+\s+([\d\.,]+)'),
+    "Desc. Vale Transporte": re.compile(r'\d+\s*Desc\. Vale Transporte\s+[\d\.,]+\s+([\d\.,]+)'),
+    "Contribuição Assistencial": re.compile(r'\d+\s*Contribuição Assistencial\s+[\d\.,]+'),
+    "Faltas": re.compile(r'\d+\s*Faltas\s+[\d\.,]+\s+([\d\.,]+)'),
+    "Base INSS Empresa": re.compile(r'Base INSS Empresa:\s*([\d\.,]+)'),
+    "Base INSS Funcionário": re.compile(r'Base INSS Funcionário:\s*([\d\.,]+)'),
+    "Base F.G.T.S.": re.compile(r'Base F\.G\.T\.S\.:\s*([\d\.,]+)'),
+    "F.G.T.S.": re.compile(r'(?<!Base )F\.G\.T\.S\.:\s*([\d\.,]+)'),
+    "Base I.R.R.F.": re.compile(r'Base I\.R\.R\.F\.:\s*([\d\.,]+)'),
+}
+
+
+def classificar_legado(linha):
+    resultado = []
+    match_ct = REGEX_CONTRATO.search(linha)
+    if match_ct: resultado.append((ITEM_CONTRATO, match_ct.groups()))
+    for k, rgx in ITENS_MAP_LEGADO.items():
+        match_item = rgx.search(linha)
+        if match_item:
+            resultado.append((k, match_item.group(1) if rgx.groups else "10,00"))
+    match_tot = REGEX_TOTAIS.search(linha)
+    if match_tot: resultado.append((ITEM_TOTAIS, match_tot.groups()))
+    return resultado
+
+
+def linhas_sinteticas(n_funcionarios):
+    """Bloco típico de funcionário: maioria das linhas sem item (observações, depto, cabeçalhos de coluna)"""
+    linhas = []
+    for i in range(n_funcionarios):
+        linhas += [
+            "Depto: 1 - ADMINISTRATIVO Seção: 3 Cargo: 45 C.B.O.: 411010 Situação: Trabalhando",
+            f"Admissão: 01/02/2020 Dt. Nasc.: 10/10/1990 Salário: {2000 + i},00 Horas Mês: 220,00",
+            "Cód Descrição Referência Proventos Descontos",
+            f"1 Salário 30,00 {2000 + i},00 900 INSS Sobre Salário 9,00 180,00",
+            "17 Horas Extras 50% 10,00 150,00 901 Contribuição Assistencial 1,00",
+            "5 D.S.R. Sobre Horas Extras 35,00 48 Desc. Vale Transporte 6,00 120,00",
+            "Observação: lançamento conforme convenção coletiva vigente",
+            "Base INSS Empresa: 2.150,00 Base INSS Funcionário: 2.150,00 Base F.G.T.S.: 2.150,00 F.G.T.S.: 172,00",
+            "Base I.R.R.F.: 1.970,00 Faixa IRRF: Isento Dependentes IR: 0",
+            "Proventos: 2.150,00 Descontos: 190,00 Liquido: 1.960,00",
+        ]
+    return linhas
+
+
+def medir(funcao, linhas, repeticoes=5):
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        for linha in linhas: funcao(linha)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    linhas = linhas_sinteticas(n)
+    classificador = ClassificadorLinhas()
+
+    # Os dois caminhos precisam produzir o mesmo resultado
+    for linha in linhas[:200]:
+        assert sorted(map(str, classificador.classificar(linha))) == sorted(map(str, classificar_legado(linha))), linha
+
+    t_legado = medir(classificar_legado, linhas)
+    t_novo = medir(classificador.classificar, linhas)
+    print(f"{len(linhas)} linhas")
+    print(f"Laço antigo (18 regex/linha): {t_legado / len(linhas) * 1e6:8.2f} µs/linha")
+    print(f"Classificador (1 varredura):  {t_novo / len(linhas) * 1e6:8.2f} µs/linha")
+    print(f"Ganho: {t_legado / t_novo:.1f}x")
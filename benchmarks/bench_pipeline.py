@@ -0,0 +1,180 @@
+"""Benchmark do fluxo completo, etapa por etapa, sobre PDFs sintéticos (benchmarks/gerar_pdfs.py).
+
+Etapas medidas separadamente para cada cenário:
+    extracao_texto   pdfplumber: extract_text() de todas as páginas (medido dentro do extrator)
+    parse            restante do extrator (abertura do PDF, regex/classificador, colunas)
+    extracao_relogio tempo de relógio da extração (com --processos > 1 a folha é dividida em
+                     trechos de páginas e as duas etapas acima somam o tempo de CPU dos processos)
+    montagem_df      montar_df_* (colunas -> DataFrame tipado)
+    consolidacao     consolidar()
+    exportacao_excel exportacao.gravar_excel() das abas do relatório
+
+O resultado vai para um JSON (commit, versão do parser, ambiente, tempos) que pode ser comparado
+com o de outra versão via --comparar.
+
+Uso:
+    python benchmarks/bench_pipeline.py                                  # cenários padrão
+    python benchmarks/bench_pipeline.py --cenarios 10x1 5000x625 50000x1000 --repeticoes 3
+    python benchmarks/bench_pipeline.py --saida atual.json --comparar anterior.json
+    python benchmarks/bench_pipeline.py --cenarios 5000x1000 --processos 8   # folha dividida em trechos
+    python benchmarks/bench_pipeline.py --cenarios 1000x125 --paginas-resumo 125   # folha com páginas de resumo (puladas)
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+import pdfplumber
+
+from configuracao import filtrar_regras, regras_padrao
+from consolidacao import consolidar
+from exportacao import gravar_excel, tabelas_relatorio
+from extratores import EXTRATORES, PDFIUM_DISPONIVEL, VERSAO_PARSER
+from gerar_pdfs import gerar_todos
+from memoria import MonitorMemoria
+from paralelo import encerrar_pool, extrair_arquivos
+
+CENARIOS_PADRAO = ["10x1", "1000x125", "5000x1000"]
+ETAPAS = ["extracao_texto", "parse", "extracao_relogio", "montagem_df", "consolidacao", "exportacao_excel"]
+
+
+def commit_atual():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def ler_cenario(texto):
+    """"5000x625" -> (5000, 625); "5000" -> (5000, None: 8 funcionários por página)"""
+    funcionarios, _, paginas = texto.partition("x")
+    return int(funcionarios), int(paginas) if paginas else None
+
+
+def cronometrar(funcao, *args, **kwargs):
+    inicio = time.perf_counter()
+    resultado = funcao(*args, **kwargs)
+    return resultado, time.perf_counter() - inicio
+
+
+def rodar_cenario(n_funcionarios, paginas_folha, empresas, com_excel, processos=1, paginas_resumo=0):
+    pdfs, funcionarios = gerar_todos(n_funcionarios, paginas_folha, empresas, paginas_resumo=paginas_resumo)
+    df_regras = regras_padrao()
+    tempos = dict.fromkeys(ETAPAS, 0.0)
+    monitor = MonitorMemoria()
+    dfs, paginas, puladas, correspondencias = {}, {}, {}, {}
+
+    for categoria, conteudo in pdfs.items():
+        extrator, montar, usa_regras = EXTRATORES[categoria]
+        regras_cat = filtrar_regras(df_regras, categoria) if usa_regras else None
+
+        [resultado], t_extracao = cronometrar(extrair_arquivos, extrator, [(f"{categoria}.pdf", conteudo, regras_cat)], processos)
+        tempos["extracao_relogio"] += t_extracao
+        if resultado["erro"]: raise RuntimeError(resultado["erro"])
+        metricas = resultado["metricas"]
+        paginas[categoria] = metricas["paginas"]
+        puladas[categoria] = metricas.get("paginas_puladas", 0)
+        correspondencias[categoria] = metricas["correspondencias"]
+        tempos["extracao_texto"] += metricas["tempo_texto_s"]
+        tempos["parse"] += metricas["tempo_parse_s"]
+
+        dfs[categoria], t_montagem = cronometrar(montar, [resultado["colunas"]], regras_cat)
+        tempos["montagem_df"] += t_montagem
+        monitor.amostrar()
+
+    df_cons, tempos["consolidacao"] = cronometrar(consolidar, dfs)
+    monitor.amostrar()
+
+    if com_excel:
+        with tempfile.TemporaryDirectory() as pasta:
+            _, tempos["exportacao_excel"] = cronometrar(gravar_excel, tabelas_relatorio(df_cons, dfs), os.path.join(pasta, "relatorio.xlsx"))
+    else:
+        tempos["exportacao_excel"] = None
+    monitor.amostrar()
+
+    # Conferência: toda a folha extraída e totais batendo com o gerador
+    esperado = round(sum(f["liquido"] for f in funcionarios), 2)
+    extraido = round(float(dfs["Folha"]["Líquido a Receber"].sum()), 2)
+    return {
+        "funcionarios": n_funcionarios, "empresas": empresas, "paginas": paginas, "paginas_puladas": puladas,
+        "bytes_pdf": {c: len(p) for c, p in pdfs.items()},
+        "linhas": {**{c: len(df) for c, df in dfs.items()}, "Consolidado": len(df_cons)},
+        "correspondencias": correspondencias,
+        "conferencia_ok": len(dfs["Folha"]) == n_funcionarios and abs(esperado - extraido) < 0.01,
+        "pico_rss_mb": monitor.pico_mb,
+        "etapas_s": {k: None if v is None else round(v, 4) for k, v in tempos.items()},
+    }
+
+
+def melhor_de(execucoes):
+    """Menor tempo de cada etapa entre as repetições (demais campos da primeira)"""
+    resultado = dict(execucoes[0])
+    resultado["etapas_s"] = {e: None if execucoes[0]["etapas_s"][e] is None else min(x["etapas_s"][e] for x in execucoes) for e in ETAPAS}
+    resultado["total_s"] = round(sum(v for e, v in resultado["etapas_s"].items() if v is not None and e not in ("extracao_texto", "parse")), 4)
+    return resultado
+
+
+def imprimir(resultados, anterior=None):
+    base = {(r["funcionarios"], r["paginas"]["Folha"]): r for r in (anterior or {}).get("cenarios", [])}
+    for r in resultados:
+        ref = base.get((r["funcionarios"], r["paginas"]["Folha"]))
+        print(f"\n{r['funcionarios']} funcionários, {r['paginas']['Folha']} páginas de folha ({r.get('paginas_puladas', {}).get('Folha', 0)} puladas) "
+              f"(conferência {'ok' if r['conferencia_ok'] else 'FALHOU'}, pico RSS {r['pico_rss_mb']} MB)")
+        for etapa in ETAPAS + ["total_s"]:
+            valor = r[etapa] if etapa == "total_s" else r["etapas_s"][etapa]
+            if valor is None: continue
+            linha = f"  {etapa:<18} {valor:10.3f} s"
+            valor_ref = (ref[etapa] if etapa == "total_s" else ref["etapas_s"].get(etapa)) if ref else None
+            if valor_ref: linha += f"   anterior {valor_ref:10.3f} s  ({valor / valor_ref:5.2f}x)"
+            print(linha)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark por etapa do processamento de PDFs de RH.")
+    parser.add_argument("--cenarios", nargs="+", default=CENARIOS_PADRAO, help="funcionarios[xpaginas_folha] (padrão: %(default)s)")
+    parser.add_argument("--empresas", type=int, default=1, help="CNPJs distintos (padrão: %(default)s)")
+    parser.add_argument("--repeticoes", type=int, default=1, help="Repetições por cenário; vale o menor tempo (padrão: %(default)s)")
+    parser.add_argument("--sem-excel", action="store_true", help="Não mede a exportação Excel")
+    parser.add_argument("--paginas-resumo", type=int, default=0, help="Páginas de resumo ao final da folha (padrão: %(default)s)")
+    parser.add_argument("--processos", type=int, default=1, help="Processos na extração; a folha é dividida por páginas (padrão: %(default)s)")
+    parser.add_argument("--saida", default="bench_pipeline.json", help="Arquivo JSON de resultados (padrão: %(default)s)")
+    parser.add_argument("--comparar", help="JSON de uma execução anterior para comparação")
+    args = parser.parse_args(argv)
+
+    resultados = []
+    for texto in args.cenarios:
+        n, paginas = ler_cenario(texto)
+        try:
+            execucoes = [rodar_cenario(n, paginas, args.empresas, not args.sem_excel, args.processos, args.paginas_resumo) for _ in range(args.repeticoes)]
+        finally:
+            encerrar_pool()
+        resultados.append(melhor_de(execucoes))
+
+    relatorio = {
+        "data": datetime.now().isoformat(timespec="seconds"), "commit": commit_atual(), "versao_parser": VERSAO_PARSER,
+        "ambiente": {"python": platform.python_version(), "plataforma": platform.platform(), "cpus": os.cpu_count(),
+                     "pandas": pd.__version__, "pdfplumber": pdfplumber.__version__, "pdfium": PDFIUM_DISPONIVEL},
+        "repeticoes": args.repeticoes, "processos": args.processos, "cenarios": resultados,
+    }
+    with open(args.saida, "w", encoding="utf-8") as f: json.dump(relatorio, f, ensure_ascii=False, indent=2)
+
+    anterior = None
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f: anterior = json.load(f)
+    imprimir(resultados, anterior)
+    print(f"\nResultados em {args.saida}")
+    return 0 if all(r["conferencia_ok"] for r in resultados) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
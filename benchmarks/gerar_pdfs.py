@@ -0,0 +1,224 @@
+"""Gerador de PDFs sintéticos nos quatro layouts esperados pelos extratores (Folha, Assistencial, Líquido, Extras).
+
+Os mesmos funcionários (código, CNPJ, valores) aparecem nos quatro documentos, então a consolidação
+encontra as chaves como em um fechamento real. Os totais da folha fecham (Proventos - Descontos = Líquido).
+
+Uso:
+    python benchmarks/gerar_pdfs.py --funcionarios 1000 --paginas 125 --saida pdfs_sinteticos
+    python benchmarks/gerar_pdfs.py --funcionarios 50000 --paginas 1000 --empresas 5
+    python benchmarks/gerar_pdfs.py --funcionarios 1000 --paginas 125 --paginas-resumo 125   # folha com páginas de resumo
+"""
+import argparse
+import math
+import os
+import random
+
+NOMES = ["ANA", "BRUNO", "CARLA", "DIEGO", "ELAINE", "FABIO", "GISELE", "HUGO", "IARA", "JOAO", "KELLY", "LUCAS",
+         "MARIA", "NELSON", "OLGA", "PAULO", "RAQUEL", "SERGIO", "TANIA", "VITOR"]
+SOBRENOMES = ["SILVA", "SANTOS", "OLIVEIRA", "SOUZA", "LIMA", "PEREIRA", "COSTA", "RODRIGUES", "ALMEIDA", "NASCIMENTO",
+              "CARVALHO", "GOMES", "MARTINS", "ARAUJO", "RIBEIRO"]
+FUNCOES = ["AUXILIAR ADMINISTRATIVO", "ANALISTA DE RH", "OPERADOR DE PRODUCAO", "MOTORISTA", "VENDEDOR",
+           "SUPERVISOR", "TECNICO DE MANUTENCAO", "ASSISTENTE FINANCEIRO"]
+DEPTOS = ["1 - ADMINISTRATIVO", "2 - PRODUCAO", "3 - COMERCIAL", "4 - LOGISTICA"]
+
+# Texto do cabeçalho dos extras (precisa casar com uma regra "Extras" de configuracao.REGRAS_PADRAO)
+EVENTO_EXTRAS = "17 - Horas Extras 50%"
+
+ALTURA_A4, LARGURA_A4, ENTRELINHA = 842, 595, 10
+
+
+def moeda(valor):
+    """1234.5 -> "1.234,50" """
+    return f"{valor:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+
+
+def pdf_texto(paginas):
+    """PDF mínimo (Helvetica, uma linha de texto por item) a partir de [[linhas da página], ...].
+    A altura da página cresce quando há mais linhas do que cabem em um A4."""
+    objetos = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"]
+    filhos = []
+    for linhas in paginas:
+        altura = max(ALTURA_A4, 60 + ENTRELINHA * len(linhas))
+        partes = [f"BT /F1 8 Tf {ENTRELINHA} TL 30 {altura - 40} Td"]
+        for linha in linhas:
+            bruto = linha.encode("cp1252").replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+            partes.append("(" + bruto.decode("latin1") + ") Tj T*")
+        partes.append("ET")
+        fluxo = "\n".join(partes).encode("latin1")
+        objetos.append(b"<< /Length %d >>\nstream\n" % len(fluxo) + fluxo + b"\nendstream")
+        objetos.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+                       % (LARGURA_A4, altura, len(objetos)))
+        filhos.append(len(objetos))
+    objetos[1] = ("<< /Type /Pages /Kids [%s] /Count %d >>" % (" ".join(f"{k} 0 R" for k in filhos), len(filhos))).encode()
+
+    saida = bytearray(b"%PDF-1.4\n")
+    posicoes = []
+    for i, objeto in enumerate(objetos, 1):
+        posicoes.append(len(saida))
+        saida += b"%d 0 obj\n" % i + objeto + b"\nendobj\n"
+    inicio_xref = len(saida)
+    saida += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objetos) + 1)
+    saida += b"".join(b"%010d 00000 n \n" % p for p in posicoes)
+    saida += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objetos) + 1, inicio_xref)
+    return bytes(saida)
+
+
+def gerar_funcionarios(n, empresas=1, semente=42):
+    """Funcionários com valores coerentes; os códigos recomeçam em cada empresa (como nos sistemas de folha)"""
+    rnd = random.Random(semente)
+    funcionarios = []
+    por_empresa = math.ceil(n / empresas)
+    for i in range(n):
+        e = i // por_empresa
+        salario = round(rnd.uniform(1412, 12000), 2)
+        he50 = round(salario / 220 * 1.5 * rnd.choice([0, 0, 4, 8, 10, 20]), 2)
+        dsr = round(he50 / 6, 2)
+        inss = round(min(salario + he50 + dsr, 7786.02) * 0.09, 2)
+        irrf = round(max(0.0, (salario + he50 + dsr - inss - 2259.20) * 0.075), 2)
+        vale_transporte = round(salario * 0.06, 2) if rnd.random() < 0.6 else 0.0
+        proventos = round(salario + he50 + dsr, 2)
+        descontos = round(inss + irrf + vale_transporte + 10.0, 2)
+        funcionarios.append({
+            "codigo": i - e * por_empresa + 1, "empresa": f"EMPRESA SINTETICA {e + 1} LTDA",
+            "cnpj": f"{12 + e:02d}.345.678/0001-{(90 + e) % 100:02d}",
+            "nome": f"{rnd.choice(NOMES)} {rnd.choice(SOBRENOMES)} {rnd.choice(SOBRENOMES)}",
+            "funcao": rnd.choice(FUNCOES), "depto": rnd.choice(DEPTOS),
+            "admissao": f"{rnd.randint(1, 28):02d}/{rnd.randint(1, 12):02d}/{rnd.randint(2005, 2024)}",
+            "cpf": f"{rnd.randint(100, 999)}.{rnd.randint(100, 999)}.{rnd.randint(100, 999)}-{rnd.randint(10, 99)}",
+            "salario": salario, "he50": he50, "dsr": dsr, "inss": inss, "irrf": irrf, "vale_transporte": vale_transporte,
+            "proventos": proventos, "descontos": descontos, "liquido": round(proventos - descontos, 2),
+        })
+    return funcionarios
+
+
+def _paginar(funcionarios, por_pagina, cabecalho, bloco, inteiros=True):
+    """Distribui os blocos em páginas; nova página sempre que o CNPJ muda.
+    Com inteiros=False os blocos podem ser cortados entre páginas (quebra no meio do funcionário)."""
+    paginas, atual, n_pag, cnpj_atual, n_func = [], None, 0, None, 0
+    for f in funcionarios:
+        if atual is None or f["cnpj"] != cnpj_atual or (inteiros and n_func >= por_pagina):
+            if atual: paginas.append(atual)
+            n_pag += 1
+            atual, cnpj_atual, n_func = cabecalho(f, n_pag), f["cnpj"], 0
+        linhas = bloco(f)
+        if not inteiros and n_func + 1 > por_pagina:
+            meio = len(linhas) // 2
+            atual += linhas[:meio]
+            paginas.append(atual)
+            n_pag += 1
+            atual, n_func = cabecalho(f, n_pag) + linhas[meio:], 0
+        else:
+            atual += linhas
+        n_func += 1
+    if atual: paginas.append(atual)
+    return paginas
+
+
+def resumo_folha(funcionarios, paginas, tipo, linhas_por_pagina=70):
+    """Páginas de resumo (totais por evento e departamento), sem blocos de funcionário"""
+    f = funcionarios[-1]
+    eventos = [("1", "Salário", "salario"), ("17", "Horas Extras 50%", "he50"), ("5", "D.S.R. Sobre Horas Extras", "dsr"),
+               ("900", "INSS Sobre Salário", "inss"), ("910", "IRRF Sobre Salário", "irrf"), ("48", "Desc. Vale Transporte", "vale_transporte")]
+    linhas = [f"{cod} {nome} {depto} {moeda(sum(x[campo] for x in funcionarios if x['depto'] == depto))}"
+              for depto in DEPTOS for cod, nome, campo in eventos]
+    resultado = []
+    for n in range(paginas):
+        corpo = [linhas[(n * linhas_por_pagina + i) % len(linhas)] for i in range(linhas_por_pagina)]
+        resultado.append([f"Resumo Geral - {tipo}   Razão Social: {f['empresa']}   CNPJ/CEI:{f['cnpj']}",
+                          "Evento Descrição Departamento Valor"] + corpo)
+    return resultado
+
+
+def gerar_folha(funcionarios, por_pagina=8, tipo="Folha de Pagamento", blocos_inteiros=True, paginas_resumo=0):
+    def cabecalho(f, n):
+        return [f"{tipo}   Apelido: SINT   Razão Social: {f['empresa']}   CNPJ/CEI:{f['cnpj']}   Pág: {n}",
+                "Cód Descrição Referência Proventos Descontos"]
+
+    def bloco(f):
+        linhas = [f"Cód:{f['codigo']} Nome: {f['nome']} Função:{f['funcao']} Depto: {f['depto']}",
+                  f"Admissão: {f['admissao']} Dt. Nasc.: 10/10/1990 Salário: {moeda(f['salario'])} Horas Mês: 220,00",
+                  f"1 Salário 30,00 {moeda(f['salario'])} 900 INSS Sobre Salário 9,00 {moeda(f['inss'])}"]
+        if f["he50"]:
+            linhas.append(f"17 Horas Extras 50% 10,00 {moeda(f['he50'])} 901 Contribuição Assistencial 1,00")
+            linhas.append(f"5 D.S.R. Sobre Horas Extras {moeda(f['dsr'])}")
+        else:
+            linhas.append("901 Contribuição Assistencial 1,00")
+        if f["irrf"]: linhas.append(f"910 IRRF Sobre Salário 7,50 {moeda(f['irrf'])}")
+        if f["vale_transporte"]: linhas.append(f"48 Desc. Vale Transporte 6,00 {moeda(f['vale_transporte'])}")
+        base = moeda(f["proventos"])
+        linhas += ["Observação: lançamento conforme convenção coletiva vigente",
+                   f"Base INSS Empresa: {base} Base INSS Funcionário: {base} Base F.G.T.S.: {base} F.G.T.S.: {moeda(f['proventos'] * 0.08)}",
+                   f"Base I.R.R.F.: {moeda(f['proventos'] - f['inss'])} Faixa IRRF: 7,5% Dependentes IR: 0",
+                   f"Proventos: {moeda(f['proventos'])} Descontos: {moeda(f['descontos'])} Liquido: {moeda(f['liquido'])}"]
+        return linhas
+
+    return pdf_texto(_paginar(funcionarios, por_pagina, cabecalho, bloco, blocos_inteiros) + resumo_folha(funcionarios, paginas_resumo, tipo))
+
+
+def gerar_assistencial(funcionarios, por_pagina=30):
+    def cabecalho(f, n):
+        return [f"Relação de Contribuição Assistencial - {f['empresa']} - {f['cnpj']} - Pág: {n}"]
+
+    def bloco(f):
+        return [f"Código: {f['codigo']} Nome : {f['nome']} Função : {f['funcao']}",
+                f"Admissão : {f['admissao']} Salário : {moeda(f['salario'])} Valor : 10,00"]
+
+    return pdf_texto(_paginar(funcionarios, por_pagina, cabecalho, bloco))
+
+
+def gerar_liquido(funcionarios, por_pagina=60, data_pagto="05/03/2024"):
+    def cabecalho(f, n):
+        return [f"Relação de Líquidos - {f['empresa']} - CNPJ: {f['cnpj']} - Pág: {n}", "Código Nome CPF Data Valor"]
+
+    def bloco(f):
+        return [f"{f['codigo']} {f['nome']} {f['cpf']} {data_pagto} {moeda(f['liquido'])}"]
+
+    return pdf_texto(_paginar(funcionarios, por_pagina, cabecalho, bloco))
+
+
+def gerar_extras(funcionarios, por_pagina=60, evento=EVENTO_EXTRAS):
+    def cabecalho(f, n):
+        return [f"Relação de Eventos: {evento}", f"{f['empresa']} {f['cnpj']} Pág: {n}"]
+
+    def bloco(f):
+        return [f"{f['codigo']} {f['nome']} 10,00 {moeda(f['he50'])}"]
+
+    com_extras = [f for f in funcionarios if f["he50"]] or funcionarios[:1]
+    return pdf_texto(_paginar(com_extras, por_pagina, cabecalho, bloco))
+
+
+def gerar_todos(n_funcionarios, paginas_folha=None, empresas=1, semente=42, blocos_inteiros=True, paginas_resumo=0):
+    """{categoria: bytes do PDF} para os quatro layouts + lista de funcionários usada"""
+    funcionarios = gerar_funcionarios(n_funcionarios, empresas, semente)
+    por_pagina = math.ceil(n_funcionarios / paginas_folha) if paginas_folha else 8
+    pdfs = {
+        "Folha": gerar_folha(funcionarios, por_pagina, blocos_inteiros=blocos_inteiros, paginas_resumo=paginas_resumo),
+        "Assistencial": gerar_assistencial(funcionarios),
+        "Liquido": gerar_liquido(funcionarios),
+        "Extras": gerar_extras(funcionarios),
+    }
+    return pdfs, funcionarios
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera PDFs sintéticos nos quatro layouts de RH.")
+    parser.add_argument("--funcionarios", type=int, default=100, help="Funcionários (padrão: %(default)s)")
+    parser.add_argument("--paginas", type=int, help="Páginas da folha (padrão: 8 funcionários por página)")
+    parser.add_argument("--empresas", type=int, default=1, help="CNPJs distintos (padrão: %(default)s)")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--quebrar-blocos", action="store_true", help="Permite funcionário dividido entre páginas na folha")
+    parser.add_argument("--paginas-resumo", type=int, default=0, help="Páginas de resumo ao final da folha (padrão: %(default)s)")
+    parser.add_argument("--saida", default="pdfs_sinteticos", help="Pasta de saída (padrão: %(default)s)")
+    args = parser.parse_args(argv)
+
+    pdfs, _ = gerar_todos(args.funcionarios, args.paginas, args.empresas, args.semente, not args.quebrar_blocos, args.paginas_resumo)
+    os.makedirs(args.saida, exist_ok=True)
+    for categoria, conteudo in pdfs.items():
+        caminho = os.path.join(args.saida, f"{categoria.lower()}_{args.funcionarios}.pdf")
+        with open(caminho, "wb") as f: f.write(conteudo)
+        print(f"{caminho}  {len(conteudo) / 1024:,.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import hashlib
+import os
+import pickle
+import threading
+
+# --- CACHE PERSISTENTE DE EXTRAÇÃO POR ARQUIVO ---
+# Cada PDF processado vira um arquivo .pkl endereçado por:
+#   SHA-256 dos bytes + tipo de documento + versão do parser + impressão digital das regras
+# Assim só arquivos novos (ou regras alteradas) voltam a ser lidos pelo pdfplumber.
+
+LIMITE_PADRAO_BYTES = 512 * 1024 * 1024  # 512 MB
+
+
+def hash_conteudo(conteudo):
+    """SHA-256 dos bytes do arquivo"""
+    return hashlib.sha256(conteudo).hexdigest()
+
+
+def impressao_regras(df_regras):
+    """Impressão digital (hash) de uma tabela de regras; vazia se não houver regras"""
+    if df_regras is None or len(df_regras) == 0: return ""
+    return hashlib.sha256(df_regras.to_csv(index=False).encode("utf-8")).hexdigest()[:16]
+
+
+class CacheParse:
+    """Cache em disco com despejo LRU por tamanho total (mtime = último acesso)"""
+
+    def __init__(self, pasta, limite_bytes=LIMITE_PADRAO_BYTES):
+        self.pasta = pasta
+        self.limite_bytes = limite_bytes
+        self.hits = 0
+        self.misses = 0
+        self._tamanho = None  # total em bytes mantido a cada gravação (None: ainda não medido)
+        self._lock = threading.Lock()
+        os.makedirs(self.pasta, exist_ok=True)
+
+    def chave(self, conteudo, tipo, versao, regras=""):
+        return hashlib.sha256(f"{hash_conteudo(conteudo)}|{tipo}|{versao}|{regras}".encode("utf-8")).hexdigest()
+
+    def _caminho(self, chave):
+        return os.path.join(self.pasta, chave[:2], chave + ".pkl")
+
+    def obter(self, chave):
+        """Retorna o resultado guardado ou None (conta hit/miss)"""
+        caminho = self._caminho(chave)
+        try:
+            with open(caminho, "rb") as f:
+                resultado = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            with self._lock: self.misses += 1
+            return None
+        # Marca o acesso para o despejo LRU
+        try: os.utime(caminho)
+        except OSError: pass
+        with self._lock: self.hits += 1
+        return resultado
+
+    def gravar(self, chave, resultado):
+        caminho = self._caminho(chave)
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        temporario = f"{caminho}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporario, "wb") as f:
+            pickle.dump(resultado, f, protocol=pickle.HIGHEST_PROTOCOL)
+        try: anterior = os.path.getsize(caminho)
+        except OSError: anterior = 0
+        # Troca atômica: leitores nunca veem arquivo pela metade
+        os.replace(temporario, caminho)
+        with self._lock:
+            if self._tamanho is not None: self._tamanho += os.path.getsize(caminho) - anterior
+
+    def _entradas(self):
+        entradas = []
+        for raiz, _, arquivos in os.walk(self.pasta):
+            for nome in arquivos:
+                if not nome.endswith(".pkl"): continue
+                caminho = os.path.join(raiz, nome)
+                try:
+                    st = os.stat(caminho)
+                except OSError:
+                    continue
+                entradas.append((st.st_mtime, st.st_size, caminho))
+        return entradas
+
+    def tamanho_total(self):
+        """Bytes em disco; a pasta só é varrida na primeira chamada, depois vale o total mantido"""
+        with self._lock:
+            if self._tamanho is None: self._tamanho = sum(tam for _, tam, _ in self._entradas())
+            return self._tamanho
+
+    def despejar(self):
+        """Remove as entradas menos usadas até caber no limite (só varre a pasta quando o total passa dele)"""
+        if self.tamanho_total() <= self.limite_bytes: return 0
+        with self._lock:
+            entradas = self._entradas()
+            total = sum(tam for _, tam, _ in entradas)
+            self._tamanho = total
+            if total <= self.limite_bytes: return 0
+            removidos = 0
+            for _, tam, caminho in sorted(entradas):
+                if total <= self.limite_bytes: break
+                try:
+                    os.remove(caminho)
+                    total -= tam
+                    removidos += 1
+                except OSError:
+                    pass
+            self._tamanho = total
+            return removidos
+
+    def limpar(self):
+        for _, _, caminho in self._entradas():
+            try: os.remove(caminho)
+            except OSError: pass
+        self.hits = self.misses = 0
+        self._tamanho = None
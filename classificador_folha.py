@@ -0,0 +1,139 @@
+import os
+import re
+
+import pandas as pd
+
+# --- CLASSIFICADOR DE LINHAS DA FOLHA ---
+# Em vez de testar ~18 regex por linha (contrato + itens_map + totais), uma única
+# varredura procura os textos-gatilho de todos os itens; só os regex dos itens
+# cujo gatilho aparece na linha são executados. Linhas sem gatilho custam uma busca.
+
+ITEM_CONTRATO = "__contrato__"
+ITEM_TOTAIS = "__totais__"
+
+# Regex de Contrato (Mantido)
+REGEX_CONTRATO = re.compile(r'Admissão:\s*(\d{2}/\d{2}/\d{4}).*?Salário:\s*([,.\d]+)')
+# Regex de Totais (Mantido)
+REGEX_TOTAIS = re.compile(r'Proventos:\s*([\d\.,]+).*?Descontos:\s*([\d\.,]+).*?Liquido:\s*([\d\.,]+)')
+
+# Formatos de linha do catálogo ({t} = Texto do item, já escapado)
+# \s* depois do \d+ para aceitar "1 Salário" ou "1Salário"
+FORMATOS = {
+    "Evento Referência Valor": r'\d+\s*{t}\s+[\d\.,]+\s+([\d\.,]+)',
+    "Evento Valor": r'\d+\s*{t}\s+([\d\.,]+)',
+    "Evento Valor Fixo": r'\d+\s*{t}\s+[\d\.,]+',  # sem valor na linha: usa "Valor Fixo"
+    # Rodapé do funcionário; lookbehind para "F.G.T.S." não pegar a "Base F.G.T.S."
+    "Rodapé": r'(?<!Base ){t}:\s*([\d\.,]+)',
+}
+
+# Catálogo padrão (equivalente ao antigo itens_map); pode ser sobrescrito por config/itens_folha.csv
+ITENS_FOLHA_PADRAO = [
+    # PROVENTOS
+    {"Item": "Salário Provento", "Texto": "Salário", "Formato": "Evento Referência Valor", "Valor Fixo": ""},
+    {"Item": "Adiantamento Crédito", "Texto": "Adiantamento Crédito", "Formato": "Evento Referência Valor", "Valor Fixo": ""},
+    {"Item": "D.S.R. Sobre Horas Extras", "Texto": "D.S.R. Sobre Horas Extras", "Formato": "Evento Valor", "Valor Fixo": ""},
+    {"Item": "Horas Extras 50%", "Texto": "Horas Extras 50%", "Formato": "Evento Referência Valor", "Valor Fixo": ""},
+    {"Item": "Horas Extras 100%", "Texto": "Horas Extras 100%", "Formato": "Evento Referência Valor", "Valor Fixo": ""},
+    {"Item": "Reembolso Vale Transporte", "Texto": "Reembolso Vale Transporte", "Formato": "Evento Valor", "Valor Fixo": ""},
+    # DESCONTOS
+    {"Item": "INSS Sobre Salário", "Texto": "INSS Sobre Salário", "Formato": "Evento Referência Valor", "Valor Fixo": ""},
+    {"Item": "IRRF Sobre Salário", "Texto": "IRRF Sobre Salário", "Formato": "Evento Referência Valor", "Valor Fixo": ""},
+    {"Item": "Desc. Vale Transporte", "Texto": "Desc. Vale Transporte", "Formato": "Evento Referência Valor", "Valor Fixo": ""},
+    {"Item": "Contribuição Assistencial", "Texto": "Contribuição Assistencial", "Formato": "Evento Valor Fixo", "Valor Fixo": "10,00"},
+    {"Item": "Faltas", "Texto": "Faltas", "Formato": "Evento Referência Valor", "Valor Fixo": ""},
+    # BASES (Rodapé do funcionário)
+    {"Item": "Base INSS Empresa", "Texto": "Base INSS Empresa", "Formato": "Rodapé", "Valor Fixo": ""},
+    {"Item": "Base INSS Funcionário", "Texto": "Base INSS Funcionário", "Formato": "Rodapé", "Valor Fixo": ""},
+    {"Item": "Base F.G.T.S.", "Texto": "Base F.G.T.S.", "Formato": "Rodapé", "Valor Fixo": ""},
+    {"Item": "F.G.T.S.", "Texto": "F.G.T.S.", "Formato": "Rodapé", "Valor Fixo": ""},
+    {"Item": "Base I.R.R.F.", "Texto": "Base I.R.R.F.", "Formato": "Rodapé", "Valor Fixo": ""},
+]
+
+
+def itens_folha_padrao():
+    return pd.DataFrame(ITENS_FOLHA_PADRAO)
+
+
+def carregar_itens_folha(caminho):
+    """Lê o catálogo de itens do CSV de configuração; usa o padrão se não existir"""
+    if caminho and os.path.exists(caminho):
+        return pd.read_csv(caminho, dtype=str, keep_default_na=False)
+    return itens_folha_padrao()
+
+
+class ClassificadorLinhas:
+    """Compila o catálogo de itens em um único gatilho + regex por item"""
+
+    def __init__(self, df_itens=None):
+        if df_itens is None: df_itens = itens_folha_padrao()
+        self.itens = []  # (nome do item, regex, valor fixo)
+        gatilhos = {}    # texto-gatilho -> itens que ele dispara
+        for _, row in df_itens.iterrows():
+            texto = str(row['Texto']).strip()
+            formato = str(row['Formato']).strip()
+            if not texto or formato not in FORMATOS:
+                raise ValueError(f"Item de folha inválido: '{row['Item']}' (Formato '{formato}')")
+            valor_fixo = row.get('Valor Fixo', "")
+            valor_fixo = "" if pd.isna(valor_fixo) else str(valor_fixo).strip()
+            rgx = re.compile(FORMATOS[formato].format(t=re.escape(texto)))
+            gatilhos.setdefault(texto, []).append(len(self.itens))
+            self.itens.append((str(row['Item']).strip(), rgx, valor_fixo))
+
+        # Âncoras de contrato/totais entram na mesma varredura
+        gatilhos.setdefault("Admissão:", []).append(ITEM_CONTRATO)
+        gatilhos.setdefault("Proventos:", []).append(ITEM_TOTAIS)
+
+        # A varredura consome o gatilho encontrado; gatilhos contidos nele (ex.: "F.G.T.S." dentro de
+        # "Base F.G.T.S.") ou que começam no meio dele também viram candidatos. Candidato extra só
+        # custa uma busca a mais, pois o regex do item confirma (ou não) a linha.
+        self._candidatos = {}
+        for texto in gatilhos:
+            alvo = []
+            for outro, itens in gatilhos.items():
+                if outro in texto or any(outro.startswith(texto[i:]) for i in range(1, len(texto))):
+                    alvo.extend(itens)
+            self._candidatos[texto] = alvo
+
+        alternancia = "|".join(re.escape(t) for t in sorted(gatilhos, key=len, reverse=True))
+        self._gatilho = re.compile(alternancia)
+
+    def classificar(self, linha):
+        """Retorna [(item, valor)] encontrados na linha, na ordem contrato -> itens -> totais.
+        Para contrato o valor é (admissão, salário); para totais, (proventos, descontos, líquido)."""
+        encontrados = set()
+        for m in self._gatilho.finditer(linha):
+            encontrados.update(self._candidatos[m.group(0)])
+        if not encontrados: return []
+
+        resultado = []
+        if ITEM_CONTRATO in encontrados:
+            match_ct = REGEX_CONTRATO.search(linha)
+            if match_ct: resultado.append((ITEM_CONTRATO, match_ct.groups()))
+
+        for i in sorted(x for x in encontrados if isinstance(x, int)):
+            item, rgx, valor_fixo = self.itens[i]
+            match_item = rgx.search(linha)
+            if match_item:
+                resultado.append((item, match_item.group(1) if rgx.groups else valor_fixo))
+
+        if ITEM_TOTAIS in encontrados:
+            match_tot = REGEX_TOTAIS.search(linha)
+            if match_tot: resultado.append((ITEM_TOTAIS, match_tot.groups()))
+        return resultado
+
+    @property
+    def nomes_itens(self):
+        return [item for item, _, _ in self.itens]
+
+
+LIMITE_CACHE = 16
+_classificadores = {}
+
+def obter_classificador(df_itens=None):
+    """Classificador compilado uma vez por catálogo (por processo); cada edição do catálogo gera outro,
+    então o cache é limitado como o de identificador_regras"""
+    chave = "" if df_itens is None else df_itens.to_csv(index=False)
+    if chave not in _classificadores:
+        if len(_classificadores) >= LIMITE_CACHE: _classificadores.clear()
+        _classificadores[chave] = ClassificadorLinhas(df_itens)
+    return _classificadores[chave]
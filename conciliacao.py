@@ -0,0 +1,91 @@
+import pandas as pd
+
+from consolidacao import CHAVES, normalizar_cnpj, normalizar_codigo
+
+# --- CONCILIAÇÃO ENTRE FONTES (Folha x Líquido / Assistencial) ---
+# Sem Streamlit. Cada lado vira um índice hash por chave normalizada (dígitos do CNPJ + código
+# do funcionário; + CPF quando os dois lados têm) com o valor somado por chave; uma única
+# junção externa indexada separa as chaves conferidas das que faltam em um dos lados.
+# Substitui o PROCV no Excel exportado.
+
+# Rótulo -> (fonte, coluna da Folha, coluna da fonte)
+CONFERENCIAS = {
+    "Líquido": ("Liquido", "Líquido a Receber", "Valor Líquido"),
+    "Assistencial": ("Assistencial", "Contribuição Assistencial", "Valor Assistencial"),
+}
+TOLERANCIA_PADRAO = 0.01
+VALOR_FOLHA, VALOR_FONTE, DIFERENCA = "Valor Folha", "Valor Fonte", "Diferença"
+
+def indexar(df, coluna, chaves):
+    """Índice por chave normalizada: valor somado, CNPJ/nome/CPF da primeira linha e número de linhas"""
+    dados = pd.DataFrame({
+        "KEY_COD": normalizar_codigo(df['Código']), "KEY_CNPJ": normalizar_cnpj(df['Empresa CNPJ']),
+        "Empresa CNPJ": df['Empresa CNPJ'].astype(str),
+        "Funcionário": df['Funcionário'].astype(str) if 'Funcionário' in df.columns else "",
+        "Valor": pd.to_numeric(df[coluna], errors='coerce').fillna(0.0),
+    })
+    if 'CPF' in df.columns: dados['CPF'] = df['CPF'].astype(str)
+    agg = {c: 'first' for c in dados.columns if c not in chaves and c != "Valor"}
+    return dados.groupby(chaves, sort=False).agg(**{c: (c, f) for c, f in agg.items()}, Valor=("Valor", "sum"), Linhas=("Valor", "size"))
+
+def tipos_folha(df_folha):
+    """Tipos de folha presentes (ex.: Adiantamento e Folha Mensal carregados juntos)"""
+    if df_folha is None or 'Tipo Folha' not in df_folha.columns: return []
+    return sorted(df_folha['Tipo Folha'].dropna().astype(str).unique())
+
+def conciliar(df_folha, df_fonte, coluna_folha, coluna_fonte, tolerancia=TOLERANCIA_PADRAO, tipo_folha=None):
+    """Confere coluna_folha x coluna_fonte por funcionário. Retorna dict de tabelas:
+    Divergências (|diferença| > tolerância), Tolerância (diferença até a tolerância), Só na Folha,
+    Só na Fonte e Resumo; None se a Folha não tiver a coluna.
+    Funcionário da Folha com valor zero e ausente na fonte não conta como faltante.
+    Com mais de um Tipo Folha carregado, `tipo_folha` é obrigatório: a fonte traz um valor por
+    funcionário, e somar Adiantamento + Folha Mensal faria quase todos divergirem (ValueError)."""
+    if coluna_folha not in df_folha.columns: return None
+    if tipo_folha is not None and 'Tipo Folha' in df_folha.columns:
+        df_folha = df_folha[df_folha['Tipo Folha'].astype(str) == tipo_folha]
+    elif len(tipos_folha(df_folha)) > 1:
+        raise ValueError(f"Folha com mais de um tipo ({', '.join(tipos_folha(df_folha))}): escolha o Tipo Folha a conciliar.")
+    chaves = CHAVES + (['CPF'] if 'CPF' in df_folha.columns and 'CPF' in df_fonte.columns else [])
+
+    juntos = indexar(df_folha, coluna_folha, chaves).join(
+        indexar(df_fonte, coluna_fonte, chaves), how='outer', lsuffix=" Folha", rsuffix=" Fonte")
+    na_folha, na_fonte = juntos["Linhas Folha"].notna(), juntos["Linhas Fonte"].notna()
+    juntos[VALOR_FOLHA] = juntos.pop("Valor Folha").fillna(0.0)
+    juntos[VALOR_FONTE] = juntos.pop("Valor Fonte").fillna(0.0)
+    juntos[DIFERENCA] = (juntos[VALOR_FOLHA] - juntos[VALOR_FONTE]).round(2)
+    for c in ["Empresa CNPJ", "Funcionário"]:
+        juntos[c] = juntos.pop(f"{c} Folha").fillna(juntos.pop(f"{c} Fonte"))
+    juntos = juntos.reset_index()
+    juntos['Código'] = juntos['KEY_COD']
+    colunas = ["Empresa CNPJ", "Código", "Funcionário"] + (["CPF"] if "CPF" in juntos.columns else []) + [VALOR_FOLHA, VALOR_FONTE, DIFERENCA]
+
+    ambos = (na_folha & na_fonte).to_numpy()
+    diferenca = juntos[DIFERENCA].abs()
+    tabelas = {
+        "Divergências": juntos.loc[ambos & (diferenca > tolerancia).to_numpy(), colunas],
+        "Tolerância": juntos.loc[ambos & ((diferenca > 0) & (diferenca <= tolerancia)).to_numpy(), colunas],
+        "Só na Folha": juntos.loc[(na_folha & ~na_fonte).to_numpy() & (juntos[VALOR_FOLHA] != 0).to_numpy(), colunas],
+        "Só na Fonte": juntos.loc[(~na_folha & na_fonte).to_numpy(), colunas],
+    }
+    tabelas = {nome: df.sort_values([DIFERENCA], key=abs, ascending=False, kind='stable').reset_index(drop=True) for nome, df in tabelas.items()}
+    tabelas["Resumo"] = pd.DataFrame([
+        {"Situação": "Conferidos", "Funcionários": int(ambos.sum()), DIFERENCA: round(float(juntos.loc[ambos, DIFERENCA].sum()), 2)},
+        *({"Situação": nome, "Funcionários": len(df), DIFERENCA: round(float(df[DIFERENCA].sum()), 2)} for nome, df in tabelas.items()),
+    ])
+    return tabelas
+
+def conciliar_fontes(dfs, tolerancia=TOLERANCIA_PADRAO, tipo_folha=None):
+    """Todas as conferências possíveis com as fontes carregadas: {rótulo: tabelas de conciliar()}"""
+    df_folha = dfs.get('Folha')
+    if df_folha is None or df_folha.empty: return {}
+    resultado = {}
+    for rotulo, (fonte, coluna_folha, coluna_fonte) in CONFERENCIAS.items():
+        df_fonte = dfs.get(fonte)
+        if df_fonte is None or df_fonte.empty: continue
+        tabelas = conciliar(df_folha, df_fonte, coluna_folha, coluna_fonte, tolerancia, tipo_folha)
+        if tabelas is not None: resultado[rotulo] = tabelas
+    return resultado
+
+def tabelas_exportacao(resultado):
+    """Abas do arquivo exportado: "<rótulo> - <tabela>" (limite de 31 caracteres do Excel)"""
+    return {f"{rotulo} - {nome}"[:31]: df for rotulo, tabelas in resultado.items() for nome, df in tabelas.items()}
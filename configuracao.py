@@ -0,0 +1,46 @@
+import os
+
+import pandas as pd
+
+# --- CAMINHOS E REGRAS PADRÃO (compartilhados entre app.py e processamento em lote) ---
+PASTA_CONFIG = "config"
+ARQUIVO_REGRAS = os.path.join(PASTA_CONFIG, "regras_processamento.csv")
+ARQUIVO_ITENS_FOLHA = os.path.join(PASTA_CONFIG, "itens_folha.csv")
+ARQUIVO_HISTORICO = os.path.join(PASTA_CONFIG, "historico.sqlite")
+PASTA_RETENCAO = "retencao"
+PASTA_CACHE = "cache_parse"
+PASTA_EXPORTACAO = "exportacoes"
+
+# Categorias de documento = subpastas de retencao/<data>/
+CATEGORIAS = ["Folha", "Assistencial", "Liquido", "Extras"]
+
+# Dados Iniciais (Padrão)
+REGRAS_PADRAO = [
+    # EXTRAS
+    {"Texto Identificador": "82 - Hora Extras 100%", "Nome Evento": "Hora Extras 100%", "Categoria": "Extras"},
+    {"Texto Identificador": "106 - Adicional Noturno Horas 20%", "Nome Evento": "Adicional Noturno Horas 20%", "Categoria": "Extras"},
+    {"Texto Identificador": "17 - Horas Extras 50%", "Nome Evento": "Horas Extras 50%", "Categoria": "Extras"},
+    {"Texto Identificador": "5 - D.S.R. Sobre Horas Extras", "Nome Evento": "D.S.R. Sobre Horas Extras", "Categoria": "Extras"},
+    {"Texto Identificador": "1025 - PTS", "Nome Evento": "PTS", "Categoria": "Extras"},
+    {"Texto Identificador": "152 - DSR Adicional Noturno", "Nome Evento": "DSR Adicional Noturno", "Categoria": "Extras"},
+    {"Texto Identificador": "1394 - Bonificação Extraordinária", "Nome Evento": "Bonificação Extraordinária", "Categoria": "Extras"},
+    {"Texto Identificador": "1173 - Reembolso Vale Refeição", "Nome Evento": "Reembolso Vale Refeição", "Categoria": "Extras"},
+    {"Texto Identificador": "1098 - Reembolso Vale Transporte", "Nome Evento": "Reembolso Vale Transporte", "Categoria": "Extras"},
+    # FOLHA
+    {"Texto Identificador": "Folha de Pagamento - Adiantamento", "Nome Evento": "Adiantamento", "Categoria": "Folha"},
+    {"Texto Identificador": "Folha de Pagamento", "Nome Evento": "Folha Mensal", "Categoria": "Folha"}
+]
+
+
+def regras_padrao():
+    return pd.DataFrame(REGRAS_PADRAO)
+
+
+def ler_regras(caminho=ARQUIVO_REGRAS):
+    """Lê as regras do CSV (erros de leitura sobem para quem chamou); padrão se não existir"""
+    if os.path.exists(caminho): return pd.read_csv(caminho)
+    return regras_padrao()
+
+
+def filtrar_regras(df_regras, categoria):
+    return df_regras[df_regras['Categoria'] == categoria]
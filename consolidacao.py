@@ -0,0 +1,146 @@
+import hashlib
+
+import pandas as pd
+
+# --- CONSOLIDAÇÃO (Folha + Assistencial + Líquido + Extras) ---
+# Sem Streamlit: usada pela aba Consolidação e pelo processamento em lote.
+# Chaves normalizadas de forma vetorizada (Código -> int, CNPJ -> categórico com categorias
+# comuns a todas as fontes). Cada fonte lateral é reduzida a uma linha por chave antes de uma
+# única junção indexada, então a junção nunca multiplica as linhas da base.
+# ConsolidacaoIncremental guarda a fonte preparada por impressão digital do conteúdo: quando só
+# uma fonte muda, apenas ela é preparada de novo e a junção final é refeita.
+
+CHAVES = ['KEY_COD', 'KEY_CNPJ']
+FONTES_LATERAIS = ['Assistencial', 'Liquido', 'Extras']
+
+def _por_valor_distinto(serie, funcao):
+    """Aplica a normalização só nos valores distintos e expande pelos códigos (CNPJ/Código se repetem muito)"""
+    codigos, distintos = pd.factorize(serie, use_na_sentinel=False)
+    return pd.Series(funcao(pd.Series(distintos)).to_numpy()[codigos], index=serie.index)
+
+def normalizar_cnpj(serie):
+    """Só os dígitos do CNPJ ("Não Encontrado"/vazio vira "")"""
+    return _por_valor_distinto(serie, lambda s: s.astype(str).str.replace(r'\D', '', regex=True))
+
+def normalizar_codigo(serie):
+    return _por_valor_distinto(serie, lambda s: pd.to_numeric(s, errors='coerce').fillna(0).astype(int))
+
+def preparar(df_in, origem):
+    df = df_in.assign(KEY_COD=normalizar_codigo(df_in['Código']), KEY_CNPJ=normalizar_cnpj(df_in['Empresa CNPJ']))
+    if origem == 'Folha':
+        if 'Tipo Folha' not in df.columns: df['Tipo Folha'] = 'Mensal'
+        df['KEY_TIPO'] = df['Tipo Folha'].astype(str) + "_" + df['Arquivo'].astype(str)
+        return df
+
+    cols_renomear = {c: f"{c}_{origem}" for c in df.columns if c not in ['Empresa', 'Funcionário', 'KEY_COD', 'KEY_CNPJ', 'Código', 'Empresa CNPJ']}
+    df = df.rename(columns=cols_renomear)
+    return df.drop(columns=['Empresa', 'Funcionário', 'Função', 'Arquivo', 'Código', 'Empresa CNPJ', 'Tipo Folha'], errors='ignore')
+
+def agregar_por_chave(df, origem, avisos=None):
+    """Uma linha por (Código, CNPJ): numéricos somados, demais colunas com o primeiro valor.
+    Chaves repetidas são reportadas em `avisos` (antes viravam linhas duplicadas na junção)."""
+    repetidas = df.duplicated(CHAVES, keep=False)
+    if not repetidas.any(): return df
+    if avisos is not None:
+        n = len(df.loc[repetidas, CHAVES].drop_duplicates())
+        avisos.append(f"{origem}: {n} funcionário(s) com mais de uma linha; valores somados antes da junção.")
+    cols_num = df.select_dtypes(include=['number']).columns
+    agg = {c: 'sum' if c in cols_num else 'first' for c in df.columns if c not in CHAVES}
+    return df.groupby(CHAVES, as_index=False, sort=False, observed=True).agg(agg)
+
+def unificar_chaves(lista):
+    """CNPJ como categórico com as mesmas categorias (ordenadas) em todas as fontes: junção por códigos inteiros"""
+    categorias = sorted(set().union(*(df['KEY_CNPJ'].unique() for df in lista)))
+    tipo = pd.CategoricalDtype(categorias)
+    return [df.assign(KEY_CNPJ=df['KEY_CNPJ'].astype(tipo)) for df in lista]
+
+def _preencher(serie, valor):
+    """fillna que também aceita colunas categóricas (o valor vira uma categoria nova)"""
+    if isinstance(serie.dtype, pd.CategoricalDtype) and valor not in serie.cat.categories:
+        serie = serie.cat.add_categories([valor])
+    return serie.fillna(valor)
+
+def preparar_fonte(df, origem, avisos=None):
+    """Fonte pronta para a junção: chaves normalizadas (e, nas laterais, uma linha por chave)"""
+    if origem == 'Folha': return preparar(df, 'Folha')
+    return agregar_por_chave(preparar(df, origem), origem, avisos)
+
+def juntar(preparados):
+    """Junta as fontes preparadas ({origem: df}) por (Código, CNPJ). Retorna None se não houver dados."""
+    ordem = [o for o in ['Folha'] + FONTES_LATERAIS if o in preparados]
+    if not ordem: return None
+
+    base, *laterais = unificar_chaves([preparados[o] for o in ordem])
+    df_final = base
+    for df_t in laterais:
+        df_final = df_final.join(df_t.set_index(CHAVES), on=CHAVES, how='left')
+
+    # Preenche só as colunas que têm vazios (sem cópia do frame inteiro)
+    cols_num = df_final.select_dtypes(include=['number']).columns
+    for c in df_final.columns[df_final.isna().any()]:
+        df_final[c] = _preencher(df_final[c], 0.0 if c in cols_num else "-")
+
+    cols_gb = [c for c in ['KEY_COD', 'KEY_CNPJ', 'KEY_TIPO', 'Funcionário', 'Empresa', 'Tipo Folha', 'Arquivo'] if c in df_final.columns]
+    demais = [c for c in df_final.columns if c not in cols_gb]
+    if df_final.duplicated(cols_gb).any():
+        agg = {c: 'sum' if c in cols_num else 'first' for c in demais}
+        df_cons = df_final.groupby(cols_gb, as_index=False, observed=True).agg(agg)
+    else:
+        # Sem grupos repetidos o groupby só ordenaria: ordena direto
+        df_cons = df_final.sort_values(cols_gb, kind='stable')[cols_gb + demais].reset_index(drop=True)
+
+    df_cons['Código'] = df_cons['KEY_COD']
+    return df_cons.drop(columns=['KEY_COD', 'KEY_CNPJ', 'KEY_TIPO'], errors='ignore')
+
+def consolidar(dfs, avisos=None):
+    """Junta as tabelas de origem por (Código, CNPJ). Retorna None se não houver dados.
+    Mensagens sobre chaves duplicadas nas fontes são adicionadas a `avisos` (lista), se informada."""
+    return juntar({o: preparar_fonte(dfs[o], o, avisos) for o in ['Folha'] + FONTES_LATERAIS if o in dfs and not dfs[o].empty})
+
+# --- CONSOLIDAÇÃO INCREMENTAL ---
+def impressao_tabela(df):
+    """Impressão digital do conteúdo de uma tabela (colunas, tipos e valores; o índice não conta)"""
+    h = hashlib.sha256(repr([(str(c), str(t)) for c, t in df.dtypes.items()]).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()[:16]
+
+class ConsolidacaoIncremental:
+    """Consolidação como um pequeno grafo de dependências: fonte -> fonte preparada -> junção -> agregados.
+    Cada nó é refeito só quando a impressão digital das suas entradas muda."""
+
+    def __init__(self):
+        self._preparados = {}   # origem -> (impressão, df preparado, avisos)
+        self._agregados = {}    # (chave da consolidação, nome) -> valor
+        self.chave = None
+        self.resultado = None
+
+    def consolidar(self, dfs, impressoes=None, avisos=None):
+        """Como consolidar(); `impressoes` ({origem: impressão}) evita recalcular o hash das fontes já conhecidas.
+        A chave da consolidação (impressões de todas as fontes) fica em self.chave."""
+        impressoes = impressoes or {}
+        preparados, chave = {}, []
+        for origem in ['Folha'] + FONTES_LATERAIS:
+            if origem not in dfs or dfs[origem].empty:
+                self._preparados.pop(origem, None)
+                continue
+            impressao = impressoes.get(origem) or impressao_tabela(dfs[origem])
+            memo = self._preparados.get(origem)
+            if memo is None or memo[0] != impressao:
+                avisos_fonte = []
+                memo = self._preparados[origem] = (impressao, preparar_fonte(dfs[origem], origem, avisos_fonte), avisos_fonte)
+            if avisos is not None: avisos.extend(memo[2])
+            preparados[origem] = memo[1]
+            chave.append((origem, impressao))
+
+        chave = tuple(chave)
+        if chave != self.chave:
+            self.chave, self.resultado = chave, juntar(preparados)
+            self._agregados = {k: v for k, v in self._agregados.items() if k[0] == chave}
+        return self.resultado
+
+    def agregado(self, chave, nome, funcao, df):
+        """funcao(df) memorizada pela chave da consolidação que gerou df (recalculada só quando ela muda)"""
+        if (chave, nome) not in self._agregados:
+            if len(self._agregados) >= 64: self._agregados.clear()
+            self._agregados[(chave, nome)] = funcao(df)
+        return self._agregados[(chave, nome)]
@@ -0,0 +1,89 @@
+from itertools import chain
+
+import pandas as pd
+
+# --- CONSTRUÇÃO COLUNAR DOS REGISTROS ---
+# Os extratores acrescentam valores direto em listas por coluna (uma lista por campo do esquema),
+# sem guardar um dict por funcionário. Valores monetários ficam como texto ("1.234,56") até a
+# montagem do DataFrame, onde são convertidos de uma vez por coluna; campos repetitivos viram categóricos.
+
+TEXTO = "texto"
+CATEGORIA = "categoria"
+MOEDA = "moeda"
+
+ESQUEMA_LIQUIDO = {
+    "Empresa CNPJ": CATEGORIA, "Código": TEXTO, "Funcionário": TEXTO, "CPF": TEXTO,
+    "Data Pagto": TEXTO, "Valor Líquido": MOEDA, "Arquivo": CATEGORIA,
+}
+
+ESQUEMA_ASSISTENCIAL = {
+    "Empresa CNPJ": CATEGORIA, "Código": TEXTO, "Funcionário": TEXTO, "Função": CATEGORIA,
+    "Admissão": TEXTO, "Salário Base": MOEDA, "Valor Assistencial": MOEDA, "Arquivo Original": CATEGORIA,
+}
+
+# Extras: texto puro (a tabela final é o pivot por Tipo Evento)
+ESQUEMA_EXTRAS = {
+    "Empresa CNPJ": TEXTO, "Código": TEXTO, "Funcionário": TEXTO, "Tipo Evento": TEXTO, "Valor": MOEDA,
+}
+
+
+def esquema_folha(nomes_itens):
+    """Colunas fixas + uma coluna monetária por item do catálogo da folha"""
+    esquema = {
+        "Empresa": CATEGORIA, "Empresa CNPJ": CATEGORIA, "Código": TEXTO, "Funcionário": TEXTO,
+        "Função": CATEGORIA, "Arquivo": CATEGORIA, "Tipo Folha": CATEGORIA,
+        "Total Proventos": MOEDA, "Total Descontos": MOEDA, "Líquido a Receber": MOEDA,
+    }
+    for item in nomes_itens: esquema[item] = MOEDA
+    esquema["Admissão"] = TEXTO
+    esquema["Salário Base Contratual"] = MOEDA
+    return esquema
+
+
+class ConstrutorColunar:
+    """Acumula registros em listas por coluna, na ordem do esquema"""
+
+    def __init__(self, esquema):
+        self.esquema = esquema
+        self.colunas = {c: [] for c in esquema}
+        self._listas = list(self.colunas.values())
+
+    def adicionar(self, *valores):
+        """Valores posicionais, na ordem das colunas do esquema"""
+        for lista, valor in zip(self._listas, valores): lista.append(valor)
+
+    def adicionar_registro(self, registro):
+        """Registro parcial (dict); colunas ausentes ficam vazias"""
+        for coluna, lista in self.colunas.items(): lista.append(registro.get(coluna))
+
+    def __len__(self):
+        return len(self._listas[0]) if self._listas else 0
+
+
+def converter_moeda(valores):
+    """Texto no formato brasileiro ("1.234,56") -> float, coluna inteira de uma vez.
+    Vazio/ausente/inválido vira 0.0."""
+    texto = pd.Series(valores, dtype="string").str.replace(".", "", regex=False).str.replace(",", ".", regex=False)
+    texto = texto.mask(texto == "")
+    try:
+        numeros = texto.astype("float64")
+    except (TypeError, ValueError):
+        # Algum valor fora do padrão: conversão tolerante (bem mais lenta), inválidos viram 0.0
+        numeros = pd.to_numeric(texto, errors="coerce").astype("float64")
+    return numeros.fillna(0.0)
+
+
+def montar_dataframe(lista_colunas, esquema):
+    """Junta as colunas de vários arquivos e converte os tipos em bloco"""
+    lista_colunas = [c for c in lista_colunas if c]
+    if not lista_colunas: return pd.DataFrame()
+    tamanhos = [len(next(iter(c.values()))) for c in lista_colunas]
+    if not sum(tamanhos): return pd.DataFrame()
+
+    dados = {}
+    for coluna, tipo in esquema.items():
+        valores = list(chain.from_iterable(c.get(coluna, [None] * n) for c, n in zip(lista_colunas, tamanhos)))
+        if tipo == MOEDA: dados[coluna] = converter_moeda(valores)
+        elif tipo == CATEGORIA: dados[coluna] = pd.Categorical(valores)
+        else: dados[coluna] = pd.Series(valores, dtype="str")
+    return pd.DataFrame(dados)
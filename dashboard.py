@@ -0,0 +1,41 @@
+import pandas as pd
+
+# --- AGREGADOS DO DASHBOARD ---
+# Sem Streamlit. Os cubos (somas por CNPJ, Tipo Folha e Função) são montados uma vez por
+# consolidação e guardados (ConsolidacaoIncremental.agregado); os gráficos leem só esses
+# agregados pequenos, com as dimensões de muitos valores cortadas em top-N + "Outros".
+
+COLUNAS_TOTAIS = ['Total Proventos', 'Líquido a Receber', 'Total Extras_Extras']
+DIMENSOES = {"CNPJ": "Empresa CNPJ", "Tipo Folha": "Tipo Folha", "Função": "Função"}
+EVENTOS = ['Total Proventos', 'Líquido a Receber', 'Horas Extras 50%', 'Horas Extras 100%', 'INSS Sobre Salário',
+           'F.G.T.S.', 'Horas Extras 50%_Extras', 'Hora Extras 100%_Extras', 'Total Extras_Extras']
+ROTULO_OUTROS = "Outros"
+FUNCIONARIOS = "Funcionários"
+
+def totais_dashboard(df):
+    """Somas das colunas principais (0 quando a fonte não foi carregada) e número de registros"""
+    return {"Registros": len(df), **{c: float(df[c].sum()) if c in df.columns else 0.0 for c in COLUNAS_TOTAIS}}
+
+def montar_cubos(df):
+    """{"totais": {...}, "eventos": [colunas somadas], dimensão: DataFrame (uma linha por valor, somas + funcionários)}"""
+    eventos = [c for c in EVENTOS if c in df.columns]
+    cubos = {"totais": totais_dashboard(df), "eventos": eventos}
+    for nome, coluna in DIMENSOES.items():
+        if coluna not in df.columns: continue
+        chave = df[coluna].astype(str).rename(nome)
+        cubo = df[eventos].groupby(chave, observed=True, sort=False).sum()
+        cubo[FUNCIONARIOS] = chave.value_counts(sort=False)
+        cubos[nome] = cubo.reset_index()
+    return cubos
+
+def top_n(cubo, dimensao, medida, n):
+    """As n linhas de maior `medida`; as demais somadas numa linha "Outros" (ordenado de forma decrescente)"""
+    ordenado = cubo.sort_values(medida, ascending=False, kind='stable')
+    if len(ordenado) <= n: return ordenado.reset_index(drop=True)
+    resto = {c: ordenado[c].iloc[n:].sum() for c in ordenado.columns if c != dimensao}
+    outros = pd.DataFrame([{dimensao: f"{ROTULO_OUTROS} ({len(ordenado) - n})", **resto}])
+    return pd.concat([ordenado.iloc[:n], outros], ignore_index=True)
+
+def eventos_por(cubo, dimensao, eventos):
+    """Cubo em formato longo (dimensão, Evento, Valor) para gráfico de barras agrupadas"""
+    return cubo.melt(id_vars=[dimensao], value_vars=eventos, var_name="Evento", value_name="Valor")
@@ -0,0 +1,142 @@
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from memoria import AmostradorMemoria, MonitorMemoria
+
+# --- DIAGNÓSTICO: TEMPOS POR ARQUIVO/ETAPA E PERFIL OPCIONAL ---
+# MedicaoArquivo roda dentro dos extratores (inclusive nos processos do pool) e volta no
+# campo "metricas" do resultado; RegistroEtapas mede as etapas da interface (extração,
+# montagem, consolidação, exportação). Sem Streamlit.
+
+_acompanhamento = threading.local()
+
+
+class ExtracaoCancelada(BaseException):
+    """Interrompe a extração a pedido do usuário. Herda de BaseException para atravessar
+    os `except Exception` dos extratores (que transformam falhas em mensagens de erro)."""
+
+
+@contextmanager
+def acompanhar(progresso):
+    """Registra `progresso(paginas_feitas, total)` para a thread atual; se ele retornar False, a extração é cancelada"""
+    anterior = getattr(_acompanhamento, "progresso", None)
+    _acompanhamento.progresso = progresso
+    try:
+        yield
+    finally:
+        _acompanhamento.progresso = anterior
+
+
+def notificar_pagina(feitas, total):
+    progresso = getattr(_acompanhamento, "progresso", None)
+    if progresso is not None and progresso(feitas, total) is False: raise ExtracaoCancelada()
+
+
+class MedicaoArquivo(MonitorMemoria):
+    """Contadores de um arquivo: tempo de extração de texto x parse, páginas (varridas e lidas por inteiro),
+    linhas, correspondências e pico de RSS"""
+
+    def __init__(self):
+        super().__init__()
+        self.inicio = time.perf_counter()
+        self.tempo_texto = 0.0
+        self.paginas = 0
+        self.lidas = 0
+        self.linhas = 0
+        self.correspondencias = 0
+
+    def pagina_varrida(self, duracao):
+        self.tempo_texto += duracao
+        self.paginas += 1
+        self.amostrar()
+
+    def pagina_lida(self, texto, duracao):
+        self.tempo_texto += duracao
+        self.lidas += 1
+        if texto: self.linhas += texto.count("\n") + 1
+        self.amostrar()
+
+    def resumo(self, registros):
+        total = time.perf_counter() - self.inicio
+        return {
+            "paginas": self.paginas, "paginas_puladas": self.paginas - self.lidas,
+            "linhas": self.linhas, "registros": registros, "correspondencias": self.correspondencias,
+            "tempo_texto_s": round(self.tempo_texto, 4), "tempo_parse_s": round(max(0.0, total - self.tempo_texto), 4),
+            "tempo_total_s": round(total, 4),
+            "paginas_por_s": round(self.paginas / total, 1) if total else None,
+            "linhas_por_s": round(self.linhas / total, 1) if total else None,
+            "pico_rss_mb": self.pico_mb,
+        }
+
+
+def somar_metricas(lista, registros):
+    """Métricas de um arquivo lido em vários trechos: contadores e tempos somados (tempo de CPU
+    dos processos, não de relógio), pico de RSS = maior pico entre os processos"""
+    soma = {c: sum(m.get(c) or 0 for m in lista)
+            for c in ("paginas", "paginas_puladas", "linhas", "correspondencias", "tempo_texto_s", "tempo_parse_s", "tempo_total_s")}
+    total = soma["tempo_total_s"]
+    return {
+        "paginas": soma["paginas"], "paginas_puladas": soma["paginas_puladas"],
+        "linhas": soma["linhas"], "registros": registros, "correspondencias": soma["correspondencias"],
+        "tempo_texto_s": round(soma["tempo_texto_s"], 4), "tempo_parse_s": round(soma["tempo_parse_s"], 4),
+        "tempo_total_s": round(total, 4),
+        "paginas_por_s": round(soma["paginas"] / total, 1) if total else None,
+        "linhas_por_s": round(soma["linhas"] / total, 1) if total else None,
+        "pico_rss_mb": max((m.get("pico_rss_mb") or 0 for m in lista), default=None),
+        "trechos": len(lista),
+    }
+
+
+class RegistroEtapas:
+    """Última medição de cada (etapa, categoria); reprocessar a mesma etapa substitui a anterior"""
+
+    def __init__(self):
+        self.etapas = {}
+
+    @contextmanager
+    def medir(self, etapa, categoria=""):
+        """Bloco medido; o dict entregue aceita informações extras (ex.: linhas, arquivos).
+        O pico de RSS é do processo inteiro, amostrado durante o bloco."""
+        extras = {}
+        inicio = time.perf_counter()
+        try:
+            with AmostradorMemoria() as monitor:
+                yield extras
+        finally:
+            duracao = time.perf_counter() - inicio
+            self.etapas[(etapa, categoria)] = {
+                "Etapa": etapa, "Categoria": categoria, "Duração (s)": round(duracao, 4),
+                "Pico RSS (MB)": monitor.pico_mb, "RSS ao final (MB)": monitor.final_mb,
+                "Horário": datetime.now().strftime("%H:%M:%S"), **extras,
+            }
+
+    def tabela(self):
+        return list(self.etapas.values())
+
+    def limpar(self):
+        self.etapas.clear()
+
+
+def iniciar_perfil():
+    perfil = cProfile.Profile()
+    perfil.enable()
+    return perfil
+
+
+def encerrar_perfil(perfil, linhas=40):
+    """Para o cProfile e devolve o relatório (funções por tempo acumulado) em texto"""
+    perfil.disable()
+    saida = io.StringIO()
+    pstats.Stats(perfil, stream=saida).strip_dirs().sort_stats("cumulative").print_stats(linhas)
+    return saida.getvalue()
+
+
+def relatorio_json(etapas, arquivos, perfil=None):
+    return json.dumps({"gerado_em": datetime.now().isoformat(timespec="seconds"), "etapas": etapas,
+                       "arquivos": arquivos, "perfil": perfil}, ensure_ascii=False, indent=2, default=str)
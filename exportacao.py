@@ -0,0 +1,109 @@
+import hashlib
+import io
+import os
+import threading
+import zipfile
+
+import pandas as pd
+import xlsxwriter
+
+# --- EXPORTAÇÃO DO RELATÓRIO (Excel / Parquet / CSV) ---
+# Sem Streamlit. O arquivo só é gerado quando pedido e fica em disco endereçado pela impressão
+# digital do conteúdo (tabelas + formato): pedir de novo os mesmos dados não regera nada.
+# O Excel é escrito linha a linha com o modo constant_memory do xlsxwriter (só a linha atual
+# fica em memória), em vez do to_excel do pandas, que escreve coluna a coluna.
+
+try:
+    import pyarrow  # noqa: F401 (engine do to_parquet)
+    PARQUET_DISPONIVEL = True
+except ImportError:
+    PARQUET_DISPONIVEL = False
+
+# Rótulo -> extensão do arquivo gerado
+FORMATOS_EXPORTACAO = {"Excel (.xlsx)": "xlsx", "CSV (.zip)": "csv"}
+if PARQUET_DISPONIVEL: FORMATOS_EXPORTACAO["Parquet (.zip)"] = "parquet"
+
+LIMITE_LINHAS_EXCEL = 1_048_575  # linhas por planilha, sem o cabeçalho
+LINHAS_POR_BLOCO = 10_000
+MAX_ARQUIVOS_CACHE = 4
+
+_lock = threading.Lock()
+
+
+def tabelas_relatorio(df_consolidado, dfs):
+    """Aba Consolidado + uma aba Orig_* por fonte com dados"""
+    tabelas = {"Consolidado": df_consolidado}
+    for chave, df in dfs.items():
+        if not df.empty: tabelas[f"Orig_{chave}"[:31]] = df
+    return tabelas
+
+
+def excede_limite_excel(tabelas):
+    return any(len(df) > LIMITE_LINHAS_EXCEL for df in tabelas.values())
+
+
+def impressao_tabelas(tabelas, formato):
+    """Hash do conteúdo (nomes, colunas, tipos e valores) de todas as tabelas"""
+    h = hashlib.sha256(formato.encode("utf-8"))
+    for nome, df in tabelas.items():
+        h.update(f"{nome}|{list(df.columns)}|{list(df.dtypes.astype(str))}".encode("utf-8"))
+        h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()[:32]
+
+
+def _linhas(df):
+    """Linhas como tuplas Python (vazios -> None), convertidas em blocos"""
+    for inicio in range(0, len(df), LINHAS_POR_BLOCO):
+        bloco = df.iloc[inicio:inicio + LINHAS_POR_BLOCO].astype(object)
+        yield from bloco.where(bloco.notna(), None).itertuples(index=False, name=None)
+
+
+def gravar_excel(tabelas, caminho):
+    opcoes = {"constant_memory": True, "strings_to_formulas": False, "strings_to_urls": False, "nan_inf_to_errors": True}
+    with xlsxwriter.Workbook(caminho, opcoes) as wb:
+        cabecalho = wb.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+        for nome, df in tabelas.items():
+            if len(df) > LIMITE_LINHAS_EXCEL: raise ValueError(f"'{nome}' tem {len(df)} linhas, acima do limite do Excel. Use Parquet ou CSV.")
+            ws = wb.add_worksheet(nome[:31])
+            ws.write_row(0, 0, [str(c) for c in df.columns], cabecalho)
+            for i, linha in enumerate(_linhas(df), start=1): ws.write_row(i, 0, linha)
+
+
+def gravar_zip(tabelas, caminho, formato):
+    """Um arquivo por tabela dentro do zip (CSV comprimido em fluxo; Parquet já vem comprimido)"""
+    with zipfile.ZipFile(caminho, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for nome, df in tabelas.items():
+            if formato == "parquet":
+                buffer = io.BytesIO()
+                df.to_parquet(buffer, index=False)
+                zf.writestr(f"{nome}.parquet", buffer.getvalue(), compress_type=zipfile.ZIP_STORED)
+            else:
+                with io.TextIOWrapper(zf.open(f"{nome}.csv", "w", force_zip64=True), encoding="utf-8-sig", newline="") as texto:
+                    df.to_csv(texto, index=False, chunksize=LINHAS_POR_BLOCO)
+
+
+def _despejar(pasta, manter):
+    """Mantém só os `manter` arquivos usados mais recentemente"""
+    caminhos = [os.path.join(pasta, n) for n in os.listdir(pasta) if not n.endswith(".tmp")]
+    for caminho in sorted(caminhos, key=os.path.getmtime, reverse=True)[manter:]:
+        try: os.remove(caminho)
+        except OSError: pass
+
+
+def exportar(tabelas, formato, pasta):
+    """Gera (ou reaproveita) o arquivo do relatório; retorna (caminho, reaproveitado)"""
+    os.makedirs(pasta, exist_ok=True)
+    caminho = os.path.join(pasta, f"relatorio_{impressao_tabelas(tabelas, formato)}.{'xlsx' if formato == 'xlsx' else 'zip'}")
+    with _lock:
+        if os.path.exists(caminho):
+            os.utime(caminho)
+            return caminho, True
+        temporario = f"{caminho}.{os.getpid()}.tmp"
+        try:
+            if formato == "xlsx": gravar_excel(tabelas, temporario)
+            else: gravar_zip(tabelas, temporario, formato)
+            os.replace(temporario, caminho)
+        finally:
+            if os.path.exists(temporario): os.remove(temporario)
+        _despejar(pasta, MAX_ARQUIVOS_CACHE)
+    return caminho, False
@@ -0,0 +1,442 @@
+import re
+import threading
+import time
+from io import BytesIO
+
+import pdfplumber
+
+try:
+    import pypdfium2 as pdfium  # dependência do pdfplumber (>= 0.11): texto nativo, sem análise de layout
+    PDFIUM_DISPONIVEL = True
+except ImportError:
+    PDFIUM_DISPONIVEL = False
+
+from classificador_folha import ITEM_CONTRATO, ITEM_TOTAIS, obter_classificador
+from construtor_colunar import (ESQUEMA_ASSISTENCIAL, ESQUEMA_EXTRAS, ESQUEMA_LIQUIDO, ConstrutorColunar,
+                                esquema_folha, montar_dataframe)
+from diagnostico import MedicaoArquivo, notificar_pagina, somar_metricas
+from identificador_regras import obter_identificador
+
+# --- EXTRATORES POR ARQUIVO ---
+# Funções puras (sem Streamlit): recebem nome + bytes do PDF e devolvem
+#   {"colunas": {coluna: [valores]}, "avisos": [...], "erro": str | None, "metricas": {...}}
+# Os valores vão direto para listas por coluna (construtor_colunar); a conversão de tipos
+# (moeda -> float, categóricos) é feita em bloco na montagem do DataFrame.
+# Ficam em módulo próprio para poderem rodar em processos separados (ProcessPoolExecutor)
+# e serem reaproveitadas fora da interface.
+
+# Versão da lógica de extração: incrementar ao alterar regex/parsers para invalidar o cache
+VERSAO_PARSER = "9"
+
+# --- LEITURA DAS PÁGINAS ---
+# O texto com layout do pdfplumber (o que os regex de linha esperam) é a parte mais cara do app.
+# Cada página passa antes por uma varredura do pdfium (texto nativo, dezenas de vezes mais rápida):
+# os metadados (CNPJ, Razão Social, tipo do documento) saem de uma faixa do topo da página e o
+# extrator só pede o texto completo das páginas com conteúdo de funcionário; capas, resumos e
+# páginas de totais são puladas. Sem pypdfium2, toda página é lida por inteiro como antes.
+
+FAIXA_CABECALHO_PT = 72  # altura (pontos) da faixa do topo analisada para os metadados
+_lock_pdfium = threading.Lock()  # o pdfium não é thread-safe (trabalhos em série rodam em threads)
+
+def contar_paginas(conteudo):
+    """Número de páginas do PDF (0 se não abrir: o extrator reporta o erro depois)"""
+    try:
+        if PDFIUM_DISPONIVEL:
+            with _lock_pdfium:
+                documento = pdfium.PdfDocument(conteudo)
+                try: return len(documento)
+                finally: documento.close()
+        with pdfplumber.open(BytesIO(conteudo)) as pdf: return len(pdf.pages)
+    except Exception:
+        return 0
+
+class Pagina:
+    """Uma página: faixa do cabeçalho e varredura rápida já lidas; o texto com layout é extraído sob demanda, uma única vez"""
+
+    def __init__(self, indice, pagina, cabecalho, rapido, medicao):
+        self.indice = indice
+        self._pagina = pagina
+        self._cabecalho, self._rapido = cabecalho, rapido
+        self._medicao = medicao
+        self._texto = None
+
+    def texto(self):
+        if self._texto is None:
+            inicio = time.perf_counter()
+            try:
+                self._texto = self._pagina.extract_text() or ""
+            finally:
+                self._pagina.close()  # libera o cache de layout (objetos do pdfminer) da página
+            if self._medicao: self._medicao.pagina_lida(self._texto, time.perf_counter() - inicio)
+        return self._texto
+
+    @property
+    def cabecalho(self):
+        return self.texto() if self._cabecalho is None else self._cabecalho
+
+    @property
+    def rapido(self):
+        """Texto da página inteira pela varredura rápida (serve para decidir se vale extrair o texto completo)"""
+        return self.texto() if self._rapido is None else self._rapido
+
+    def buscar(self, regex):
+        """Primeira correspondência na faixa do cabeçalho; senão, na página inteira (texto completo, se já lido)"""
+        return regex.search(self.cabecalho) or regex.search(self._texto if self._texto is not None else self.rapido)
+
+class LeitorPdf:
+    """PDF aberto no pdfplumber (texto com layout) e, se disponível, no pdfium (varredura rápida)"""
+
+    def __init__(self, conteudo):
+        self.pdf = pdfplumber.open(BytesIO(conteudo))
+        self.documento = None
+        if PDFIUM_DISPONIVEL:
+            with _lock_pdfium: self.documento = pdfium.PdfDocument(conteudo)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.pdf.close()
+        if self.documento is not None:
+            with _lock_pdfium: self.documento.close()
+
+    def _varrer(self, indice):
+        """(faixa do cabeçalho, página inteira) pelo pdfium"""
+        with _lock_pdfium:
+            pagina = self.documento[indice]
+            try:
+                texto = pagina.get_textpage()
+                largura, altura = pagina.get_size()
+                cabecalho = texto.get_text_bounded(0, altura - FAIXA_CABECALHO_PT, largura, altura)
+                rapido = texto.get_text_range()
+                texto.close()
+            finally:
+                pagina.close()
+        return cabecalho.replace("\r\n", "\n"), rapido.replace("\r\n", "\n")
+
+    def paginas(self, medicao=None, inicio=0, fim=None):
+        """Gera as Paginas [inicio, fim), uma por vez (a memória não cresce com o número de páginas).
+        O progresso (páginas lidas/total) vai para quem estiver acompanhando (fila de trabalhos)."""
+        paginas = self.pdf.pages[inicio:fim]
+        notificar_pagina(0, len(paginas))
+        for i, pagina in enumerate(paginas, start=inicio):
+            cabecalho = rapido = None
+            if self.documento is not None:
+                t0 = time.perf_counter()
+                cabecalho, rapido = self._varrer(i)
+                if medicao: medicao.pagina_varrida(time.perf_counter() - t0)
+            elif medicao:
+                medicao.pagina_varrida(0.0)
+            yield Pagina(i, pagina, cabecalho, rapido, medicao)
+            notificar_pagina(i + 1 - inicio, len(paginas))
+
+def identificar_regra(texto, df_regras):
+    """Nome Evento da regra de Texto Identificador mais longo presente no texto (None se nenhuma).
+    Uma passada pelo texto no autômato das regras, compilado uma vez por tabela (identificador_regras)."""
+    return obter_identificador(df_regras).identificar(texto)
+
+# --- 1. FUNÇÃO: EXTRAIR LÍQUIDO ---
+def extrair_liquidos_arquivo(nome_arquivo, conteudo, df_regras=None):
+    dados_extraidos = ConstrutorColunar(ESQUEMA_LIQUIDO)
+    padrao_liquido = re.compile(r'^\s*(\d+)\s+(.+?)\s+(\d{3}\.\d{3}\.\d{3}-\d{2})\s+(\d{2}/\d{2}/\d{4})\s+([\d\.,]+)')
+    regex_cpf = re.compile(r'\d{3}\.\d{3}\.\d{3}-\d{2}')
+    regex_cnpj_generico = re.compile(r'\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}')
+    erro = None
+    medicao = MedicaoArquivo()
+
+    try:
+        with LeitorPdf(conteudo) as leitor:
+            for pagina in leitor.paginas(medicao):
+                # Sem CPF a página não tem linha de funcionário (capa, resumo, totais)
+                if not regex_cpf.search(pagina.rapido): continue
+                texto = pagina.texto()
+                match_cnpj = pagina.buscar(regex_cnpj_generico)
+                cnpj_encontrado = match_cnpj.group(0) if match_cnpj else "Não Encontrado"
+                for linha in texto.split('\n'):
+                    match = padrao_liquido.search(linha)
+                    if match:
+                        codigo, nome, cpf, data, valor = match.groups()
+                        dados_extraidos.adicionar(cnpj_encontrado, codigo, nome.strip(), cpf, data, valor, nome_arquivo)
+                        medicao.correspondencias += 1
+    except Exception as e: erro = f"Erro {nome_arquivo}: {e}"
+    return {"colunas": dados_extraidos.colunas, "avisos": [], "erro": erro, "metricas": medicao.resumo(len(dados_extraidos))}
+
+# --- 2. FUNÇÃO: EXTRAIR ASSISTENCIAL ---
+def extrair_assistencial_arquivo(nome_arquivo, conteudo, df_regras=None):
+    dados_assistencial = ConstrutorColunar(ESQUEMA_ASSISTENCIAL)
+    regex_linha_nome = re.compile(r'Código:\s*(\d+)\s+Nome\s*:\s*(.+?)\s+Função\s*:\s*(.*)')
+    regex_linha_valores = re.compile(r'Admissão\s*:\s*(\d{2}/\d{2}/\d{4})\s*Salário\s*:\s*([,.\d]+)\s*Valor\s*:\s*([,.\d]+)')
+    regex_cnpj_generico = re.compile(r'\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}')
+    erro = None
+    medicao = MedicaoArquivo()
+
+    try:
+        with LeitorPdf(conteudo) as leitor:
+            for pagina in leitor.paginas(medicao):
+                if "Código:" not in pagina.rapido: continue
+                texto = pagina.texto()
+                match_cnpj = pagina.buscar(regex_cnpj_generico)
+                cnpj_encontrado = match_cnpj.group(0) if match_cnpj else "Não Encontrado"
+                linhas = texto.split('\n')
+                for i, linha in enumerate(linhas):
+                    if regex_linha_nome.search(linha):
+                        match_nome = regex_linha_nome.search(linha)
+                        if i + 1 < len(linhas):
+                            match_valores = regex_linha_valores.search(linhas[i+1])
+                            if match_valores:
+                                cod, nome, funcao = match_nome.groups()
+                                admissao, salario, valor_desc = match_valores.groups()
+                                dados_assistencial.adicionar(cnpj_encontrado, cod, nome.strip(), funcao.strip(),
+                                                             admissao, salario, valor_desc, nome_arquivo)
+                                medicao.correspondencias += 2
+    except Exception as e: erro = f"Erro {nome_arquivo}: {e}"
+    return {"colunas": dados_assistencial.colunas, "avisos": [], "erro": erro, "metricas": medicao.resumo(len(dados_assistencial))}
+
+# --- 3. FUNÇÃO: EXTRAIR EXTRAS ---
+def identificar_tipo_extra(texto_completo, df_regras):
+    return identificar_regra(texto_completo, df_regras) or "Outros Extras - Não Identificado"
+
+def identificar_tipo_extra_paginas(paginas, df_regras):
+    """Tipo do evento pelas faixas de cabeçalho das primeiras páginas; senão pelo texto completo delas"""
+    return (identificar_regra("".join(p.cabecalho for p in paginas), df_regras)
+            or identificar_tipo_extra("".join(p.texto() for p in paginas), df_regras))
+
+def extrair_extras_arquivo(nome_arquivo, conteudo, df_regras):
+    dados_extras = ConstrutorColunar(ESQUEMA_EXTRAS)
+    avisos = []
+    regex_linha = re.compile(r'^\s*(\d+)\s+(.+?)\s+([\d\.,]+)\s+([\d\.,]+)$')
+    regex_linha_alt = re.compile(r'^\s*(\d+)\s+(.+?)\s+([\d\.,]+)$') 
+    # Página sem valor monetário não tem linha de evento. Só o token: o texto do pdfium vem na ordem do
+    # conteúdo do PDF, que pode ser coluna a coluna, então a linha inteira não serve como filtro
+    regex_valor_rapido = re.compile(r'\d,\d{2}\b')
+    regex_cnpj_generico = re.compile(r'\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}')
+    erro = None
+    medicao = MedicaoArquivo()
+
+    try:
+        with LeitorPdf(conteudo) as leitor:
+            # Passada única: o tipo do evento vem das páginas 0-1, então os registros da
+            # página 0 ficam com tipo pendente (None) até a página 1 ser lida
+            primeiras = []
+            tipo_evento = None
+
+            for pagina in leitor.paginas(medicao):
+                if pagina.indice < 2: primeiras.append(pagina)
+                if pagina.indice == 1: tipo_evento = identificar_tipo_extra_paginas(primeiras, df_regras)
+
+                if not regex_valor_rapido.search(pagina.rapido): continue
+                texto = pagina.texto()
+                match_cnpj = pagina.buscar(regex_cnpj_generico)
+                cnpj_encontrado = match_cnpj.group(0) if match_cnpj else "Não Encontrado"
+                for linha in texto.split('\n'):
+                    match = regex_linha.search(linha)
+                    val_enc = None
+                    if match:
+                        cod, nome, _, val = match.groups()
+                        val_enc = val
+                    elif regex_linha_alt.search(linha):
+                        cod, nome, val = regex_linha_alt.search(linha).groups()
+                        val_enc = val
+                    
+                    if val_enc:
+                        dados_extras.adicionar(cnpj_encontrado, str(int(cod)), nome.strip(), tipo_evento, val_enc)
+                        medicao.correspondencias += 1
+
+            # Arquivo de uma página só: identifica ao final
+            if tipo_evento is None: tipo_evento = identificar_tipo_extra_paginas(primeiras, df_regras)
+            tipos = dados_extras.colunas["Tipo Evento"]
+            for i, tipo in enumerate(tipos):
+                if tipo is None: tipos[i] = tipo_evento
+                else: break
+
+            if tipo_evento == "Outros Extras - Não Identificado":
+                avisos.append(f"Extra não identificado em '{nome_arquivo}'. Verifique a aba Configurações.")
+    except Exception as e: erro = f"Erro {nome_arquivo}: {e}"
+    return {"colunas": dados_extras.colunas, "avisos": avisos, "erro": erro, "metricas": medicao.resumo(len(dados_extras))}
+
+# --- 4. FUNÇÃO: EXTRAIR FOLHA COMPLETA (ATUALIZADA) ---
+# A folha é lida em trechos de páginas (o arquivo inteiro é um trecho só, ou vários trechos em
+# processos diferentes para PDFs grandes). O bloco de um funcionário segue aberto de uma página
+# para a outra; entre trechos, juntar_trechos_folha costura o bloco aberto no fim de um trecho
+# com os itens do início do seguinte e leva Empresa/CNPJ/Tipo Folha adiante.
+
+def aplicar_item_folha(func_atual, k, valor):
+    """Lança um item no bloco do funcionário; retorna True quando a linha de totais fecha o bloco"""
+    if k == ITEM_CONTRATO:
+        # Dados Contratuais
+        func_atual["Admissão"], func_atual["Salário Base Contratual"] = valor
+    elif k == ITEM_TOTAIS:
+        # Totais / Fechamento
+        func_atual["Total Proventos"], func_atual["Total Descontos"], func_atual["Líquido a Receber"] = valor
+        return True
+    else:
+        # Itens Financeiros
+        func_atual[k] = valor
+    return False
+
+def extrair_folha_trecho(nome_arquivo, conteudo, df_regras_folha, df_itens=None, inicio=0, fim=None):
+    """Lê as páginas [inicio, fim) da folha. Além dos funcionários completos do trecho, devolve as bordas:
+    "cabeca" (itens antes do primeiro "Cód:", continuação do bloco do trecho anterior) e "aberto"
+    (bloco sem totais no fim). Empresa/CNPJ/Tipo Folha ainda desconhecidos no trecho ficam None."""
+
+    # Regex de Identificação do Funcionário (Mantido)
+    # O (?:Dep|$) no final ajuda a parar a captura antes da coluna de Departamento
+    regex_inicio = re.compile(r'Cód:\s*(\d+).*?Nome:\s*(.*?)\s+Função:(.*?)(?:Dep|Depto|$)') 
+    
+    # Regex de Cabeçalho (CNPJ e Razão Social)
+    regex_razao_social = re.compile(r'(?:Apelido:.*?|\s*)Razão Social:\s*(.*?)(?:\s+CNPJ/CEI:|\s+Pág:|\n|$)', re.IGNORECASE)
+    regex_cnpj_cei = re.compile(r'CNPJ/CEI:([\d\./\-]+)', re.IGNORECASE)
+    
+    # Contrato, itens financeiros e totais: uma varredura por linha (catálogo em config/itens_folha.csv)
+    classificador = obter_classificador(df_itens)
+    dados_folha = ConstrutorColunar(esquema_folha(classificador.nomes_itens))
+
+    cabeca = []        # [(item, valor)] antes do primeiro funcionário do trecho
+    func_atual = None  # None: nenhum funcionário iniciado no trecho; {}: bloco fechado
+    if inicio == 0:
+        empresa_nome, empresa_cnpj, tipo_folha = "Não Encontrado", "Não Encontrado", "Folha Geral"
+    else:
+        empresa_nome = empresa_cnpj = tipo_folha = None
+    erro = None
+    medicao = MedicaoArquivo()
+
+    try:
+        with LeitorPdf(conteudo) as leitor:
+            # Processamento Página a Página (cada página é extraída uma única vez)
+            for pagina in leitor.paginas(medicao, inicio, fim):
+                # Texto completo só com funcionário começando na página, bloco aberto vindo da anterior
+                # ou, no início de um trecho, possível continuação do trecho anterior. O texto rápido segue a
+                # ordem do conteúdo (rótulo e código podem vir separados): o filtro olha só o rótulo
+                if func_atual or (func_atual is None and inicio > 0) or 'Cód:' in pagina.rapido:
+                    texto = pagina.texto()
+                else:
+                    texto = ""
+
+                if pagina.indice == 0:
+                    # Leitura do Cabeçalho Global do Arquivo
+                    match_rz = pagina.buscar(regex_razao_social)
+                    if match_rz: empresa_nome = match_rz.group(1).strip()
+
+                    # Identificação do Tipo de Folha
+                    tipo_folha = (identificar_regra(pagina.cabecalho, df_regras_folha)
+                                  or identificar_regra(pagina.texto(), df_regras_folha) or tipo_folha)
+
+                # Atualiza CNPJ se mudar na página (comum em arquivos com múltiplas filiais)
+                match_cnpj_pag = pagina.buscar(regex_cnpj_cei)
+                if match_cnpj_pag: empresa_cnpj = match_cnpj_pag.group(1).strip()
+
+                for linha in texto.split('\n'):
+                    # 1. Tenta identificar Início de Funcionário
+                    match_inicio = regex_inicio.search(linha)
+                    if match_inicio:
+                        # Um bloco anterior ainda sem totais é descartado
+                        cod, nome, funcao = match_inicio.groups()
+                        medicao.correspondencias += 1
+                        func_atual = {
+                            "Empresa": empresa_nome, "Empresa CNPJ": empresa_cnpj, "Código": cod, 
+                            "Funcionário": nome.strip(), "Função": funcao.strip(), "Arquivo": nome_arquivo, "Tipo Folha": tipo_folha,
+                            "Total Proventos": "0,00", "Total Descontos": "0,00", "Líquido a Receber": "0,00"
+                        }
+                        # Inicializa colunas do map com 0,00
+                        for k in classificador.nomes_itens: func_atual[k] = "0,00"
+                        continue
+
+                    # 2. Antes do primeiro funcionário: pode ser continuação do trecho anterior
+                    if func_atual is None:
+                        cabeca.extend(classificador.classificar(linha))
+
+                    # 3. Se estamos dentro de um bloco de funcionário, busca os dados
+                    elif func_atual:
+                        itens = classificador.classificar(linha)
+                        medicao.correspondencias += len(itens)
+                        for k, valor in itens:
+                            if aplicar_item_folha(func_atual, k, valor):
+                                dados_folha.adicionar_registro(func_atual)
+                                func_atual = {} # Limpa para o próximo
+                            
+    except Exception as e: erro = f"Erro ao processar {nome_arquivo}: {e}"
+    return {"colunas": dados_folha.colunas, "cabeca": cabeca, "aberto": func_atual or None, "iniciou": func_atual is not None,
+            "empresa": empresa_nome, "cnpj_final": empresa_cnpj, "tipo_folha": tipo_folha,
+            "avisos": [], "erro": erro, "metricas": medicao.resumo(len(dados_folha))}
+
+def juntar_trechos_folha(nome_arquivo, trechos, df_itens=None):
+    """Costura os trechos (na ordem das páginas) no resultado do arquivo: fecha o bloco aberto de um trecho
+    com a cabeça do seguinte e preenche Empresa/Tipo Folha (página 0) e o CNPJ vigente no início de cada trecho"""
+    dados_folha = ConstrutorColunar(esquema_folha(obter_classificador(df_itens).nomes_itens))
+    # Trecho que falhou por inteiro (ver paralelo.executar_trecho) só traz "erro"
+    empresa, tipo_folha = trechos[0].get("empresa") or "Não Encontrado", trechos[0].get("tipo_folha") or "Folha Geral"
+    cnpj = "Não Encontrado"
+    aberto = None
+    correspondencias = 0
+
+    for trecho in trechos:
+        fixos = {"Empresa": empresa, "Tipo Folha": tipo_folha, "Empresa CNPJ": cnpj}
+        if trecho.get("erro") or "iniciou" not in trecho:
+            # Trecho com falha: faltam páginas, então nenhum bloco é costurado através dele
+            # (a cabeça do trecho seguinte é de outro funcionário)
+            aberto = None
+        else:
+            # Bloco que atravessou a quebra de trecho
+            if aberto is not None:
+                for k, valor in trecho["cabeca"]:
+                    correspondencias += 1
+                    if aplicar_item_folha(aberto, k, valor):
+                        dados_folha.adicionar_registro(aberto)
+                        aberto = None
+                        break
+            if trecho["iniciou"]: aberto = trecho["aberto"]
+            if aberto is not None:
+                for coluna, valor in fixos.items():
+                    if aberto[coluna] is None: aberto[coluna] = valor
+
+        for coluna, lista in trecho["colunas"].items():
+            if coluna in fixos and None in lista: lista = [fixos[coluna] if v is None else v for v in lista]
+            dados_folha.colunas[coluna].extend(lista)
+        cnpj = trecho.get("cnpj_final") or cnpj
+
+    erros = [t["erro"] for t in trechos if t["erro"]]
+    metricas = somar_metricas([t.get("metricas", {}) for t in trechos], len(dados_folha))
+    metricas["correspondencias"] += correspondencias
+    return {"colunas": dados_folha.colunas, "avisos": [a for t in trechos for a in t.get("avisos", [])],
+            "erro": "; ".join(erros) or None, "metricas": metricas}
+
+def extrair_folha_arquivo(nome_arquivo, conteudo, df_regras_folha, df_itens=None):
+    """Arquivo inteiro como um único trecho (em série)"""
+    return juntar_trechos_folha(nome_arquivo, [extrair_folha_trecho(nome_arquivo, conteudo, df_regras_folha, df_itens)], df_itens)
+
+# --- MONTAGEM DOS DATAFRAMES (colunas de todos os arquivos de uma categoria) ---
+def montar_df_liquidos(colunas, df_regras=None):
+    return montar_dataframe(colunas, ESQUEMA_LIQUIDO)
+
+def montar_df_assistencial(colunas, df_regras=None):
+    return montar_dataframe(colunas, ESQUEMA_ASSISTENCIAL)
+
+def montar_df_extras(colunas, df_regras):
+    df = montar_dataframe(colunas, ESQUEMA_EXTRAS)
+    if df.empty: return df
+    df_pivot = df.pivot_table(index=['Empresa CNPJ', 'Código', 'Funcionário'], columns='Tipo Evento', values='Valor', aggfunc='sum', fill_value=0.0).reset_index()
+    for col in df_regras['Nome Evento'].unique():
+        if col not in df_pivot.columns: df_pivot[col] = 0.0
+
+    cols_num = [c for c in df_pivot.columns if c not in ['Empresa CNPJ', 'Código', 'Funcionário']]
+    df_pivot['Total Extras'] = df_pivot[cols_num].sum(axis=1)
+    return df_pivot.astype({'Empresa CNPJ': 'category'})
+
+def montar_df_folha(colunas, df_regras=None):
+    # Itens do catálogo = colunas além das fixas (mesma ordem gravada pelo extrator)
+    fixas = esquema_folha([])
+    itens = [c for c in dict.fromkeys(c for cols in colunas for c in cols) if c not in fixas]
+    return montar_dataframe(colunas, esquema_folha(itens))
+
+# Extratores que podem dividir um arquivo por faixas de páginas: extrator -> (extrator do trecho, junção)
+EXTRATORES_POR_TRECHO = {
+    extrair_folha_arquivo: (extrair_folha_trecho, juntar_trechos_folha),
+}
+
+# Categoria -> (extrator por arquivo, montagem do DataFrame, usa regras da categoria?)
+EXTRATORES = {
+    "Folha": (extrair_folha_arquivo, montar_df_folha, True),
+    "Assistencial": (extrair_assistencial_arquivo, montar_df_assistencial, False),
+    "Liquido": (extrair_liquidos_arquivo, montar_df_liquidos, False),
+    "Extras": (extrair_extras_arquivo, montar_df_extras, True),
+}
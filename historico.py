@@ -0,0 +1,159 @@
+import os
+import sqlite3
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from consolidacao import normalizar_cnpj, normalizar_codigo
+
+# --- HISTÓRICO PERSISTENTE (SQLite em config/) ---
+# Cada competência gravada guarda as tabelas de origem e a consolidada em formato longo
+# (chaves + id da coluna + valor; só valores numéricos diferentes de zero), indexado por CNPJ,
+# competência, Tipo Folha e código do funcionário. A tabela resumo_mensal guarda os totais
+# por competência/fonte/CNPJ/Tipo Folha/coluna, então tendências de vários meses não
+# precisam reprocessar PDFs nem varrer os lançamentos.
+
+ESQUEMA_SQL = """
+CREATE TABLE IF NOT EXISTS cargas (
+    competencia TEXT NOT NULL, fonte TEXT NOT NULL, linhas INTEGER NOT NULL, gravado_em TEXT NOT NULL,
+    PRIMARY KEY (competencia, fonte)
+);
+CREATE TABLE IF NOT EXISTS colunas (id INTEGER PRIMARY KEY, nome TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS funcionarios (
+    cnpj TEXT NOT NULL, codigo INTEGER NOT NULL, nome TEXT, PRIMARY KEY (cnpj, codigo)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS lancamentos (
+    competencia TEXT NOT NULL, fonte TEXT NOT NULL, cnpj TEXT NOT NULL, tipo_folha TEXT NOT NULL,
+    codigo INTEGER NOT NULL, coluna_id INTEGER NOT NULL REFERENCES colunas (id), valor REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_lanc_competencia ON lancamentos (competencia, fonte, tipo_folha);
+CREATE INDEX IF NOT EXISTS ix_lanc_cnpj ON lancamentos (cnpj, competencia);
+CREATE INDEX IF NOT EXISTS ix_lanc_codigo ON lancamentos (codigo, competencia);
+CREATE TABLE IF NOT EXISTS resumo_mensal (
+    competencia TEXT NOT NULL, fonte TEXT NOT NULL, cnpj TEXT NOT NULL, tipo_folha TEXT NOT NULL,
+    coluna TEXT NOT NULL, total REAL NOT NULL, funcionarios INTEGER NOT NULL,
+    PRIMARY KEY (competencia, fonte, cnpj, tipo_folha, coluna)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_resumo_cnpj ON resumo_mensal (cnpj, competencia);
+"""
+
+
+def competencia_sugerida(dfs):
+    """AAAA-MM mais frequente nas datas de pagamento do Líquido; senão o mês atual"""
+    df_liq = dfs.get('Liquido')
+    if df_liq is not None and 'Data Pagto' in df_liq.columns:
+        datas = pd.to_datetime(df_liq['Data Pagto'], format="%d/%m/%Y", errors="coerce").dropna()
+        if not datas.empty: return datas.dt.strftime("%Y-%m").mode().iloc[0]
+    return datetime.now().strftime("%Y-%m")
+
+
+def _linhas(df, colunas):
+    """Tuplas para executemany (listas Python: iterar colunas de texto do pandas é lento)"""
+    return zip(*(df[c].tolist() for c in colunas))
+
+def formato_longo(df, competencia, fonte):
+    """Uma linha por (funcionário, tipo de folha, coluna numérica) com valor diferente de zero;
+    linhas repetidas da mesma chave (ex.: dois arquivos do mesmo tipo) são somadas"""
+    cols_num = [c for c in df.select_dtypes(include=['number']).columns if c != 'Código']
+    if df.empty or not cols_num: return pd.DataFrame()
+
+    valores = df[cols_num].to_numpy(dtype=float)
+    linha, coluna = np.nonzero(np.nan_to_num(valores))
+    tipo = df['Tipo Folha'].astype(str) if 'Tipo Folha' in df.columns else pd.Series("-", index=df.index)
+    nomes = df['Funcionário'].astype(str) if 'Funcionário' in df.columns else pd.Series("", index=df.index)
+    cnpj = normalizar_cnpj(df['Empresa CNPJ']) if 'Empresa CNPJ' in df.columns else pd.Series("", index=df.index)
+    longo = pd.DataFrame({
+        "competencia": competencia, "fonte": fonte,
+        "cnpj": cnpj.to_numpy(dtype=object)[linha], "tipo_folha": tipo.to_numpy(dtype=object)[linha],
+        "codigo": normalizar_codigo(df['Código']).to_numpy()[linha],
+        "funcionario": nomes.to_numpy(dtype=object)[linha],
+        "coluna": np.asarray(cols_num, dtype=object)[coluna], "valor": valores[linha, coluna],
+    })
+    chave = ["competencia", "fonte", "tipo_folha", "cnpj", "codigo", "coluna"]
+    if longo.duplicated(chave).any():
+        longo = longo.groupby(chave, as_index=False, sort=False).agg(funcionario=("funcionario", "first"), valor=("valor", "sum"))
+    return longo
+
+
+class Historico:
+    """Acesso ao arquivo SQLite (uma conexão por operação: seguro entre threads do Streamlit)"""
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+        con = self._conectar()
+        try: con.executescript(ESQUEMA_SQL)
+        finally: con.close()
+
+    def _conectar(self):
+        con = sqlite3.connect(self.caminho)
+        con.execute("PRAGMA journal_mode = WAL")
+        con.execute("PRAGMA synchronous = NORMAL")
+        return con
+
+    def _ids_colunas(self, con, nomes):
+        con.executemany("INSERT OR IGNORE INTO colunas (nome) VALUES (?)", [(n,) for n in nomes])
+        marcadores = ", ".join("?" * len(nomes))
+        return dict(con.execute(f"SELECT nome, id FROM colunas WHERE nome IN ({marcadores})", list(nomes)).fetchall())
+
+    def gravar(self, competencia, tabelas):
+        """Grava {fonte: DataFrame} da competência, substituindo o que já havia para a mesma competência/fonte"""
+        gravado_em = datetime.now().isoformat(timespec="seconds")
+        total = 0
+        con = self._conectar()
+        try:
+            with con:
+                for fonte, df in tabelas.items():
+                    if df is None or df.empty: continue
+                    con.execute("DELETE FROM lancamentos WHERE competencia = ? AND fonte = ?", (competencia, fonte))
+                    con.execute("DELETE FROM resumo_mensal WHERE competencia = ? AND fonte = ?", (competencia, fonte))
+                    longo = formato_longo(df, competencia, fonte)
+                    if not longo.empty:
+                        ids = self._ids_colunas(con, longo["coluna"].unique().tolist())
+                        longo["coluna"] = longo["coluna"].map(ids)
+                        pessoas = longo[["cnpj", "codigo", "funcionario"]].drop_duplicates(["cnpj", "codigo"])
+                        con.executemany("INSERT OR REPLACE INTO funcionarios VALUES (?, ?, ?)",
+                                        _linhas(pessoas, ["cnpj", "codigo", "funcionario"]))
+                        con.executemany("INSERT INTO lancamentos VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                        _linhas(longo, ["competencia", "fonte", "cnpj", "tipo_folha", "codigo", "coluna", "valor"]))
+                    con.execute("""
+                        INSERT INTO resumo_mensal
+                        SELECT l.competencia, l.fonte, l.cnpj, l.tipo_folha, c.nome, SUM(l.valor), COUNT(DISTINCT l.codigo)
+                        FROM lancamentos l JOIN colunas c ON c.id = l.coluna_id
+                        WHERE l.competencia = ? AND l.fonte = ?
+                        GROUP BY l.competencia, l.fonte, l.cnpj, l.tipo_folha, c.nome""", (competencia, fonte))
+                    con.execute("INSERT OR REPLACE INTO cargas VALUES (?, ?, ?, ?)", (competencia, fonte, len(df), gravado_em))
+                    total += len(longo)
+        finally:
+            con.close()
+        return total
+
+    def cargas(self):
+        con = self._conectar()
+        try: return pd.read_sql_query("SELECT * FROM cargas ORDER BY competencia, fonte", con)
+        finally: con.close()
+
+    def cnpjs(self, fonte="Consolidado"):
+        con = self._conectar()
+        try: return [r[0] for r in con.execute("SELECT DISTINCT cnpj FROM resumo_mensal WHERE fonte = ? ORDER BY cnpj", (fonte,))]
+        finally: con.close()
+
+    def tendencia(self, colunas, fonte="Consolidado", cnpj=None, tipo_folha=None, meses=24):
+        """Totais por competência (linhas) e coluna (colunas) das últimas `meses` competências, lidos do resumo"""
+        filtros, parametros = ["fonte = ?"], [fonte]
+        if cnpj is not None: filtros.append("cnpj = ?"); parametros.append(cnpj)
+        if tipo_folha is not None: filtros.append("tipo_folha = ?"); parametros.append(tipo_folha)
+        filtros.append(f"coluna IN ({', '.join('?' * len(colunas))})"); parametros.extend(colunas)
+        sql = f"""
+            SELECT competencia, coluna, SUM(total) AS total FROM resumo_mensal
+            WHERE {' AND '.join(filtros)} AND competencia IN (
+                SELECT DISTINCT competencia FROM resumo_mensal WHERE fonte = ? ORDER BY competencia DESC LIMIT ?)
+            GROUP BY competencia, coluna"""
+        con = self._conectar()
+        try: df = pd.read_sql_query(sql, con, params=parametros + [fonte, meses])
+        finally: con.close()
+        if df.empty: return pd.DataFrame(columns=["competencia"] + list(colunas))
+        df = df.pivot(index="competencia", columns="coluna", values="total").reindex(columns=colunas).fillna(0.0)
+        df.columns.name = None
+        return df.sort_index().reset_index()
@@ -0,0 +1,63 @@
+# --- IDENTIFICAÇÃO DO DOCUMENTO PELAS REGRAS (Texto Identificador -> Nome Evento) ---
+# Os textos identificadores de todas as regras são compilados uma vez num autômato
+# Aho-Corasick: uma única passada pelo texto encontra todas as ocorrências, em vez de uma
+# busca de substring por regra. Entre as regras encontradas vale o identificador mais longo
+# (o mais específico: "Folha de Pagamento - Adiantamento" vence "Folha de Pagamento");
+# empate de tamanho fica com a regra que vem antes na tabela.
+
+LIMITE_CACHE = 16
+
+
+class IdentificadorRegras:
+    """Autômato das regras de uma categoria (trie + ligações de falha)"""
+
+    def __init__(self, df_regras):
+        self._filhos = [{}]     # nó -> {caractere: nó}
+        self._falha = [0]
+        self._melhor = [None]   # nó -> (-tamanho, ordem, evento) da melhor regra que termina nele
+        for ordem, (texto, evento) in enumerate(zip(df_regras['Texto Identificador'], df_regras['Nome Evento'])):
+            texto = str(texto).strip()
+            if not texto: continue
+            no = 0
+            for caractere in texto:
+                if caractere not in self._filhos[no]:
+                    self._filhos.append({})
+                    self._falha.append(0)
+                    self._melhor.append(None)
+                    self._filhos[no][caractere] = len(self._filhos) - 1
+                no = self._filhos[no][caractere]
+            candidato = (-len(texto), ordem, evento)
+            if self._melhor[no] is None or candidato < self._melhor[no]: self._melhor[no] = candidato
+
+        # Ligações de falha em largura; cada nó herda a melhor saída dos sufixos (identificador contido no fim de outro)
+        fila = list(self._filhos[0].values())  # filhos da raiz falham para a raiz
+        for no in fila:
+            for caractere, filho in self._filhos[no].items():
+                falha = self._falha[no]
+                while falha and caractere not in self._filhos[falha]: falha = self._falha[falha]
+                self._falha[filho] = self._filhos[falha].get(caractere, 0)
+                herdado = self._melhor[self._falha[filho]]
+                if herdado is not None and (self._melhor[filho] is None or herdado < self._melhor[filho]):
+                    self._melhor[filho] = herdado
+                fila.append(filho)
+
+    def identificar(self, texto):
+        """Nome Evento da regra de identificador mais longo presente no texto (None se nenhuma)"""
+        filhos, falha, melhor = self._filhos, self._falha, self._melhor
+        no, achado = 0, None
+        for caractere in texto:
+            while no and caractere not in filhos[no]: no = falha[no]
+            no = filhos[no].get(caractere, 0)
+            if melhor[no] is not None and (achado is None or melhor[no] < achado): achado = melhor[no]
+        return achado[2] if achado else None
+
+
+_identificadores = {}
+
+def obter_identificador(df_regras):
+    """Autômato compilado uma vez por conteúdo da tabela de regras (por processo); editar as regras gera outro"""
+    chave = df_regras[['Texto Identificador', 'Nome Evento']].to_csv(index=False)
+    if chave not in _identificadores:
+        if len(_identificadores) >= LIMITE_CACHE: _identificadores.clear()
+        _identificadores[chave] = IdentificadorRegras(df_regras)
+    return _identificadores[chave]
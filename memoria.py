@@ -0,0 +1,89 @@
+import os
+import sys
+import threading
+
+# --- MEDIÇÃO DE MEMÓRIA (RSS) DO PROCESSO ---
+# Sem dependência obrigatória: usa psutil se instalado, /proc no Linux e a API do Windows via ctypes.
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def _rss_windows():
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+    contadores = PROCESS_MEMORY_COUNTERS()
+    contadores.cb = ctypes.sizeof(contadores)
+    processo = ctypes.windll.kernel32.GetCurrentProcess()
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(processo, ctypes.byref(contadores), contadores.cb): return None
+    return contadores.WorkingSetSize
+
+
+def rss_atual():
+    """Memória residente atual do processo em bytes (None se não for possível medir)"""
+    try:
+        if psutil is not None: return psutil.Process().memory_info().rss
+        if os.path.exists("/proc/self/statm"):
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        if sys.platform == "win32": return _rss_windows()
+    except Exception:
+        pass
+    return None
+
+
+class MonitorMemoria:
+    """Acompanha o pico de RSS por amostragem (ex.: após cada página processada)"""
+
+    def __init__(self):
+        self.inicial = rss_atual()
+        self.pico = self.inicial
+        self.amostras = 0
+
+    def amostrar(self):
+        self.amostras += 1
+        atual = rss_atual()
+        if atual is not None and (self.pico is None or atual > self.pico): self.pico = atual
+        return atual
+
+    @property
+    def pico_mb(self):
+        return None if self.pico is None else round(self.pico / 1024 / 1024, 1)
+
+
+class AmostradorMemoria(MonitorMemoria):
+    """Pico de RSS de um bloco `with`: uma thread amostra a cada `intervalo` segundos enquanto o bloco
+    está aberto (para etapas sem laço próprio onde amostrar, como consolidação e exportação)"""
+
+    def __init__(self, intervalo=0.05):
+        super().__init__()
+        self.intervalo = intervalo
+        self.final = None
+        self._parar = threading.Event()
+        self._thread = threading.Thread(target=self._rodar, name="amostrador-memoria", daemon=True)
+
+    def _rodar(self):
+        while not self._parar.wait(self.intervalo): self.amostrar()
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_):
+        self._parar.set()
+        self._thread.join()
+        self.final = self.amostrar()
+
+    @property
+    def final_mb(self):
+        return None if self.final is None else round(self.final / 1024 / 1024, 1)
@@ -0,0 +1,178 @@
+import atexit
+import math
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from concurrent.futures.process import BrokenProcessPool
+
+from cache_parse import impressao_regras
+from diagnostico import acompanhar
+from extratores import EXTRATORES_POR_TRECHO, VERSAO_PARSER, contar_paginas
+
+# --- EXTRAÇÃO PARALELA (UM ARQUIVO POR PROCESSO) ---
+# A leitura de PDF (pdfplumber + regex) é CPU-bound; com um pool de processos
+# cada arquivo roda em um núcleo. Os resultados voltam na ordem do upload.
+# Extratores com versão por trecho (EXTRATORES_POR_TRECHO, ex.: Folha) dividem um PDF grande
+# em faixas de páginas, uma por processo, e juntam os trechos ao final.
+
+PROCESSOS_PADRAO = os.cpu_count() or 1
+PAGINAS_MINIMAS_TRECHO = 25
+# Vigia: tarefa executando há mais que isso num processo do pool é dada como travada
+TEMPO_LIMITE_TAREFA_S = 30 * 60
+INTERVALO_VIGIA_S = 5
+
+# Processos do pool iniciados por "spawn": o pool recebe tarefas de várias threads (fila de
+# trabalhos, processar_lote) e um fork feito enquanto outra thread segura um lock de import
+# deixa o processo filho travado para sempre
+CONTEXTO_PROCESSOS = multiprocessing.get_context("spawn")
+
+_pool = None
+_pool_workers = 0
+_pool_em_uso = 0  # extrações com futuros no pool (os trabalhos da fila rodam ao mesmo tempo)
+_pool_travado = False  # algum processo não respondeu: o pool é trocado assim que ficar ocioso
+_lock = threading.Lock()
+
+
+@contextmanager
+def usar_pool(max_workers):
+    """Pool compartilhado entre reruns e trabalhos. Mudar o número de processos só recria o pool
+    quando nenhuma extração o está usando; até lá segue o pool atual (recriar cancelaria os
+    futuros dos outros trabalhos)."""
+    global _pool, _pool_workers, _pool_em_uso, _pool_travado
+    with _lock:
+        if _pool is None or ((_pool_workers != max_workers or _pool_travado) and _pool_em_uso == 0):
+            if _pool is not None: _descartar(_pool, terminar=_pool_travado)
+            _pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=CONTEXTO_PROCESSOS)
+            _pool_workers, _pool_travado = max_workers, False
+        pool = _pool
+        _pool_em_uso += 1
+    try:
+        yield pool
+    finally:
+        with _lock: _pool_em_uso -= 1
+
+
+def _descartar(pool, terminar=False):
+    """Encerra o pool; com `terminar`, mata também os processos (um processo travado não sai sozinho)"""
+    processos = list((getattr(pool, "_processes", None) or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    if terminar:
+        for processo in processos: processo.terminate()
+
+
+def encerrar_pool():
+    global _pool, _pool_workers
+    with _lock:
+        if _pool is not None: _pool.shutdown(wait=False, cancel_futures=True)
+        _pool, _pool_workers = None, 0
+
+atexit.register(encerrar_pool)
+
+
+def executar_tarefa(extrator, nome_arquivo, conteudo, df_regras=None, progresso=None, **parametros):
+    """Roda o extrator garantindo resultado estruturado mesmo em falha inesperada.
+    `progresso` (opcional, picklável) recebe (páginas lidas, total) e pode cancelar a extração."""
+    try:
+        with acompanhar(progresso):
+            return extrator(nome_arquivo, conteudo, df_regras, **parametros)
+    except Exception as e:
+        return {"colunas": {}, "avisos": [], "erro": f"Erro {nome_arquivo}: {e}"}
+
+
+def planejar_trechos(extrator, conteudo, max_workers):
+    """Faixas de páginas [(inicio, fim)] para dividir o PDF entre os processos; None = arquivo numa tarefa só"""
+    if max_workers <= 1 or extrator not in EXTRATORES_POR_TRECHO: return None
+    total = contar_paginas(conteudo)
+    tamanho = max(PAGINAS_MINIMAS_TRECHO, math.ceil(total / max_workers))
+    if total <= tamanho: return None
+    return [(inicio, min(inicio + tamanho, total)) for inicio in range(0, total, tamanho)]
+
+
+def executar_trecho(extrator_trecho, nome_arquivo, conteudo, df_regras, inicio, fim, progresso=None, **parametros):
+    """Como executar_tarefa, para as páginas [inicio, fim) de um arquivo"""
+    try:
+        with acompanhar(progresso):
+            return extrator_trecho(nome_arquivo, conteudo, df_regras, inicio=inicio, fim=fim, **parametros)
+    except Exception as e:
+        return {"colunas": {}, "avisos": [], "erro": f"Erro {nome_arquivo} (páginas {inicio + 1}-{fim}): {e}"}
+
+
+def _submeter(pool, extrator, tarefa, max_workers, acompanhamento, progresso, parametros):
+    """Futuro do arquivo inteiro, ou (junção, futuros dos trechos) se o arquivo for dividido"""
+    nome, conteudo, df_regras = tarefa
+    trechos = planejar_trechos(extrator, conteudo, max_workers)
+    if trechos is None:
+        return pool.submit(executar_tarefa, extrator, nome, conteudo, df_regras, progresso=acompanhamento, **parametros)
+
+    extrator_trecho, juntar = EXTRATORES_POR_TRECHO[extrator]
+    futuros = []
+    for inicio, fim in trechos:
+        a = progresso((nome, inicio)) if progresso else None
+        if a: a(0, fim - inicio)  # total do arquivo já conhecido antes de os trechos começarem
+        futuros.append(pool.submit(executar_trecho, extrator_trecho, nome, conteudo, df_regras, inicio, fim, progresso=a, **parametros))
+    return juntar, nome, futuros
+
+
+def _aguardar(futuro, descricao):
+    """Resultado do futuro, com vigia: executando há mais de TEMPO_LIMITE_TAREFA_S vira resultado com erro
+    (e o pool é trocado quando ficar ocioso), em vez de travar o lote ou o trabalho"""
+    global _pool_travado
+    executando_desde = None
+    while True:
+        try:
+            return futuro.result(timeout=INTERVALO_VIGIA_S)
+        except TimeoutError:
+            if not futuro.running(): continue
+            executando_desde = executando_desde or time.monotonic()
+            if time.monotonic() - executando_desde > TEMPO_LIMITE_TAREFA_S:
+                with _lock: _pool_travado = True
+                return {"colunas": {}, "avisos": [], "erro": f"Erro {descricao}: sem resposta após {TEMPO_LIMITE_TAREFA_S} s (processo travado)"}
+
+
+def _coletar(futuro, nome, parametros):
+    if not isinstance(futuro, tuple): return _aguardar(futuro, nome)
+    juntar, nome, futuros = futuro
+    return juntar(nome, [_aguardar(f, f"{nome} (trecho {i + 1})") for i, f in enumerate(futuros)], **parametros)
+
+
+def extrair_arquivos(extrator, tarefas, max_workers=PROCESSOS_PADRAO, progresso=None, **parametros):
+    """Executa o extrator sobre [(nome, conteudo, df_regras), ...]; `parametros` vão para todas as tarefas.
+    O extrator precisa ser função de módulo importável (ex.: extratores.extrair_folha_arquivo).
+    `progresso`: função nome -> acompanhamento do arquivo (ver executar_tarefa); nos trechos recebe (nome, página inicial)."""
+    if not tarefas: return []
+    acompanhamentos = [progresso(t[0]) if progresso else None for t in tarefas]
+    if max_workers <= 1:
+        return [executar_tarefa(extrator, *t, progresso=a, **parametros) for t, a in zip(tarefas, acompanhamentos)]
+
+    try:
+        with usar_pool(max_workers) as pool:
+            futuros = [_submeter(pool, extrator, t, max_workers, a, progresso, parametros) for t, a in zip(tarefas, acompanhamentos)]
+            return [_coletar(f, t[0], parametros) for f, t in zip(futuros, tarefas)]
+    except BrokenProcessPool:
+        # Um processo morreu (ex.: falta de memória): descarta o pool e segue em série
+        encerrar_pool()
+        return [executar_tarefa(extrator, *t, progresso=a, **parametros) for t, a in zip(tarefas, acompanhamentos)]
+
+
+def extrair_com_cache(cache, arquivos, tipo, extrator, df_regras=None, max_workers=PROCESSOS_PADRAO, progresso=None, **parametros):
+    """Extrai [(nome, conteudo), ...] reaproveitando o cache; só os arquivos ausentes vão para o pool.
+    Retorna (resultados na ordem recebida, posições que foram processadas agora)."""
+    regras = "|".join([impressao_regras(df_regras)] + [impressao_regras(v) for v in parametros.values()])
+    resultados = [None] * len(arquivos)
+    pendentes = []  # (posição, chave, nome, conteudo)
+    for i, (nome, conteudo) in enumerate(arquivos):
+        chave = cache.chave(conteudo, tipo, VERSAO_PARSER, regras) if cache else None
+        resultados[i] = cache.obter(chave) if cache else None
+        if resultados[i] is None: pendentes.append((i, chave, nome, conteudo))
+
+    novos = extrair_arquivos(extrator, [(nome, conteudo, df_regras) for _, _, nome, conteudo in pendentes], max_workers, progresso, **parametros)
+    for (i, chave, _, _), resultado in zip(pendentes, novos):
+        resultados[i] = resultado
+        # Resultado com erro não é guardado, para tentar de novo na próxima execução
+        if cache and not resultado["erro"]: cache.gravar(chave, resultado)
+
+    if cache: cache.despejar()
+    return resultados, {i for i, _, _, _ in pendentes}
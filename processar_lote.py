@@ -0,0 +1,121 @@
+"""Reprocessamento em lote da pasta de retenção, sem Streamlit.
+
+Percorre os uploads retidos em retencao/<AAAA-MM-DD>/<Categoria>/ (manifesto + blobs), extrai todas as categorias/arquivos em paralelo
+(mesmos extratores e cache do app), consolida cada data e grava as tabelas particionadas:
+
+    <saida>/<Tabela>/data=<AAAA-MM-DD>/cnpj=<só dígitos>/parte.parquet   (ou .csv)
+
+Uso:
+    python processar_lote.py --saida lote --formato parquet --processos 8
+    python processar_lote.py --desde 2024-01-01 --ate 2024-12-31 --formato csv
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from cache_parse import CacheParse
+from classificador_folha import carregar_itens_folha
+from configuracao import ARQUIVO_ITENS_FOLHA, ARQUIVO_REGRAS, PASTA_CACHE, PASTA_RETENCAO, ler_regras
+from consolidacao import consolidar
+from paralelo import PROCESSOS_PADRAO, encerrar_pool
+from retencao import listar_retencao
+from tarefas import processar_arquivos
+
+try:
+    import pyarrow  # noqa: F401 (engine do to_parquet)
+    FORMATO_PADRAO = "parquet"
+except ImportError:
+    FORMATO_PADRAO = "csv"
+
+
+def processar_categoria(arquivos_retidos, categoria, df_regras, df_itens, cache, n_processos):
+    """Extrai os PDFs de uma categoria e monta o DataFrame, como a aba correspondente do app"""
+    arquivos = []
+    for nome, caminho in arquivos_retidos:
+        with open(caminho, "rb") as f: arquivos.append((nome, f.read()))
+    r = processar_arquivos(arquivos, categoria, df_regras, df_itens, cache, n_processos)
+    return r["df"], r["processados"], r["avisos"], r["erros"]
+
+
+def chave_cnpj(df):
+    if 'Empresa CNPJ' not in df.columns: return pd.Series("sem_cnpj", index=df.index)
+    digitos = df['Empresa CNPJ'].astype(str).str.replace(r'\D', '', regex=True)
+    return digitos.mask(digitos == "", "sem_cnpj")
+
+
+def gravar_particionado(df, pasta_saida, tabela, data, formato):
+    """Grava uma tabela de uma data, um arquivo por CNPJ; retorna quantos arquivos foram escritos"""
+    if df is None or df.empty: return 0
+    gravados = 0
+    for cnpj, parte in df.groupby(chave_cnpj(df), sort=True):
+        pasta = os.path.join(pasta_saida, tabela, f"data={data}", f"cnpj={cnpj}")
+        os.makedirs(pasta, exist_ok=True)
+        if formato == "parquet":
+            parte.to_parquet(os.path.join(pasta, "parte.parquet"), index=False)
+        else:
+            parte.to_csv(os.path.join(pasta, "parte.csv"), index=False, encoding="utf-8-sig")
+        gravados += 1
+    return gravados
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reprocessa a pasta de retenção e grava saída colunar particionada.")
+    parser.add_argument("--retencao", default=PASTA_RETENCAO, help="Pasta de retenção (padrão: %(default)s)")
+    parser.add_argument("--saida", default="saida_lote", help="Pasta de saída (padrão: %(default)s)")
+    parser.add_argument("--formato", choices=["parquet", "csv"], default=FORMATO_PADRAO, help="Formato de saída (padrão: %(default)s)")
+    parser.add_argument("--processos", type=int, default=PROCESSOS_PADRAO, help="Processos de extração (padrão: %(default)s)")
+    parser.add_argument("--desde", help="Primeira data (AAAA-MM-DD) a processar")
+    parser.add_argument("--ate", help="Última data (AAAA-MM-DD) a processar")
+    parser.add_argument("--regras", default=ARQUIVO_REGRAS, help="CSV de regras (padrão: %(default)s)")
+    parser.add_argument("--sem-cache", action="store_true", help="Ignora o cache de extração")
+    args = parser.parse_args(argv)
+
+    if args.formato == "parquet" and FORMATO_PADRAO != "parquet":
+        parser.error("Saída parquet requer o pacote 'pyarrow' (pip install pyarrow) ou use --formato csv")
+
+    inicio = time.perf_counter()
+    df_regras = ler_regras(args.regras)
+    df_itens = carregar_itens_folha(ARQUIVO_ITENS_FOLHA)
+    cache = None if args.sem_cache else CacheParse(PASTA_CACHE)
+    lotes = listar_retencao(args.retencao, args.desde, args.ate)
+    if not lotes:
+        print(f"Nada a processar em '{args.retencao}'.")
+        return 0
+
+    # Todas as (data, categoria) em paralelo; cada uma envia seus arquivos ao mesmo pool de processos
+    grupos = [(data, categoria, arquivos) for data, cats in lotes.items() for categoria, arquivos in cats.items()]
+    dfs_por_data = {}
+    total_processados, total_erros = 0, 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(len(grupos), args.processos))) as executor:
+            futuros = {executor.submit(processar_categoria, arquivos, categoria, df_regras, df_itens, cache, args.processos): (data, categoria, arquivos)
+                       for data, categoria, arquivos in grupos}
+            for futuro, (data, categoria, arquivos) in futuros.items():
+                df, processados, avisos, erros = futuro.result()
+                dfs_por_data.setdefault(data, {})[categoria] = df
+                total_processados += processados
+                total_erros += len(erros)
+                for msg in avisos + erros: print(f"  [{data}/{categoria}] {msg}", file=sys.stderr)
+                print(f"{data} {categoria:<12} {len(arquivos):>4} arquivo(s) {len(df):>7} registro(s) ({processados} extraído(s), {len(arquivos) - processados} do cache)")
+    finally:
+        encerrar_pool()
+
+    arquivos_saida = 0
+    for data, dfs in sorted(dfs_por_data.items()):
+        for categoria, df in dfs.items():
+            arquivos_saida += gravar_particionado(df, args.saida, categoria, data, args.formato)
+        avisos = []
+        arquivos_saida += gravar_particionado(consolidar(dfs, avisos), args.saida, "Consolidado", data, args.formato)
+        for msg in avisos: print(f"  [{data}/Consolidado] {msg}", file=sys.stderr)
+
+    print(f"\n{len(grupos)} lote(s), {total_processados} PDF(s) extraído(s), {total_erros} erro(s), "
+          f"{arquivos_saida} arquivo(s) {args.formato} em '{args.saida}' em {time.perf_counter() - inicio:.1f}s")
+    return 1 if total_erros else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+import atexit
+import json
+import os
+import queue
+import re
+import threading
+from datetime import datetime
+
+from cache_parse import hash_conteudo
+from configuracao import CATEGORIAS
+
+# --- RETENÇÃO DOS UPLOADS (endereçada por conteúdo) ---
+# retencao/blobs/<2 primeiros>/<sha256>.pdf        conteúdo, gravado uma única vez
+# retencao/<AAAA-MM-DD>/<Categoria>/manifesto.jsonl  uma linha por upload retido (nome original + hash)
+# Arquivos com o mesmo nome e conteúdo diferente não se sobrescrevem, e o mesmo PDF enviado de novo
+# não é regravado. A escrita fica numa thread em segundo plano (fila limitada); um índice em memória
+# dos uploads já retidos faz os reruns do Streamlit não tocarem no disco.
+
+PASTA_BLOBS = "blobs"
+ARQUIVO_MANIFESTO = "manifesto.jsonl"
+TAMANHO_FILA = 8
+REGEX_DATA = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+
+def caminho_blob(pasta_retencao, sha):
+    return os.path.join(pasta_retencao, PASTA_BLOBS, sha[:2], sha + ".pdf")
+
+
+def ler_manifesto(pasta):
+    """Entradas do manifesto de uma pasta <data>/<categoria> (linhas corrompidas são ignoradas)"""
+    entradas = []
+    try:
+        with open(os.path.join(pasta, ARQUIVO_MANIFESTO), encoding="utf-8") as f:
+            for linha in f:
+                try: entradas.append(json.loads(linha))
+                except ValueError: continue
+    except OSError:
+        pass
+    return entradas
+
+
+def listar_retencao(pasta_retencao, desde=None, ate=None):
+    """{data: {categoria: [(nome, caminho do PDF)]}} a partir do manifesto de cada pasta.
+    PDFs soltos na pasta (retenção antiga, uma cópia por arquivo) também entram."""
+    lotes = {}
+    if not os.path.isdir(pasta_retencao): return lotes
+    for data in sorted(os.listdir(pasta_retencao)):
+        if not REGEX_DATA.match(data): continue
+        if (desde and data < desde) or (ate and data > ate): continue
+        for categoria in CATEGORIAS:
+            pasta = os.path.join(pasta_retencao, data, categoria)
+            if not os.path.isdir(pasta): continue
+            arquivos = [(n, os.path.join(pasta, n)) for n in sorted(os.listdir(pasta)) if n.lower().endswith(".pdf")]
+            vistos = set()
+            for entrada in ler_manifesto(pasta):
+                chave = (entrada["sha256"], entrada["arquivo"])
+                if chave in vistos: continue
+                vistos.add(chave)
+                arquivos.append((entrada["arquivo"], caminho_blob(pasta_retencao, entrada["sha256"])))
+            if arquivos: lotes.setdefault(data, {})[categoria] = arquivos
+    return lotes
+
+
+class ArmazemRetencao:
+    """Retém uploads em segundo plano; só o que ainda não foi retido vai para a fila de escrita"""
+
+    def __init__(self, pasta, tamanho_fila=TAMANHO_FILA):
+        self.pasta = pasta
+        self.erros = []
+        self._fila = queue.Queue(maxsize=tamanho_fila)
+        self._indice = {}      # (data, categoria) -> {(sha256, nome)} já no manifesto (ou na fila)
+        self._vistos = set()   # (data, categoria, id do upload) já tratados: rerun sem hash nem disco
+        self._lock = threading.Lock()
+        threading.Thread(target=self._escritor, name="retencao", daemon=True).start()
+        atexit.register(self.aguardar)
+
+    def _retidos(self, data, categoria):
+        if (data, categoria) not in self._indice:
+            entradas = ler_manifesto(os.path.join(self.pasta, data, categoria))
+            self._indice[(data, categoria)] = {(e["sha256"], e["arquivo"]) for e in entradas}
+        return self._indice[(data, categoria)]
+
+    def reter(self, arquivos, categoria, data=None):
+        """Enfileira os uploads ainda não retidos em <data>/<categoria>; retorna quantos entraram na fila.
+        `arquivos`: objetos com .name e .getvalue() (UploadedFile do Streamlit); o file_id, se houver,
+        identifica o upload sem precisar reler o conteúdo."""
+        data = data or datetime.now().strftime("%Y-%m-%d")
+        novos = 0
+        for arquivo in arquivos:
+            id_upload = getattr(arquivo, "file_id", None)
+            if id_upload and (data, categoria, id_upload) in self._vistos: continue
+            conteudo = arquivo.getvalue()
+            sha = hash_conteudo(conteudo)
+            with self._lock:
+                retidos = self._retidos(data, categoria)
+                if id_upload: self._vistos.add((data, categoria, id_upload))
+                if (sha, arquivo.name) in retidos: continue
+                retidos.add((sha, arquivo.name))
+            # Fila cheia: espera o escritor (memória limitada a TAMANHO_FILA arquivos pendentes)
+            self._fila.put((data, categoria, arquivo.name, sha, conteudo))
+            novos += 1
+        return novos
+
+    def _escritor(self):
+        while True:
+            data, categoria, nome, sha, conteudo = self._fila.get()
+            try:
+                self._gravar(data, categoria, nome, sha, conteudo)
+            except Exception as e:
+                # Sai do índice para ser tentado de novo no próximo rerun
+                with self._lock:
+                    self._retidos(data, categoria).discard((sha, nome))
+                    self._vistos.difference_update([v for v in self._vistos if v[:2] == (data, categoria)])
+                    self.erros.append(f"Erro na retenção de {nome}: {e}")
+            finally:
+                self._fila.task_done()
+
+    def _gravar(self, data, categoria, nome, sha, conteudo):
+        blob = caminho_blob(self.pasta, sha)
+        if not os.path.exists(blob):
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            temporario = f"{blob}.{os.getpid()}.tmp"
+            with open(temporario, "wb") as f: f.write(conteudo)
+            os.replace(temporario, blob)
+
+        pasta = os.path.join(self.pasta, data, categoria)
+        os.makedirs(pasta, exist_ok=True)
+        entrada = {"arquivo": nome, "sha256": sha, "bytes": len(conteudo), "retido_em": datetime.now().isoformat(timespec="seconds")}
+        with open(os.path.join(pasta, ARQUIVO_MANIFESTO), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entrada, ensure_ascii=False) + "\n")
+
+    def pendentes(self):
+        return self._fila.unfinished_tasks
+
+    def aguardar(self):
+        """Bloqueia até a fila esvaziar (usado no encerramento)"""
+        self._fila.join()
+
+    def coletar_erros(self):
+        with self._lock:
+            erros, self.erros = self.erros, []
+        return erros
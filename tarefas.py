@@ -0,0 +1,215 @@
+import atexit
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+from configuracao import CATEGORIAS, filtrar_regras
+from consolidacao import impressao_tabela
+from diagnostico import ExtracaoCancelada, encerrar_perfil, iniciar_perfil
+from extratores import EXTRATORES
+from paralelo import CONTEXTO_PROCESSOS, PROCESSOS_PADRAO, extrair_com_cache
+
+# --- FILA DE PROCESSAMENTO EM SEGUNDO PLANO ---
+# Cada upload vira um Trabalho executado numa thread (as quatro categorias podem rodar ao mesmo
+# tempo, todas enviando seus arquivos ao mesmo pool de processos). O progresso por arquivo
+# (páginas lidas/total) e o pedido de cancelamento atravessam os processos via Manager; com um
+# único processo bastam um dict e um Event comuns. Sem Streamlit: o app só lê o estado e recolhe
+# os resultados prontos.
+
+NA_FILA, EXECUTANDO, CONCLUIDO, CANCELADO, FALHOU = "Na fila", "Executando", "Concluído", "Cancelado", "Falhou"
+MAX_TRABALHOS_SIMULTANEOS = len(CATEGORIAS)
+TRABALHOS_GUARDADOS = 12
+
+_executor = ThreadPoolExecutor(max_workers=MAX_TRABALHOS_SIMULTANEOS, thread_name_prefix="trabalho")
+_gerenciador = None
+_lock_gerenciador = threading.Lock()
+
+
+def obter_gerenciador():
+    """Manager único (processo servidor), criado só quando há extração em vários processos.
+    Iniciado por spawn, como o pool: é criado com as threads dos trabalhos já rodando."""
+    global _gerenciador
+    with _lock_gerenciador:
+        if _gerenciador is None:
+            _gerenciador = CONTEXTO_PROCESSOS.Manager()
+            atexit.register(_gerenciador.shutdown)
+        return _gerenciador
+
+
+class ProgressoArquivo:
+    """Acompanhamento de um arquivo (picklável: vai junto da tarefa para o processo do pool)"""
+
+    def __init__(self, paginas, cancelado, nome):
+        self.paginas, self.cancelado, self.nome = paginas, cancelado, nome
+
+    def __call__(self, feitas, total):
+        self.paginas[self.nome] = (feitas, total)
+        return not self.cancelado.is_set()
+
+
+def linha_metricas(nome, origem, metricas):
+    return {"Arquivo": nome, "Origem": origem,
+            "Páginas": metricas.get("paginas"), "Puladas": metricas.get("paginas_puladas"), "Linhas": metricas.get("linhas"), "Registros": metricas.get("registros"),
+            "Correspondências": metricas.get("correspondencias"), "Texto (s)": metricas.get("tempo_texto_s"),
+            "Parse (s)": metricas.get("tempo_parse_s"), "Páginas/s": metricas.get("paginas_por_s"),
+            "Linhas/s": metricas.get("linhas_por_s"), "Pico RSS (MB)": metricas.get("pico_rss_mb"),
+            "Trechos": metricas.get("trechos", 1)}
+
+
+def processar_arquivos(arquivos, categoria, df_regras, df_itens=None, cache=None, n_processos=PROCESSOS_PADRAO,
+                       progresso=None, diagnostico=None):
+    """Extrai [(nome, conteudo)] de uma categoria (com cache) e monta o DataFrame.
+    Retorna dict com df, impressao (do conteúdo), avisos, erros, metricas (uma linha por arquivo),
+    processados e reaproveitados."""
+    extrator, montar, usa_regras = EXTRATORES[categoria]
+    regras_cat = filtrar_regras(df_regras, categoria) if usa_regras else None
+    parametros = {"df_itens": df_itens} if categoria == "Folha" else {}
+    medir = diagnostico.medir if diagnostico else (lambda *_: nullcontext({}))
+
+    with medir("Extração", categoria) as info:
+        resultados, processados = extrair_com_cache(cache, arquivos, categoria, extrator, regras_cat, n_processos, progresso, **parametros)
+        info.update({"Arquivos": len(arquivos), "Processados": len(processados)})
+
+    colunas, avisos, erros, metricas = [], [], [], []
+    for i, ((nome, _), resultado) in enumerate(zip(arquivos, resultados)):
+        avisos.extend(resultado["avisos"])
+        if resultado["erro"]: erros.append(resultado["erro"])
+        colunas.append(resultado["colunas"])
+        metricas.append(linha_metricas(nome, "Processado" if i in processados else "Cache", resultado.get("metricas", {})))
+
+    with medir("Montagem DataFrame", categoria) as info:
+        df = montar(colunas, regras_cat)
+        info["Linhas"] = len(df)
+    return {"df": df, "impressao": impressao_tabela(df), "avisos": avisos, "erros": erros, "metricas": metricas,
+            "processados": len(processados), "reaproveitados": len(resultados) - len(processados)}
+
+
+class Trabalho:
+    """Processamento de um upload (uma categoria); o estado é lido pela interface a cada rerun"""
+
+    def __init__(self, categoria, nomes, assinatura, paginas, cancelado):
+        self.id = uuid.uuid4().hex[:8]
+        self.categoria = categoria
+        self.nomes = nomes
+        self.assinatura = assinatura
+        self.status = NA_FILA
+        self.resultado = None
+        self.erro = None
+        self.perfil = None      # texto do cProfile do trabalho, quando pedido
+        self.entregue = False
+        self.criado_em = time.time()
+        self.fim = None
+        self._paginas = paginas
+        self._cancelado = cancelado
+
+    @property
+    def ativo(self):
+        return self.status in (NA_FILA, EXECUTANDO)
+
+    def cancelar(self):
+        """Pede o cancelamento; os arquivos em leitura param na próxima página"""
+        if self.ativo: self._cancelado.set()
+
+    def liberar(self):
+        """Solta o DataFrame e o perfil depois da entrega (o painel só precisa de status e metadados)"""
+        self.resultado = self.perfil = None
+
+    def progresso(self):
+        """[(nome, páginas lidas, total de páginas ou None)] na ordem do upload (trechos somados por arquivo)"""
+        paginas = {}
+        for chave, (feitas, total) in self._paginas.copy().items():  # uma única chamada ao Manager
+            nome = chave[0] if isinstance(chave, tuple) else chave
+            f, t = paginas.get(nome, (0, 0))
+            paginas[nome] = (f + feitas, t + total)
+        return [(nome, *paginas.get(nome, (0, None))) for nome in self.nomes]
+
+    def fracao(self):
+        feitas = total = 0
+        for _, f, t in self.progresso():
+            if t: feitas, total = feitas + f, total + t
+        if self.status == CONCLUIDO: return 1.0
+        return feitas / total if total else 0.0
+
+    def duracao(self):
+        return (self.fim or time.time()) - self.criado_em
+
+
+class FilaTrabalhos:
+    """Trabalhos de uma sessão: enfileira, acompanha, cancela e entrega os resultados prontos"""
+
+    def __init__(self):
+        self.trabalhos = []
+        self._lock = threading.Lock()
+
+    def enfileirar(self, categoria, arquivos, assinatura, df_regras, df_itens=None, cache=None,
+                   n_processos=PROCESSOS_PADRAO, diagnostico=None, perfilar=False):
+        """Novo trabalho para [(nome, conteudo)]; um trabalho ainda ativo da mesma categoria é cancelado (upload substituído).
+        Com `perfilar`, o cProfile roda na thread do trabalho (o perfil do script não enxerga outras threads)."""
+        for anterior in self.ativos(categoria): anterior.cancelar()
+        if n_processos > 1:
+            gerenciador = obter_gerenciador()
+            paginas, cancelado = gerenciador.dict(), gerenciador.Event()
+        else:
+            paginas, cancelado = {}, threading.Event()
+        trabalho = Trabalho(categoria, [nome for nome, _ in arquivos], assinatura, paginas, cancelado)
+        with self._lock:
+            self.trabalhos.append(trabalho)
+            # Descarta os mais antigos já entregues (só metadados: o resultado é liberado na entrega)
+            antigos = [t for t in self.trabalhos if t.entregue][:-TRABALHOS_GUARDADOS]
+            self.trabalhos = [t for t in self.trabalhos if t not in antigos]
+
+        def executar():
+            if cancelado.is_set():
+                trabalho.status, trabalho.fim = CANCELADO, time.time()
+                return
+            trabalho.status = EXECUTANDO
+            perfil = iniciar_perfil() if perfilar else None
+            try:
+                trabalho.resultado = processar_arquivos(
+                    arquivos, categoria, df_regras, df_itens, cache, n_processos,
+                    lambda nome: ProgressoArquivo(paginas, cancelado, nome), diagnostico)
+                trabalho.status = CONCLUIDO
+            except ExtracaoCancelada:
+                trabalho.status = CANCELADO
+            except Exception as e:
+                trabalho.erro = f"Erro no processamento de {categoria}: {e}"
+                trabalho.status = FALHOU
+            finally:
+                if perfil: trabalho.perfil = encerrar_perfil(perfil)
+                trabalho.fim = time.time()
+
+        _executor.submit(executar)
+        return trabalho
+
+    def ativos(self, categoria=None):
+        with self._lock:
+            return [t for t in self.trabalhos if t.ativo and categoria in (None, t.categoria)]
+
+    def ultima_assinatura(self, categoria):
+        """Assinatura (arquivos + regras) do último trabalho da categoria: evita reenfileirar no rerun"""
+        with self._lock:
+            for trabalho in reversed(self.trabalhos):
+                if trabalho.categoria == categoria: return trabalho.assinatura
+        return None
+
+    def prontos(self):
+        """Trabalhos terminados ainda não entregues à interface (marcados como entregues).
+        Só o último trabalho de cada categoria vale: um upload substituído não sobrescreve o novo
+        (e seu resultado é descartado). Quem recebe chama liberar() depois de guardar o resultado."""
+        with self._lock:
+            ultimos = {t.categoria: t for t in self.trabalhos}
+            prontos = [t for t in self.trabalhos if not t.ativo and not t.entregue]
+            for trabalho in prontos:
+                trabalho.entregue = True
+                if ultimos[trabalho.categoria] is not trabalho: trabalho.liberar()
+        return [t for t in prontos if ultimos[t.categoria] is t]
+
+    def ha_prontos(self):
+        with self._lock:
+            return any(not t.ativo and not t.entregue for t in self.trabalhos)
+
+    def recentes(self, limite=8):
+        with self._lock:
+            return list(reversed(self.trabalhos[-limite:]))
@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+
+from conciliacao import conciliar, conciliar_fontes
+
+
+def folha_dois_tipos():
+    """Mesmos funcionários no Adiantamento e na Folha Mensal"""
+    return pd.DataFrame({
+        "Empresa CNPJ": ["12.345.678/0001-90"] * 4, "Código": ["1", "2", "1", "2"], "Funcionário": ["A", "B", "A", "B"],
+        "Tipo Folha": ["Adiantamento", "Adiantamento", "Folha Mensal", "Folha Mensal"],
+        "Líquido a Receber": [400.0, 500.0, 1600.0, 1500.0],
+    })
+
+def liquido_mensal():
+    return pd.DataFrame({"Empresa CNPJ": ["12345678000190"] * 2, "Código": ["1", "2"], "Funcionário": ["A", "B"],
+                         "CPF": ["111", "222"], "Valor Líquido": [1600.0, 1510.0]})
+
+
+def test_concilia_por_tipo_folha():
+    tabelas = conciliar(folha_dois_tipos(), liquido_mensal(), "Líquido a Receber", "Valor Líquido", tipo_folha="Folha Mensal")
+    assert tabelas["Divergências"][["Código", "Diferença"]].values.tolist() == [[2, -10.0]]
+    assert tabelas["Só na Folha"].empty and tabelas["Só na Fonte"].empty
+
+def test_varios_tipos_exigem_tipo_folha():
+    # Somar Adiantamento + Mensal contra um único Valor Líquido faria todos divergirem
+    with pytest.raises(ValueError, match="Tipo Folha"):
+        conciliar_fontes({"Folha": folha_dois_tipos(), "Liquido": liquido_mensal()})
+
+def test_um_tipo_so_dispensa_escolha():
+    folha = folha_dois_tipos().query("`Tipo Folha` == 'Folha Mensal'")
+    resultado = conciliar_fontes({"Folha": folha, "Liquido": liquido_mensal()}, tolerancia=10.0)
+    assert len(resultado["Líquido"]["Tolerância"]) == 1 and resultado["Líquido"]["Divergências"].empty
@@ -0,0 +1,103 @@
+from classificador_folha import ITEM_TOTAIS, obter_classificador
+from configuracao import filtrar_regras, regras_padrao
+from construtor_colunar import ConstrutorColunar, esquema_folha
+from extratores import extrair_extras_arquivo, extrair_folha_arquivo, juntar_trechos_folha
+
+
+def pdf_celulas(celulas, altura=842):
+    """PDF de uma página com cada texto posicionado num objeto próprio, na ordem recebida [(x, y, texto)]"""
+    fluxo = "\n".join(f"BT /F1 8 Tf {x} {y} Td ({texto}) Tj ET" for x, y, texto in celulas).encode("latin1")
+    objetos = [b"<< /Type /Catalog /Pages 2 0 R >>", b"<< /Type /Pages /Kids [4 0 R] /Count 1 >>",
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+               b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 %d] /Resources << /Font << /F1 3 0 R >> >> /Contents 5 0 R >>" % altura,
+               b"<< /Length %d >>\nstream\n" % len(fluxo) + fluxo + b"\nendstream"]
+    saida, posicoes = bytearray(b"%PDF-1.4\n"), []
+    for i, objeto in enumerate(objetos, 1):
+        posicoes.append(len(saida))
+        saida += b"%d 0 obj\n" % i + objeto + b"\nendobj\n"
+    inicio_xref = len(saida)
+    saida += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objetos) + 1) + b"".join(b"%010d 00000 n \n" % p for p in posicoes)
+    saida += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objetos) + 1, inicio_xref)
+    return bytes(saida)
+
+
+# --- COSTURA DOS TRECHOS DA FOLHA (juntar_trechos_folha) ---
+def bloco(cod, nome, liquido=None):
+    """Funcionário como extrair_folha_trecho monta; com `liquido` o bloco já foi fechado pelos totais"""
+    func = {"Empresa": None, "Empresa CNPJ": None, "Código": cod, "Funcionário": nome, "Função": "AUX",
+            "Arquivo": "folha.pdf", "Tipo Folha": None,
+            "Total Proventos": "0,00", "Total Descontos": "0,00", "Líquido a Receber": "0,00"}
+    if liquido: func["Líquido a Receber"] = liquido
+    return func
+
+def trecho(completos=(), cabeca=(), aberto=None, iniciou=True, inicio=False):
+    dados = ConstrutorColunar(esquema_folha(obter_classificador(None).nomes_itens))
+    for func in completos: dados.adicionar_registro(func)
+    return {"colunas": dados.colunas, "cabeca": list(cabeca), "aberto": aberto, "iniciou": iniciou,
+            "empresa": "EMPRESA" if inicio else None, "cnpj_final": "12.345.678/0001-90", "tipo_folha": "Folha Mensal" if inicio else None,
+            "avisos": [], "erro": None, "metricas": {"paginas": 1}}
+
+def totais(liquido):
+    return (ITEM_TOTAIS, ("1.000,00", "0,00", liquido))
+
+def liquidos(resultado):
+    colunas = resultado["colunas"]
+    return list(zip(colunas["Funcionário"], colunas["Líquido a Receber"]))
+
+
+def test_costura_bloco_entre_dois_trechos():
+    trechos = [trecho([bloco("1", "A", "100,00")], aberto=bloco("2", "B"), inicio=True),
+               trecho([bloco("3", "C", "300,00")], cabeca=[totais("200,00")])]
+    resultado = juntar_trechos_folha("folha.pdf", trechos)
+    assert liquidos(resultado) == [("A", "100,00"), ("B", "200,00"), ("C", "300,00")]
+    assert set(resultado["colunas"]["Empresa"]) == {"EMPRESA"}
+    assert set(resultado["colunas"]["Tipo Folha"]) == {"Folha Mensal"}
+    assert resultado["erro"] is None
+
+def test_bloco_atravessa_mais_de_um_trecho():
+    # Trecho do meio só com continuação (nenhum "Cód:"): o bloco segue aberto até o terceiro
+    trechos = [trecho(aberto=bloco("1", "A"), inicio=True),
+               trecho(iniciou=False),
+               trecho([bloco("2", "B", "200,00")], cabeca=[totais("100,00")])]
+    assert liquidos(juntar_trechos_folha("folha.pdf", trechos)) == [("A", "100,00"), ("B", "200,00")]
+
+def test_trecho_com_falha_nao_costura_atraves_da_lacuna():
+    falha = {"colunas": {}, "avisos": [], "erro": "Erro folha.pdf (páginas 26-50): falhou"}
+    trechos = [trecho([bloco("1", "A", "100,00")], aberto=bloco("2", "B"), inicio=True),
+               falha,
+               trecho([bloco("4", "D", "400,00")], cabeca=[totais("9.999,00")])]
+    resultado = juntar_trechos_folha("folha.pdf", trechos)
+    # Os totais do início do terceiro trecho são de outro funcionário: B não recebe esses valores
+    assert liquidos(resultado) == [("A", "100,00"), ("D", "400,00")]
+    assert "páginas 26-50" in resultado["erro"]
+
+def test_folha_com_rotulo_e_codigo_em_objetos_separados():
+    # Os códigos são desenhados antes dos rótulos: no texto rápido "Cód:" não vem seguido do número
+    celulas = [(30, 800, "Razao Social: EMPRESA CNPJ/CEI:12.345.678/0001-90")]
+    celulas += [(60, 760 - 40 * i, cod) for i, cod in enumerate(["123", "456"])]
+    for i, nome in enumerate(["ANA SILVA", "BRUNO LIMA"]):
+        y = 760 - 40 * i
+        celulas += [(30, y, "Cód:"), (90, y, f"Nome: {nome}"), (250, y, "Função: AUX"),
+                    (30, y - 12, f"Proventos: 1.000,00 Descontos: 100,00 Liquido: 90{i},00")]
+    resultado = extrair_folha_arquivo("folha.pdf", pdf_celulas(celulas), filtrar_regras(regras_padrao(), "Folha"))
+    assert resultado["erro"] is None
+    assert resultado["colunas"]["Código"] == ["123", "456"]
+    assert liquidos(resultado) == [("ANA SILVA", "900,00"), ("BRUNO LIMA", "901,00")]
+    assert resultado["metricas"]["paginas_puladas"] == 0
+
+
+# --- EXTRAS ---
+def test_extras_com_celulas_desenhadas_coluna_a_coluna():
+    # O texto rápido (ordem do conteúdo) sai coluna a coluna, valores antes dos nomes; o filtro de
+    # página não pode depender da linha inteira
+    nomes = ["ANA SILVA", "BRUNO LIMA", "CARLA COSTA", "DIEGO SOUZA", "ELAINE GOMES",
+             "FABIO ALVES", "GISELE MOTA", "HUGO PIRES", "IARA ROCHA", "JOAO MELO"]
+    linhas = [(f"{i} {nome}", "10,00", f"{i}5,50") for i, nome in enumerate(nomes, 1)]
+    celulas = [(30, 800, "Relacao de Eventos: 17 - Horas Extras 50%"), (30, 785, "EMPRESA 12.345.678/0001-90 Pag: 1")]
+    for coluna, x in [(1, 300), (2, 400), (0, 30)]:
+        celulas += [(x, 760 - 12 * i, linha[coluna]) for i, linha in enumerate(linhas)]
+    resultado = extrair_extras_arquivo("extras.pdf", pdf_celulas(celulas), filtrar_regras(regras_padrao(), "Extras"))
+    assert resultado["erro"] is None
+    assert resultado["colunas"]["Código"] == [str(i) for i in range(1, 11)]
+    assert set(resultado["colunas"]["Tipo Evento"]) == {"Horas Extras 50%"}
+    assert resultado["metricas"]["paginas_puladas"] == 0
@@ -0,0 +1,29 @@
+import time
+
+from configuracao import regras_padrao
+from tarefas import CONCLUIDO, FilaTrabalhos
+from test_extratores import pdf_celulas
+
+
+def pdf_extras(nomes):
+    celulas = [(30, 800, "Relacao de Eventos: 17 - Horas Extras 50%"), (30, 785, "EMPRESA 12.345.678/0001-90 Pag: 1")]
+    celulas += [(30, 760 - 12 * i, f"{i} {nome} 10,00 {i}5,50") for i, nome in enumerate(nomes, 1)]
+    return pdf_celulas(celulas)
+
+
+# --- TRABALHOS SIMULTÂNEOS NO POOL DE PROCESSOS ---
+def test_dois_trabalhos_ao_mesmo_tempo_em_varios_processos():
+    # Duas sessões enviando ao mesmo pool (e ao mesmo Manager) a partir das threads dos trabalhos
+    filas = [FilaTrabalhos(), FilaTrabalhos()]
+    arquivos = [[(f"extras_{i}_{j}.pdf", pdf_extras(["ANA SILVA", "BRUNO LIMA", "CARLA COSTA"][:j + 1])) for j in range(3)]
+                for i in range(2)]
+    trabalhos = [fila.enfileirar("Extras", arqs, (i,), regras_padrao(), n_processos=2)
+                 for i, (fila, arqs) in enumerate(zip(filas, arquivos))]
+    limite = time.time() + 120
+    while any(fila.ativos() for fila in filas) and time.time() < limite: time.sleep(0.1)
+
+    for trabalho in trabalhos:
+        assert trabalho.status == CONCLUIDO, trabalho.erro
+        assert trabalho.resultado["erros"] == []
+        assert len(trabalho.resultado["df"]) == 3  # uma linha por funcionário, somando os arquivos
+        assert trabalho.progresso() == [(nome, 1, 1) for nome in trabalho.nomes]